@@ -1,10 +1,34 @@
 """
 Step Into My Shoes - Game Engine
 Core engine components for the career simulation game.
+
+The story generator and world base class are imported on first attribute
+access, so the main menu can come up without them.
 """
 
-from engine.core import SceneManager
+import importlib
+
+from engine import bootstrap  # first, so startup timing covers importing pygame
+from engine.core import Scene, SceneManager
+from engine.clock import RealClock, VirtualClock
 from engine.colors import *
-from engine.ui import Button, ModernButton, CareerCard, draw_text, draw_wrapped_text
-from engine.backstory_ai import generate_backstory
-from engine.world import BaseWorld
+from engine.ui import (
+    Button, ModernButton, CareerCard, WidgetPool, TimeSeriesChart, ECGMonitor,
+    draw_text, draw_wrapped_text, render_text
+)
+from engine.preload import Preloader
+from engine.jobs import JobSystem
+
+_LAZY = {
+    'generate_backstory': 'engine.backstory_ai',
+    'BaseWorld': 'engine.world',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,61 @@
+"""
+Step Into My Shoes - asyncio Engine Loop
+Drives a SceneManager from an asyncio event loop instead of run().
+
+Each frame runs the same SceneManager.frame() as the synchronous loop;
+between frames the loop awaits, so tasks a scene started (network
+requests, file reads, anything with `await`) make progress while the game
+waits for the next frame:
+
+    async def fetch_leaderboard(scene):
+        scene.scores = await load_scores()
+
+    asyncio.get_running_loop().create_task(fetch_leaderboard(self))
+
+    asyncio.run(aio.run(scene_manager))
+
+Frames are paced against fixed deadlines rather than by sleeping a frame's
+worth after each one: most of the wait is an asyncio.sleep(), and the last
+couple of milliseconds are spent yielding with sleep(0) until the deadline,
+since the event loop's timers are only accurate to about a millisecond.
+Keep scene callbacks short; a task that blocks delays the next frame.
+"""
+
+import asyncio
+import time
+from engine.clock import RealClock
+
+# Time before a frame deadline spent yielding instead of sleeping
+SPIN_MS = 2.0
+
+
+async def run(manager, spin_ms=SPIN_MS):
+    """Run `manager` until its stack is empty or quit() is called."""
+    manager.start()
+    clock = manager.clock
+    paced = manager.fps and isinstance(clock, RealClock)
+    interval = 1.0 / manager.fps if manager.fps else 0.0
+    spin = spin_ms / 1000.0
+    deadline = time.perf_counter() + interval
+
+    while manager.running and manager.stack:
+        if paced:
+            await wait_until(deadline, spin)
+            # Fell more than a frame behind: start counting again from now
+            # rather than rushing frames out to catch up
+            now = time.perf_counter()
+            deadline = max(deadline + interval, now)
+            elapsed = clock.tick()
+        else:
+            await asyncio.sleep(0)
+            elapsed = clock.tick(manager.fps)
+        manager.frame(elapsed)
+
+
+async def wait_until(deadline, spin=SPIN_MS / 1000.0):
+    """Yield to the event loop until perf_counter() reaches `deadline`."""
+    remaining = deadline - time.perf_counter()
+    if remaining > spin:
+        await asyncio.sleep(remaining - spin)
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(0)
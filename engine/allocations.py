@@ -0,0 +1,140 @@
+"""
+Step Into My Shoes - Allocation Profiler
+Developer tool: where memory is allocated, per scene and per world state.
+
+With the profiler attached, tracemalloc runs for the whole session. At
+every scene change and world state change it prints:
+
+- how much the frames since the last transition allocated: bytes traced
+  at each frame's peak above where the frame started (temporaries
+  included), and how many live blocks each frame left behind (the net
+  change in sys.getallocatedblocks, so allocations minus frees, not a
+  count of allocations);
+- the source lines whose live allocations grew the most since the last
+  transition.
+
+A draw method that creates a Surface or font every frame shows up as a
+high per-frame figure for that screen, and its line shows up among the
+growing sites if the objects are kept. tracemalloc slows everything down
+noticeably, so this is only for development (main.py --profile-allocations).
+Needs Python 3.9 or later (tracemalloc.reset_peak).
+
+Only Python allocations are traced; pixel memory SDL allocates for a
+Surface is not, but the Surface object itself is.
+"""
+
+import sys
+import tracemalloc
+from engine import states
+
+# Source lines listed per transition
+TOP_SITES = 8
+# Stack frames recorded per allocation (1 = the allocating line)
+TRACE_FRAMES = 1
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _kb(size):
+    return f"{size / 1024:.1f} KB"
+
+
+def describe(scene):
+    """'DoctorWorld:gameplay' for worlds, the class name for other scenes."""
+    if scene is None:
+        return "-"
+    name = type(scene).__name__
+    machine = getattr(scene, "states", None)
+    if isinstance(machine, states.StateMachine):
+        name = f"{name}:{machine.name}"
+    return name
+
+
+class AllocationProfiler:
+    """Snapshots allocations at transitions and measures them per frame."""
+
+    def __init__(self, top=TOP_SITES, frames=TRACE_FRAMES, out=None):
+        self.top = top
+        self.trace_frames = frames
+        self.out = out or sys.stdout
+        self.scene_manager = None
+        self.snapshot = None
+        self.section = "-"     # scene (and state) the current figures belong to
+        self.frames = 0
+        self.frame_bytes = 0   # summed per-frame peaks over the frame start
+        self.net_blocks = 0    # summed net change in live blocks
+        self._frame_start = 0
+        self._blocks = 0
+        self._started_tracing = False
+
+    def attach(self, scene_manager):
+        """Start tracing and report on this manager's transitions."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracing = True
+        self.scene_manager = scene_manager
+        scene_manager.transition_hooks.append(self.on_scene_change)
+        scene_manager.frame_hooks.append(self.on_frame)
+        states.transition_hooks.append(self.on_state_change)
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self._begin(describe(scene_manager.current_scene))
+
+    def detach(self):
+        self.scene_manager.transition_hooks.remove(self.on_scene_change)
+        self.scene_manager.frame_hooks.remove(self.on_frame)
+        states.transition_hooks.remove(self.on_state_change)
+        # Leave tracing on if someone else started it
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def on_frame(self, scene_manager, stats):
+        peak = tracemalloc.get_traced_memory()[1]
+        blocks = sys.getallocatedblocks()
+        self.frames += 1
+        self.frame_bytes += max(0, peak - self._frame_start)
+        self.net_blocks += blocks - self._blocks
+        self._start_frame()
+
+    def on_scene_change(self, scene_manager):
+        self.transition(describe(scene_manager.current_scene))
+
+    def on_state_change(self, machine, previous, name):
+        if self.scene_manager is not None and machine.owner is self.scene_manager.current_scene:
+            self.transition(describe(machine.owner))
+
+    def transition(self, section):
+        """Report on the section that just ended and start measuring `section`."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        lines = [f"[alloc] {self.section} -> {section}"]
+        if self.frames:
+            lines.append(f"  {self.frames} frames: {_kb(self.frame_bytes / self.frames)} "
+                         f"allocated/frame, {self.net_blocks / self.frames:+.1f} net live "
+                         f"blocks/frame")
+        if self.snapshot is not None:
+            grown = [stat for stat in snapshot.compare_to(self.snapshot, "lineno")
+                     if stat.size_diff > 0][:self.top]
+            for stat in grown:
+                frame = stat.traceback[0]
+                lines.append(f"  +{_kb(stat.size_diff):>10} {stat.count_diff:+6d} blocks  "
+                             f"{frame.filename}:{frame.lineno}")
+        print("\n".join(lines), file=self.out)
+        self.snapshot = snapshot
+        self._begin(section)
+
+    def _begin(self, section):
+        self.section = section
+        self.frames = 0
+        self.frame_bytes = 0
+        self.net_blocks = 0
+        self._start_frame()
+
+    def _start_frame(self):
+        tracemalloc.reset_peak()
+        self._frame_start = tracemalloc.get_traced_memory()[0]
+        self._blocks = sys.getallocatedblocks()
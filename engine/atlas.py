@@ -0,0 +1,154 @@
+"""
+Step Into My Shoes - UI Atlas
+Static UI text baked offline into one packed image, loaded with one read.
+
+`bake()` builds and draws the screens it is given while recording every
+string they render through render_text, packs those surfaces into a single
+atlas image and writes it as a PNG, next to a JSON index mapping each
+render_text key to its rectangle. At startup `load()` reads the bundle and
+render_text serves those strings from it instead of rasterizing them, so
+the first frame costs the same however many static strings a screen has.
+
+    python main.py --bake-atlas
+
+Fonts differ between machines, so the index records the pygame version
+and the font files it was baked with; a bundle that doesn't match them is
+ignored until it is baked again.
+"""
+
+import json
+import os
+import pygame
+from engine import cache
+from engine import ui
+from engine.layout import DESIGN_SIZE
+
+ATLAS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+ATLAS_NAME = "ui_atlas"
+
+# Atlas width in pixels; rows of strings are stacked as high as needed
+ATLAS_WIDTH = 1024
+# Transparent gap between packed strings, so filtering never bleeds across
+PADDING = 1
+
+
+def _paths(directory):
+    base = os.path.join(directory or ATLAS_DIR, ATLAS_NAME)
+    return base + ".png", base + ".json"
+
+
+def font_signature(keys):
+    """The font file behind each (font name, bold) pair the keys use."""
+    signature = {}
+    for _, _, _, font_name, bold in keys:
+        name = f"{font_name}{' bold' if bold else ''}"
+        if name not in signature:
+            path = pygame.font.match_font(font_name, bold=bold)
+            signature[name] = os.path.basename(path) if path else None
+    return signature
+
+
+def record(screens):
+    """Build and draw each screen; return the render_text keys they used.
+
+    `screens` are callables returning a Scene. Text already in the cache
+    would not be recorded, so the cache is emptied first.
+    """
+    ui._TEXT_CACHE.clear()
+    keys = set()
+    surface = pygame.Surface(DESIGN_SIZE)
+    ui._text_recorder = keys
+    try:
+        for make in screens:
+            make().draw(surface)
+    finally:
+        ui._text_recorder = None
+    return keys
+
+
+def pack(sizes, width=ATLAS_WIDTH):
+    """Shelf-pack `sizes` ({key: (w, h)}); return ({key: (x, y)}, (w, h)).
+
+    Tallest strings first, left to right in rows.
+    """
+    width = max([width] + [w + PADDING for w, _ in sizes.values()])
+    positions = {}
+    x = y = row_height = 0
+    for key in sorted(sizes, key=lambda key: sizes[key][1], reverse=True):
+        w, h = sizes[key]
+        if x + w > width:
+            x, y = 0, y + row_height + PADDING
+            row_height = 0
+        positions[key] = (x, y)
+        x += w + PADDING
+        row_height = max(row_height, h)
+    return positions, (width, y + row_height)
+
+
+def bake(screens, directory=None):
+    """Record the text `screens` render and write the atlas bundle.
+
+    Returns the number of strings baked.
+    """
+    keys = record(screens)
+    surfaces = {key: ui.get_font(key[3], key[1], key[4]).render(key[0], True, key[2])
+                for key in keys if key[0]}
+    positions, size = pack({key: surf.get_size() for key, surf in surfaces.items()})
+
+    atlas = pygame.Surface((max(size[0], 1), max(size[1], 1)), pygame.SRCALPHA)
+    entries = []
+    for key, surf in surfaces.items():
+        x, y = positions[key]
+        atlas.blit(surf, (x, y))
+        text, font_size, color, font_name, bold = key
+        entries.append([text, font_size, list(color), font_name, bold,
+                        x, y, surf.get_width(), surf.get_height()])
+
+    image_path, index_path = _paths(directory)
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    pygame.image.save(atlas, image_path)
+    index = {
+        "pygame": pygame.version.ver,
+        "fonts": font_signature(surfaces),
+        "entries": entries,
+    }
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    return len(entries)
+
+
+def load(directory=None):
+    """Serve render_text from the baked bundle, if there is a current one.
+
+    Returns the number of strings loaded (0 without a usable bundle).
+    """
+    image_path, index_path = _paths(directory)
+    if not os.path.exists(index_path):
+        return 0
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        entries = [((text, font_size, tuple(color), font_name, bold), (x, y, w, h))
+                   for text, font_size, color, font_name, bold, x, y, w, h in index["entries"]]
+        current = (index["pygame"] == pygame.version.ver
+                   and index["fonts"] == font_signature(key for key, _ in entries))
+        if current:
+            atlas = pygame.image.load(image_path)
+            rects = [pygame.Rect(rect) for _, rect in entries]
+            if not all(atlas.get_rect().contains(rect) for rect in rects):
+                raise ValueError("entry outside the atlas image")
+    except (OSError, ValueError, KeyError, TypeError, pygame.error) as e:
+        print(f"UI atlas is unreadable ({e}); rebuild it with: python main.py --bake-atlas")
+        return 0
+    if not current:
+        print("UI atlas is out of date; rebuild it with: python main.py --bake-atlas")
+        return 0
+
+    if pygame.display.get_surface() is not None:
+        atlas = atlas.convert_alpha()
+    # Text cache entries are subsurfaces of the atlas; the atlas itself is
+    # counted once, for as long as it is loaded
+    cache.manager.reserve("atlas", cache.surface_bytes(atlas))
+    for key, rect in entries:
+        ui._ATLAS[key] = atlas.subsurface(rect)
+    return len(entries)
@@ -0,0 +1,103 @@
+"""
+Step Into My Shoes - Bootstrap
+Selective, idempotent pygame initialization with a startup trace.
+
+pygame.init() starts every subsystem (audio, joystick, ...); the game only
+needs the display and fonts. `require()` starts exactly the subsystems
+asked for, once, the first time any code needs them.
+"""
+
+import time
+
+# Roughly process start: the engine package imports this module before
+# anything else, so the time spent importing pygame is included
+PROCESS_START = time.perf_counter()
+
+import pygame
+
+_INITIALIZERS = {
+    "display": pygame.display.init,
+    "font": pygame.font.init,
+    "mixer": pygame.mixer.init,
+}
+
+_ready = set()
+
+# (label, start offset ms, duration ms) in the order things happened
+_trace = []
+
+
+def require(*subsystems):
+    """Initialize the named subsystems if they aren't running yet."""
+    for name in subsystems:
+        if name in _ready:
+            continue
+        start = time.perf_counter()
+        _INITIALIZERS[name]()
+        _ready.add(name)
+        _record(f"init {name}", start)
+
+
+def init(mixer=False):
+    """Start the subsystems the game needs; audio only if asked for.
+
+    A missing audio device is not fatal: the game simply runs silent.
+    """
+    require("display", "font")
+    if mixer:
+        try:
+            require("mixer")
+        except pygame.error as e:
+            print(f"Audio disabled: {e}")
+
+
+def is_ready(name):
+    return name in _ready
+
+
+def mark(label):
+    """Record a named startup milestone."""
+    _trace.append((label, (time.perf_counter() - PROCESS_START) * 1000.0, 0.0))
+
+
+def has_mark(label):
+    return any(entry[0] == label for entry in _trace)
+
+
+def timed(label):
+    """Context manager that records how long a startup step took."""
+    return _Timed(label)
+
+
+class _Timed:
+    def __init__(self, label):
+        self.label = label
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.label, self.start)
+        return False
+
+
+def _record(label, start):
+    now = time.perf_counter()
+    _trace.append((label, (start - PROCESS_START) * 1000.0, (now - start) * 1000.0))
+
+
+def trace():
+    """The startup trace as (label, start offset ms, duration ms) tuples."""
+    return list(_trace)
+
+
+def report():
+    """Human-readable startup trace."""
+    lines = ["Startup trace (ms since start / duration):"]
+    for label, at, duration in _trace:
+        if duration:
+            lines.append(f"  {at:8.1f}  {duration:7.1f}  {label}")
+        else:
+            lines.append(f"  {at:8.1f}           {label}")
+    return "\n".join(lines)
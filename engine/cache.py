@@ -0,0 +1,231 @@
+"""
+Step Into My Shoes - Cache Manager
+One memory budget shared by every render cache.
+
+Each cache is an LRU map that knows how many bytes its entries hold. The
+caches register with one CacheManager, which keeps their combined size
+under a single budget by evicting the least recently used entry across
+all of them, so a burst of new text can push out an old layer and vice
+versa:
+
+    _TEXT_CACHE = cache.register("text", sizeof=cache.surface_bytes)
+
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _TEXT_CACHE.put(key, font.render(text, True, color))
+
+Memory that must stay resident, such as the baked UI atlas, is counted
+with manager.reserve() so the caches share what is left of the budget.
+
+Press F9 in game (or print cache.report()) for per-cache sizes and hit rates.
+"""
+
+import itertools
+import sys
+from collections import OrderedDict
+from engine import metrics
+
+# Total bytes all registered caches may hold together
+DEFAULT_BUDGET_MB = 96
+
+# Shared use counter; an entry's stamp orders it against every other cache
+_uses = itertools.count()
+
+
+def surface_bytes(surface):
+    """Pixel memory owned by a pygame Surface.
+
+    A subsurface shares its parent's pixels, which are counted wherever
+    the parent is owned, so it counts as 0.
+    """
+    if surface.get_parent() is not None:
+        return 0
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def object_bytes(value):
+    """Approximate size of a string, or a tuple/list of strings."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class Cache:
+    """An LRU map whose entries count against its manager's budget.
+
+    `max_entries` optionally caps this cache on its own as well.
+    """
+
+    def __init__(self, name, manager, sizeof=object_bytes, max_entries=None):
+        self.name = name
+        self.manager = manager
+        self.sizeof = sizeof
+        self.max_entries = max_entries
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> [value, bytes, last use]
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        entry[2] = next(_uses)
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        """Store `value` (evicting as needed to stay in budget) and return it."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._forget(old[1])
+        nbytes = self.sizeof(value)
+        self._entries[key] = [value, nbytes, next(_uses)]
+        self.bytes += nbytes
+        self.manager.bytes += nbytes
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            self.evict_oldest()
+        if self.manager.bytes > self.manager.budget:
+            self.manager.trim()
+        return value
+
+    def oldest_use(self):
+        """Last-use stamp of the least recently used entry (None if empty)."""
+        for entry in self._entries.values():
+            return entry[2]
+        return None
+
+    def discard(self, key):
+        """Drop `key` if it is cached (its owner no longer needs it)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._forget(entry[1])
+
+    def evict_oldest(self):
+        entry = self._entries.popitem(last=False)[1]
+        self._forget(entry[1])
+        self.evictions += 1
+
+    def _forget(self, nbytes):
+        self.bytes -= nbytes
+        self.manager.bytes -= nbytes
+
+    def clear(self):
+        self._forget(self.bytes)
+        self._entries.clear()
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+class CacheManager:
+    """Registered caches plus the byte budget they share."""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB * 1024 * 1024):
+        self.budget = budget_bytes
+        self.bytes = 0
+        self.caches = {}
+        self.reserved = {}  # name -> bytes held outside any cache
+
+    def register(self, name, sizeof=object_bytes, max_entries=None):
+        """Create and return a new Cache called `name`."""
+        if name in self.caches:
+            raise ValueError(f"Cache {name!r} is already registered")
+        cache = Cache(name, self, sizeof, max_entries)
+        self.caches[name] = cache
+        return cache
+
+    def reserve(self, name, nbytes):
+        """Count `nbytes` of resident memory against the budget as `name`.
+
+        Reserving again under the same name replaces the earlier figure;
+        0 releases it.
+        """
+        self.bytes += nbytes - self.reserved.pop(name, 0)
+        if nbytes:
+            self.reserved[name] = nbytes
+        self.trim()
+
+    def trim(self, target=None):
+        """Evict least recently used entries until at most `target` bytes remain.
+
+        Defaults to the budget. Returns the number of entries evicted.
+        """
+        target = self.budget if target is None else target
+        evicted = 0
+        while self.bytes > target:
+            oldest = None
+            oldest_use = None
+            for cache in self.caches.values():
+                use = cache.oldest_use()
+                if use is not None and (oldest_use is None or use < oldest_use):
+                    oldest, oldest_use = cache, use
+            if oldest is None:
+                break
+            oldest.evict_oldest()
+            evicted += 1
+        return evicted
+
+    def set_budget(self, budget_bytes):
+        self.budget = budget_bytes
+        self.trim()
+
+    def clear(self):
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self):
+        """Per-cache figures as a list of dicts."""
+        return [
+            {
+                "name": cache.name,
+                "entries": len(cache),
+                "bytes": cache.bytes,
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "hit_rate": cache.hit_rate(),
+                "evictions": cache.evictions,
+            }
+            for cache in self.caches.values()
+        ]
+
+    def report(self):
+        """Human-readable table of every cache's size and hit rate."""
+        mb = 1024 * 1024
+        lines = [f"Caches: {self.bytes / mb:.1f} of {self.budget / mb:.0f} MB",
+                 f"  {'name':<12} {'entries':>8} {'KB':>9} {'hit rate':>9} {'evicted':>8}"]
+        for row in self.stats():
+            lines.append(f"  {row['name']:<12} {row['entries']:>8} {row['bytes'] / 1024:>9.1f} "
+                         f"{row['hit_rate']:>9.1%} {row['evictions']:>8}")
+        for name, nbytes in self.reserved.items():
+            lines.append(f"  {name:<12} {'reserved':>8} {nbytes / 1024:>9.1f}")
+        return "\n".join(lines)
+
+
+# The engine's shared manager
+manager = CacheManager()
+
+
+def register(name, sizeof=object_bytes, max_entries=None):
+    """Register a cache with the shared manager (and its metrics gauges)."""
+    cache = manager.register(name, sizeof, max_entries)
+    metrics.gauge(f"cache.{name}.hits", lambda: cache.hits)
+    metrics.gauge(f"cache.{name}.misses", lambda: cache.misses)
+    metrics.gauge(f"cache.{name}.bytes", lambda: cache.bytes)
+    return cache
+
+
+def report():
+    return manager.report()
@@ -0,0 +1,52 @@
+"""
+Step Into My Shoes - Engine Clocks
+Injectable frame clocks for the engine loop.
+
+Both clocks share pygame.time.Clock's `tick(framerate)` interface and
+return elapsed milliseconds, so scenes never know which one is driving
+them. `time_scale` dilates game time: 0.5 is slow motion, 4.0 runs the
+simulation four times faster than it is shown.
+"""
+
+import pygame
+
+
+class RealClock:
+    """Wall-clock time; sleeps in `tick` to cap the frame rate."""
+
+    def __init__(self, time_scale=1.0):
+        self.time_scale = time_scale
+        self.time_ms = 0.0  # scaled game time since creation
+        self._clock = pygame.time.Clock()
+
+    def tick(self, framerate=0):
+        elapsed = self._clock.tick(framerate) * self.time_scale
+        self.time_ms += elapsed
+        return elapsed
+
+    def get_fps(self):
+        return self._clock.get_fps()
+
+
+class VirtualClock:
+    """Simulated time that advances a fixed step per tick and never sleeps.
+
+    Every tick advances exactly one frame at `fps` (times `time_scale`),
+    so a headless run is deterministic and finishes as fast as the update
+    code allows.
+    """
+
+    def __init__(self, fps=60, time_scale=1.0):
+        self.fps = fps
+        self.time_scale = time_scale
+        self.time_ms = 0.0
+        self.ticks = 0
+
+    def tick(self, framerate=0):
+        elapsed = 1000.0 / self.fps * self.time_scale
+        self.time_ms += elapsed
+        self.ticks += 1
+        return elapsed
+
+    def get_fps(self):
+        return self.fps * self.time_scale
@@ -1,21 +1,322 @@
-class SceneManager:
-
-    def __init__(self):
-        self.current_scene = None
-
-    def change_scene(self, scene_func):
-        """Switch to a new scene."""
-        self.current_scene = scene_func
-
-    def run(self):
-        """Run the current scene in a loop."""
-        while True:
-            if self.current_scene:
-                # Pass the SceneManager instance to the scene callable
-                try:
-                    self.current_scene(self)
-                except TypeError:
-                    # If the scene expects no arguments, call without
-                    self.current_scene()
-            else:
-                break
+"""
+Step Into My Shoes - Engine Core
+The scene stack and the single main loop that drives every scene.
+"""
+
+import time
+import pygame
+from engine import display
+from engine import cache
+from engine import metrics
+from engine.clock import RealClock
+from engine.input import InputRouter
+from engine.jobs import JobSystem
+from engine.idle import IdleScheduler
+
+# Simulation runs in fixed steps at this rate regardless of display rate
+SIM_HZ = 60
+# Longest wall-clock frame the simulation will catch up on (avoids a spiral
+# of death); scaled by the clock's time_scale. Virtual time is never clamped.
+MAX_FRAME_TIME = 0.25
+# Prints the cache report (sizes, hit rates) to the console
+CACHE_REPORT_KEY = pygame.K_F9
+# Prints the metrics snapshot (engine/metrics.py) to the console
+METRICS_REPORT_KEY = pygame.K_F10
+
+# Per-frame timings, recorded while metrics are enabled
+_FRAMES = metrics.counter("frame.count")
+_FRAME_MS = metrics.timer("frame.total_ms")
+_INTERVAL_MS = metrics.timer("frame.interval_ms")
+_EVENT_MS = metrics.timer("frame.event_ms")
+_UPDATE_MS = metrics.timer("frame.update_ms")
+_DRAW_MS = metrics.timer("frame.draw_ms")
+
+# How far (0..1) the current render lies between the last two sim steps
+_render_alpha = 1.0
+
+
+def get_render_alpha():
+    """Interpolation factor for drawing between fixed simulation steps."""
+    return _render_alpha
+
+
+class Scene:
+    """
+    Base class for everything the engine loop runs.
+
+    Scenes never own a loop, clock or event pump; the SceneManager calls
+    `handle_event`, `update` and `draw` once per frame for the top scene.
+    Staged scenes (career worlds) draw on the design-size stage and get
+    pointer events in stage coordinates; others get the whole window.
+    """
+
+    staged = False
+
+    # Event types passed to handle_event; all others are blocked while
+    # this scene is active
+    event_types = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
+    def on_enter(self):
+        """Called when the scene is pushed (or replaces another)."""
+
+    def on_exit(self):
+        """Called when the scene is popped or replaced."""
+
+    def on_suspend(self):
+        """Called when another scene is pushed on top of this one."""
+
+    def on_resume(self):
+        """Called when the scene above this one is popped."""
+
+    def on_resize(self):
+        """Called after the window size changes."""
+
+    def handle_event(self, event, scene_manager):
+        """Handle one input event."""
+
+    def update(self, dt):
+        """Advance the scene by one fixed simulation step of `dt` seconds."""
+
+    def draw(self, screen):
+        """Draw the scene."""
+
+
+class FrameStats:
+    """Per-frame timings collected by the engine loop (milliseconds)."""
+
+    def __init__(self):
+        self.frames = 0
+        self.event_ms = 0.0
+        self.jobs_ms = 0.0
+        self.update_ms = 0.0
+        self.draw_ms = 0.0
+        self.present_ms = 0.0
+        self.idle_ms = 0.0     # idle tasks run in the frame's leftover time
+        self.interval_ms = 0.0  # wall time since the previous frame started
+        self.jitter_ms = 0.0    # how far that interval missed the target frame time
+        self.dt = 0.0
+        self.steps = 0         # simulation steps run this frame
+        self.rendered = False  # whether this frame was drawn
+
+    def frame_ms(self):
+        return self.event_ms + self.jobs_ms + self.update_ms + self.draw_ms + self.present_ms
+
+
+class SceneManager:
+    """
+    Stack of scenes plus the engine main loop. Only the top scene runs;
+    scenes underneath are suspended with all their state (widgets, caches,
+    animations) intact, so popping back to them is instant.
+
+    Scenes are updated in fixed steps of 1/`sim_hz` seconds, however fast
+    the loop itself runs (capped at `fps`). Drawing can be throttled
+    separately with `render_fps`; between steps it is interpolated using
+    get_render_alpha().
+
+    `clock` defaults to a RealClock; pass a VirtualClock to simulate time.
+    A `headless` manager skips drawing and presenting frames. Background
+    jobs submitted to `jobs` are handed back once per frame, after input;
+    tasks posted to `idle` run at the end of a frame if time is left.
+    """
+
+    def __init__(self, fps=60, clock=None, headless=False, sim_hz=SIM_HZ, render_fps=None,
+                 jobs=None):
+        self.stack = []
+        self.fps = fps
+        self.clock = clock or RealClock()
+        self.headless = headless
+        self.sim_step = 1.0 / sim_hz
+        self.render_interval = 1.0 / render_fps if render_fps else 0.0
+        self.input = InputRouter()
+        self.jobs = jobs or JobSystem()
+        self.idle = IdleScheduler()
+        self.stats = FrameStats()
+        self.running = False
+        self._accumulator = 0.0
+        self._since_render = 0.0
+        self._frame_budget = 1.0 / fps if fps else self.sim_step
+        self._last_frame = None
+
+        # Callables run after every frame as hook(scene_manager, stats)
+        self.frame_hooks = []
+        # Callables run after every push, pop and replace as hook(scene_manager)
+        self.transition_hooks = []
+
+    @property
+    def current_scene(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """Suspend the current scene and enter `scene` on top of it."""
+        if self.stack:
+            self.stack[-1].on_suspend()
+        self.stack.append(scene)
+        scene.on_enter()
+        self._transitioned()
+
+    def pop(self):
+        """Leave the current scene and resume the one beneath it."""
+        scene = self.stack.pop()
+        scene.on_exit()
+        if self.stack:
+            self.stack[-1].on_resume()
+        self._transitioned()
+        return scene
+
+    def replace(self, scene):
+        """Swap the current scene for `scene` without resuming anything."""
+        if self.stack:
+            self.stack.pop().on_exit()
+        self.stack.append(scene)
+        scene.on_enter()
+        self._transitioned()
+
+    def reset(self, scene):
+        """Exit every scene on the stack, top first, and start over with `scene`."""
+        while self.stack:
+            self.stack.pop().on_exit()
+        self.stack.append(scene)
+        scene.on_enter()
+        self._transitioned()
+
+    def _transitioned(self):
+        for hook in tuple(self.transition_hooks):
+            hook(self)
+
+    def change_scene(self, scene):
+        """Switch to a new scene (replaces the current one)."""
+        self.replace(scene)
+
+    def quit(self):
+        """Stop the main loop after the current frame."""
+        self.running = False
+
+    def start(self):
+        """Reset the loop's state before its first frame (run() calls this)."""
+        self.running = True
+        self._accumulator = 0.0
+        self._since_render = self.render_interval
+        self._frame_budget = 1.0 / self.fps if self.fps else self.sim_step
+        self._last_frame = None
+        if isinstance(self.clock, RealClock):
+            # Don't count time spent before the loop started
+            self.clock.tick()
+
+    def run(self):
+        """Run the main loop until the stack is empty or quit() is called."""
+        self.start()
+        while self.running and self.stack:
+            self.frame(self.clock.tick(self.fps))
+
+    def frame(self, elapsed_ms):
+        """Run one frame: input, jobs, simulation, drawing, hooks, idle.
+
+        `elapsed_ms` is the game time since the previous frame, as returned
+        by the clock's tick(). Loops other than run() pace themselves and
+        call this once per frame after start().
+        """
+        global _render_alpha
+        stats = self.stats
+        step = self.sim_step
+        dt = elapsed_ms / 1000.0
+        if isinstance(self.clock, RealClock):
+            dt = min(dt, MAX_FRAME_TIME * self.clock.time_scale)
+        frame_start = time.perf_counter()
+        if self._last_frame is not None:
+            stats.interval_ms = (frame_start - self._last_frame) * 1000.0
+            stats.jitter_ms = abs(stats.interval_ms - self._frame_budget * 1000.0)
+        self._last_frame = frame_start
+        stats.dt = dt
+        scene = self.current_scene
+
+        # Events
+        start = time.perf_counter()
+        self.input.configure(scene)
+        for event in self.input.poll():
+            if event.type == pygame.QUIT:
+                self.quit()
+                break
+
+            if display.handle_event(event):
+                scene.on_resize()
+                continue
+
+            if event.type == pygame.KEYDOWN and event.key == CACHE_REPORT_KEY:
+                print(cache.report())
+                continue
+
+            if event.type == pygame.KEYDOWN and event.key == METRICS_REPORT_KEY:
+                print(metrics.report())
+                continue
+
+            if not self.input.wants(event):
+                continue
+
+            if scene.staged:
+                display.stage()
+                event = display.localize_event(event)
+            else:
+                display.screen()
+            scene.handle_event(event, self)
+
+            # The rest of this frame's input belonged to the old scene
+            if self.current_scene is not scene:
+                break
+        stats.event_ms = (time.perf_counter() - start) * 1000.0
+
+        # Finished background jobs hand over their results on this thread
+        start = time.perf_counter()
+        self.jobs.pump()
+        stats.jobs_ms = (time.perf_counter() - start) * 1000.0
+
+        if not self.running or self.current_scene is not scene:
+            return
+
+        # Fixed-step simulation (tolerance absorbs float drift when the
+        # frame rate equals the sim rate)
+        start = time.perf_counter()
+        accumulator = self._accumulator + dt
+        stats.steps = 0
+        while accumulator >= step - 1e-9 and self.current_scene is scene:
+            scene.update(step)
+            accumulator -= step
+            stats.steps += 1
+        accumulator = max(accumulator, 0.0)
+        self._accumulator = accumulator
+        _render_alpha = min(accumulator / step, 1.0)
+        stats.update_ms = (time.perf_counter() - start) * 1000.0
+
+        # Draw and present, throttled independently of the simulation
+        self._since_render += dt
+        stats.rendered = (not self.headless and self.current_scene is scene
+                          and self._since_render >= self.render_interval)
+        if stats.rendered:
+            self._since_render = 0.0
+
+            start = time.perf_counter()
+            scene.draw(display.stage() if scene.staged else display.screen())
+            stats.draw_ms = (time.perf_counter() - start) * 1000.0
+
+            start = time.perf_counter()
+            pygame.display.update()
+            stats.present_ms = (time.perf_counter() - start) * 1000.0
+
+        stats.frames += 1
+        if metrics.enabled:
+            _FRAMES.add()
+            _FRAME_MS.record(stats.frame_ms())
+            _INTERVAL_MS.record(stats.interval_ms)
+            _EVENT_MS.record(stats.event_ms)
+            _UPDATE_MS.record(stats.update_ms)
+            if stats.rendered:
+                _DRAW_MS.record(stats.draw_ms)
+        for hook in tuple(self.frame_hooks):  # hooks may remove themselves
+            hook(self, stats)
+
+        # Idle tasks get whatever is left of this frame's time budget
+        if self.idle:
+            start = time.perf_counter()
+            self.idle.run(frame_start + self._frame_budget)
+            stats.idle_ms = (time.perf_counter() - start) * 1000.0
+        else:
+            stats.idle_ms = 0.0
@@ -0,0 +1,326 @@
+"""
+Step Into My Shoes - Surface Disk Cache
+Opt-in persistent cache of rendered surfaces, for a warm start.
+
+Pixels are stored raw (pygame.image.tobytes) in append-only pack files.
+On launch the packs are memory-mapped, and a cached surface is copied
+straight out of the mapping into the display's pixel format, so nothing
+is decoded or rasterized and only the pages used are read. Every call
+returns a surface of its own, so drawing on one never affects another.
+
+Entries are keyed by a hash of the caller's description of the content,
+the font files used and the pygame version, so a changed font or an
+upgrade simply misses. Entries unused for MAX_AGE_DAYS are dropped the
+next time the cache is opened. Packs that are mostly dead are rewritten
+then, and whole packs, least recently used first, are deleted whenever
+the pack files add up to more than MAX_MB.
+
+    diskcache.enable()
+    diskcache.attach(scene_manager)  # write new surfaces out in idle time
+    surf = diskcache.surface(("title", text, size), lambda: render(text, size),
+                             fonts=[("arial", True)])
+    ...
+    diskcache.flush()  # on exit: write out the rest
+
+Newly rendered surfaces wait in memory until a batch of FLUSH_BATCH_MB
+is pending, which an idle task then writes out; past MAX_PENDING_MB they
+are written at once. Content that changes all the time (scores, timers)
+should be passed with store=False, so it is rendered but never written.
+
+While disabled, surface() just calls the render function.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import time
+import pygame
+
+DEFAULT_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                           "step_into_my_shoes", "surfaces")
+MAX_MB = 64
+MAX_AGE_DAYS = 30
+
+# Pending surfaces written out by an idle task once this many are waiting...
+FLUSH_BATCH_MB = 1
+# ...and straight away, mid-frame if need be, past this many
+MAX_PENDING_MB = 8
+
+# Packs with less than this share of live bytes are rewritten on open
+COMPACT_BELOW = 0.5
+
+# Pixel layout of stored buffers (4 bytes per pixel)
+FORMAT = "RGBA"
+
+INDEX_NAME = "index.json"
+PACK_SUFFIX = ".pack"
+
+_font_ids = {}
+
+
+def font_id(font_name, bold=False):
+    """Identify the font file behind a SysFont name (file name and size)."""
+    key = (font_name, bold)
+    ident = _font_ids.get(key)
+    if ident is None:
+        path = pygame.font.match_font(font_name, bold=bold)
+        if path is None:
+            ident = f"default:{pygame.font.get_default_font()}"
+        else:
+            ident = f"{os.path.basename(path)}:{os.path.getsize(path)}"
+        _font_ids[key] = ident
+    return ident
+
+
+def _from_bytes(data, size):
+    """A surface of its own holding stored pixels, in the display's
+    format when there is a display so blitting it is a plain copy."""
+    surf = pygame.image.frombuffer(data, size, FORMAT)
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf.copy()
+
+
+class DiskCache:
+    """Surfaces stored in memory-mapped pack files under `directory`."""
+
+    def __init__(self, directory=DEFAULT_DIR, max_mb=MAX_MB, max_age_days=MAX_AGE_DAYS):
+        self.directory = directory
+        self.max_bytes = max_mb * 1024 * 1024
+        self.now = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.entries = {}  # digest -> [pack, offset, width, height, last used]
+        self._maps = {}    # pack file name -> mmap
+        self._new = {}     # digest -> (pixels, size) rendered but not yet written
+        self.pending_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._read_index()
+        self._evict(max_age_days * 86400)
+
+    def digest(self, key, fonts=()):
+        ident = (key, tuple(font_id(name, bold) for name, bold in fonts), pygame.version.ver)
+        return hashlib.blake2b(repr(ident).encode(), digest_size=16).hexdigest()
+
+    def surface(self, key, render, fonts=(), store=True):
+        """Return the stored surface for `key`, or render (and later store) it."""
+        digest = self.digest(key, fonts)
+        pending = self._new.get(digest)
+        if pending is not None:
+            self.hits += 1
+            return _from_bytes(*pending)
+        entry = self.entries.get(digest)
+        if entry is not None:
+            surf = self._load(entry)
+            if surf is not None:
+                self.hits += 1
+                entry[4] = self.now
+                return surf
+            del self.entries[digest]
+        self.misses += 1
+        surf = render()
+        if store:
+            # Pixels as they are now; later drawing on `surf` isn't stored
+            data = pygame.image.tobytes(surf, FORMAT)
+            self._new[digest] = (data, surf.get_size())
+            self.pending_bytes += len(data)
+            if self.pending_bytes > MAX_PENDING_MB * 1024 * 1024:
+                self.flush()
+        return surf
+
+    def _load(self, entry):
+        pack, offset, width, height, _ = entry
+        mapped = self._maps.get(pack)
+        if mapped is None:
+            try:
+                with open(os.path.join(self.directory, pack), "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+            self._maps[pack] = mapped
+        size = width * height * 4
+        if offset + size > len(mapped):
+            return None
+        with memoryview(mapped) as view:
+            return _from_bytes(view[offset:offset + size].tobytes(), (width, height))
+
+    def flush(self):
+        """Write pending surfaces to a new pack and save the index."""
+        if self._new:
+            pack = self._pack_name()
+            offset = 0
+            with open(os.path.join(self.directory, pack), "wb") as f:
+                for digest, (data, (width, height)) in self._new.items():
+                    f.write(data)
+                    self.entries[digest] = [pack, offset, width, height, self.now]
+                    offset += len(data)
+            self._new.clear()
+            self.pending_bytes = 0
+            self._trim_packs()
+            self._remove_stale()
+        self._write_index()
+
+    def _pack_name(self):
+        name = f"{time.time_ns():x}{PACK_SUFFIX}"
+        while os.path.exists(os.path.join(self.directory, name)):
+            name = f"{time.time_ns():x}{PACK_SUFFIX}"
+        return name
+
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_NAME), encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Nothing from another pygame version can match; let it all go stale
+        if index.get("pygame") == pygame.version.ver:
+            self.entries = index.get("entries", {})
+
+    def _write_index(self):
+        path = os.path.join(self.directory, INDEX_NAME)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"pygame": pygame.version.ver, "entries": self.entries}, f)
+        os.replace(path + ".tmp", path)
+
+    def _packs(self):
+        """{pack: [file bytes, live bytes, last use, digests]} for packs in use.
+
+        Entries whose pack file is gone are dropped.
+        """
+        packs = {}
+        for digest, (pack, _, width, height, used) in list(self.entries.items()):
+            info = packs.get(pack)
+            if info is None:
+                try:
+                    size = os.path.getsize(os.path.join(self.directory, pack))
+                except OSError:
+                    del self.entries[digest]
+                    continue
+                info = packs[pack] = [size, 0, used, []]
+            info[1] += width * height * 4
+            info[2] = max(info[2], used)
+            info[3].append(digest)
+        return packs
+
+    def _evict(self, max_age):
+        """Drop old entries, rewrite mostly dead packs into one, keep the
+        packs within max_bytes and delete pack files nothing refers to."""
+        entries = self.entries
+        before = len(entries)
+        for digest, entry in list(entries.items()):
+            if self.now - entry[4] > max_age:
+                del entries[digest]
+        compacted = self._compact()
+        self._trim_packs()
+        self.evicted = before - len(entries)
+        if self._remove_stale() or self.evicted or compacted:
+            self._write_index()
+
+    def _compact(self):
+        """Copy the live entries of packs below COMPACT_BELOW into a new pack.
+
+        Returns the number of entries moved.
+        """
+        sparse = [(pack, info) for pack, info in self._packs().items()
+                  if info[1] < info[0] * COMPACT_BELOW]
+        if not sparse:
+            return 0
+        moved = 0
+        new_pack = self._pack_name()
+        offset = 0
+        with open(os.path.join(self.directory, new_pack), "wb") as out:
+            for pack, info in sparse:
+                try:
+                    with open(os.path.join(self.directory, pack), "rb") as f:
+                        for digest in info[3]:
+                            entry = self.entries[digest]
+                            size = entry[2] * entry[3] * 4
+                            f.seek(entry[1])
+                            data = f.read(size)
+                            if len(data) != size:
+                                del self.entries[digest]
+                                continue
+                            out.write(data)
+                            entry[0], entry[1] = new_pack, offset
+                            offset += size
+                            moved += 1
+                except OSError:
+                    for digest in info[3]:
+                        if self.entries.get(digest, [None])[0] == pack:
+                            del self.entries[digest]
+        return moved
+
+    def _trim_packs(self):
+        """Drop whole packs, least recently used first, beyond max_bytes."""
+        packs = self._packs()
+        total = sum(info[0] for info in packs.values())
+        for pack in sorted(packs, key=lambda pack: packs[pack][2]):
+            if total <= self.max_bytes:
+                break
+            size, _, _, digests = packs[pack]
+            for digest in digests:
+                del self.entries[digest]
+            total -= size
+
+    def _remove_stale(self):
+        """Delete pack files no entry refers to; return how many there were."""
+        live = {entry[0] for entry in self.entries.values()}
+        stale = [name for name in os.listdir(self.directory)
+                 if name.endswith(PACK_SUFFIX) and name not in live]
+        for name in stale:
+            mapped = self._maps.pop(name, None)
+            if mapped is not None:
+                mapped.close()
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return len(stale)
+
+
+_cache = None
+
+
+def enable(directory=DEFAULT_DIR, max_mb=MAX_MB, max_age_days=MAX_AGE_DAYS):
+    """Open the disk cache; surface() uses it from now on."""
+    global _cache
+    _cache = DiskCache(directory, max_mb, max_age_days)
+    return _cache
+
+
+def enabled():
+    return _cache is not None
+
+
+def surface(key, render, fonts=(), store=True):
+    """`render()`'s surface, from disk if an earlier run stored it.
+
+    `key` must describe everything that affects the pixels except fonts,
+    which are listed as (name, bold) pairs in `fonts`. With store=False a
+    surface is read from disk if present but never written.
+    """
+    if _cache is None:
+        return render()
+    return _cache.surface(key, render, fonts, store)
+
+
+def flush():
+    if _cache is not None:
+        _cache.flush()
+
+
+def attach(scene_manager, batch_mb=FLUSH_BATCH_MB):
+    """Write pending surfaces in batches from the manager's idle time."""
+    batch = batch_mb * 1024 * 1024
+    task = None
+
+    def hook(manager, stats):
+        nonlocal task
+        if _cache is None or _cache.pending_bytes < batch:
+            return
+        if task is None or task.done or task.cancelled:
+            task = manager.idle.post(lambda deadline: flush())
+
+    scene_manager.frame_hooks.append(hook)
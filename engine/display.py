@@ -0,0 +1,120 @@
+"""
+Step Into My Shoes - Display Management
+Resizable/fullscreen window handling and the fixed-size stage for worlds.
+
+Menu scenes lay themselves out over the whole window with `engine.layout`.
+Career worlds are authored at the design resolution, so they draw into a
+"stage": a design-size subsurface centered in the window. Pointer
+positions are translated into whichever of the two the current scene uses.
+"""
+
+import pygame
+from engine.colors import BACKGROUND
+from engine.layout import DESIGN_SIZE, CENTER, RelRect
+
+_STAGE_SPEC = RelRect(CENTER, size=DESIGN_SIZE)
+
+_windowed_size = DESIGN_SIZE
+_fullscreen = False
+
+# Stage subsurface, rebuilt only when the window surface changes
+_stage = None
+_stage_rect = None
+_stage_active = False
+_pointer_origin = (0, 0)
+
+
+def create_window(title, size=DESIGN_SIZE, fullscreen=False):
+    """Open the game window (resizable, optionally fullscreen)."""
+    global _windowed_size
+    _windowed_size = size
+    pygame.display.set_caption(title)
+    _set_mode(fullscreen)
+    return pygame.display.get_surface()
+
+
+def _set_mode(fullscreen):
+    global _fullscreen
+    _fullscreen = fullscreen
+    if fullscreen:
+        pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    else:
+        pygame.display.set_mode(_windowed_size, pygame.RESIZABLE)
+    _invalidate()
+
+
+def _invalidate():
+    global _stage, _stage_rect, _stage_active
+    _stage = None
+    _stage_rect = None
+    _stage_active = False
+
+
+def is_fullscreen():
+    return _fullscreen
+
+
+def toggle_fullscreen():
+    _set_mode(not _fullscreen)
+
+
+def handle_event(event):
+    """Handle window events; return True if the window size changed.
+
+    F11 toggles fullscreen. Windows are never allowed to shrink below the
+    design resolution so the stage always fits.
+    """
+    global _windowed_size
+    if event.type == pygame.VIDEORESIZE and not _fullscreen:
+        width = max(event.w, DESIGN_SIZE[0])
+        height = max(event.h, DESIGN_SIZE[1])
+        _windowed_size = (width, height)
+        if (width, height) != (event.w, event.h):
+            pygame.display.set_mode(_windowed_size, pygame.RESIZABLE)
+        _invalidate()
+        return True
+    if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+        toggle_fullscreen()
+        return True
+    return False
+
+
+def screen():
+    """Return the full window surface for scenes that lay out responsively."""
+    global _pointer_origin, _stage_active
+    _pointer_origin = (0, 0)
+    _stage_active = False
+    return pygame.display.get_surface()
+
+
+def stage():
+    """Return the design-size stage centered in the window.
+
+    The first call after a resize (or after a full-window scene) clears the
+    letterbox margins once.
+    """
+    global _stage, _stage_rect, _stage_active, _pointer_origin
+    window = pygame.display.get_surface()
+    if _stage is None:
+        _stage_rect = _STAGE_SPEC.resolve(window.get_size())
+        _stage = window.subsurface(_stage_rect)
+    if not _stage_active:
+        window.fill(BACKGROUND)
+        _stage_active = True
+    _pointer_origin = _stage_rect.topleft
+    return _stage
+
+
+def get_mouse_pos():
+    """Mouse position relative to the surface the current scene draws on."""
+    mx, my = pygame.mouse.get_pos()
+    return (mx - _pointer_origin[0], my - _pointer_origin[1])
+
+
+def localize_event(event):
+    """Translate a mouse event's position into current scene coordinates."""
+    if _pointer_origin == (0, 0) or not hasattr(event, "pos"):
+        return event
+    attrs = dict(event.dict)
+    attrs["pos"] = (event.pos[0] - _pointer_origin[0], event.pos[1] - _pointer_origin[1])
+    return pygame.event.Event(event.type, attrs)
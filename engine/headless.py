@@ -0,0 +1,70 @@
+"""
+Step Into My Shoes - Headless Simulation
+Turbo-speed runs of scenes with no window and no real-time sleeping.
+
+The same engine loop and scene update code run against a VirtualClock, so
+a full career session simulates in milliseconds of wall time. Use it for
+testing and balancing, e.g.:
+
+    result = simulate(DoctorWorld(), policy=my_bot, until=lambda w: w.state == "results")
+"""
+
+import os
+import time
+import pygame
+from engine import bootstrap
+from engine.clock import VirtualClock
+from engine.core import SceneManager
+from engine.layout import DESIGN_SIZE
+
+
+class SimulationResult:
+    """Outcome of a headless run."""
+
+    def __init__(self, scene, frames, sim_seconds, wall_seconds):
+        self.scene = scene
+        self.frames = frames
+        self.sim_seconds = sim_seconds
+        self.wall_seconds = wall_seconds
+
+    @property
+    def speedup(self):
+        """Simulated seconds per wall-clock second."""
+        return self.sim_seconds / self.wall_seconds if self.wall_seconds else float("inf")
+
+
+def init_headless():
+    """Initialize pygame on SDL's dummy video driver (no-op if already up)."""
+    if not pygame.display.get_init():
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    bootstrap.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode(DESIGN_SIZE)
+
+
+def simulate(scene, policy=None, until=None, max_seconds=600.0, fps=60, time_scale=1.0):
+    """Run `scene` headless on a virtual clock and return a SimulationResult.
+
+    `policy(scene, sim_time)` is called after every frame with the top
+    scene so a bot can play (post events or call scene methods). The run
+    ends when `until(scene)` is true, the scene stack empties, or
+    `max_seconds` of simulated time have passed.
+    """
+    init_headless()
+    clock = VirtualClock(fps, time_scale)
+    manager = SceneManager(fps, clock=clock, headless=True)
+    manager.push(scene)
+    max_ms = max_seconds * 1000.0
+
+    def control(manager, stats):
+        top = manager.current_scene
+        if policy is not None:
+            policy(top, clock.time_ms / 1000.0)
+        if clock.time_ms >= max_ms or (until is not None and until(top)):
+            manager.quit()
+
+    manager.frame_hooks.append(control)
+    start = time.perf_counter()
+    manager.run()
+    wall = time.perf_counter() - start
+    return SimulationResult(scene, manager.stats.frames, clock.time_ms / 1000.0, wall)
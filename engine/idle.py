@@ -0,0 +1,132 @@
+"""
+Step Into My Shoes - Idle Scheduler
+Main-thread work that runs only in the time a frame leaves unused.
+
+Some work can't go to a worker thread (anything creating pygame surfaces
+or fonts) but can be split into small pieces. Post it here and the engine
+loop runs it after the frame is drawn, until the frame's time budget is
+spent. Like requestIdleCallback in browsers, each task receives an
+IdleDeadline:
+
+    def warm_next_question(deadline):
+        for text in upcoming_strings:
+            render_text(text, 20, WHITE)
+            if deadline.time_remaining() < 1:
+                yield  # continue next frame
+
+    scene_manager.idle.post(warm_next_question)
+
+A task is a callable taking the deadline. If it returns a generator, the
+generator is resumed on later frames until it finishes. Tasks run in the
+order they were posted. With `timeout_ms`, a task that has waited that
+long gets one slice per frame even when there is no idle time.
+"""
+
+import inspect
+import time
+from collections import deque
+
+# Idle time kept back at the end of a frame for the clock's sleep/jitter
+IDLE_MARGIN_MS = 1.0
+
+
+class IdleDeadline:
+    """How long the current idle slice may run."""
+
+    __slots__ = ("end", "did_timeout")
+
+    def __init__(self):
+        self.end = 0.0
+        self.did_timeout = False  # running only because the task's timeout passed
+
+    def time_remaining(self):
+        """Milliseconds left in this frame's idle time (never negative)."""
+        return max(0.0, (self.end - time.perf_counter()) * 1000.0)
+
+
+class IdleTask:
+    """A posted task; cancel() drops it before it (next) runs."""
+
+    __slots__ = ("callback", "timeout_at", "cancelled", "done", "steps")
+
+    def __init__(self, callback, timeout_at):
+        self.callback = callback
+        self.timeout_at = timeout_at
+        self.cancelled = False
+        self.done = False  # finished (or failed)
+        self.steps = None  # generator, once the callback has returned one
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class IdleScheduler:
+    """FIFO queue of main-thread tasks run in leftover frame time."""
+
+    def __init__(self, margin_ms=IDLE_MARGIN_MS):
+        self.margin = margin_ms / 1000.0
+        self.deadline = IdleDeadline()
+        self._tasks = deque()
+        self.slices = 0    # task slices run so far
+        self.forced = 0    # slices run past the budget because of a timeout
+
+    def post(self, callback, timeout_ms=None):
+        """Queue `callback(deadline)` to run when there is idle time."""
+        timeout_at = None
+        if timeout_ms is not None:
+            timeout_at = time.perf_counter() + timeout_ms / 1000.0
+        task = IdleTask(callback, timeout_at)
+        self._tasks.append(task)
+        return task
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def run(self, frame_end):
+        """Run tasks until `frame_end` (a perf_counter time) minus the margin.
+
+        Returns the number of slices run.
+        """
+        tasks = self._tasks
+        deadline = self.deadline
+        deadline.end = frame_end - self.margin
+        ran = 0
+        forced = False
+        while tasks:
+            task = tasks[0]
+            if task.cancelled:
+                tasks.popleft()
+                continue
+
+            now = time.perf_counter()
+            overdue = task.timeout_at is not None and now >= task.timeout_at
+            if now >= deadline.end:
+                # Out of idle time: only an overdue task may run, once per frame
+                if not overdue or forced:
+                    break
+                forced = True
+                self.forced += 1
+
+            deadline.did_timeout = overdue
+            ran += 1
+            if self._step(task):
+                task.done = True
+                tasks.popleft()
+        self.slices += ran
+        return ran
+
+    def _step(self, task):
+        """Run one slice of `task`; return True when it is finished."""
+        try:
+            if task.steps is None:
+                result = task.callback(self.deadline)
+                if not inspect.isgenerator(result):
+                    return True
+                task.steps = result
+            next(task.steps)
+            return False
+        except StopIteration:
+            return True
+        except Exception as e:
+            print(f"Idle task {task.callback!r} failed: {e}")
+            return True
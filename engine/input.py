@@ -0,0 +1,82 @@
+"""
+Step Into My Shoes - Input Layer
+Filters, coalesces and dispatches pygame events for the engine loop.
+
+Each scene lists the event types it handles in `event_types`. Everything
+else is blocked in SDL's queue with pygame.event.set_blocked, so floods of
+unused events (mouse motion, window and text events) never reach Python.
+Motion events a scene does want are merged into one per frame.
+"""
+
+import pygame
+
+# Events the engine itself needs no matter which scene is active
+# (quit, window resizing, F11 fullscreen toggle, F9 cache report, F10 metrics)
+ENGINE_EVENTS = frozenset((pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN))
+
+
+class InputCounters:
+    """Running totals of what happened to incoming events."""
+
+    def __init__(self):
+        self.received = 0    # events pulled from the queue
+        self.dispatched = 0  # events handed to a scene
+        self.coalesced = 0   # motion events merged into a later one
+        self.dropped = 0     # events no one subscribed to
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class InputRouter:
+    """Per-scene event filtering and motion coalescing."""
+
+    def __init__(self):
+        self.counters = InputCounters()
+        self.subscribed = frozenset()
+        self._configured_for = None
+
+    def configure(self, scene):
+        """Allow only the engine's and `scene`'s event types into the queue."""
+        if scene is self._configured_for:
+            return
+        self._configured_for = scene
+        self.subscribed = frozenset(scene.event_types)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(ENGINE_EVENTS | self.subscribed))
+
+    def poll(self):
+        """Return this frame's events with mouse motion merged into one."""
+        events = pygame.event.get()
+        counters = self.counters
+        counters.received += len(events)
+
+        # Keep only the latest motion event, carrying the summed movement
+        result = []
+        motion_index = None
+        rel_x = rel_y = 0
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+                if motion_index is not None:
+                    result[motion_index] = None
+                    counters.coalesced += 1
+                motion_index = len(result)
+            result.append(event)
+
+        if motion_index is None:
+            return result
+        last = result[motion_index]
+        if (rel_x, rel_y) != tuple(last.rel):
+            result[motion_index] = pygame.event.Event(
+                pygame.MOUSEMOTION, pos=last.pos, rel=(rel_x, rel_y), buttons=last.buttons)
+        return [event for event in result if event is not None]
+
+    def wants(self, event):
+        """True if the active scene subscribed to this event's type."""
+        if event.type in self.subscribed:
+            self.counters.dispatched += 1
+            return True
+        self.counters.dropped += 1
+        return False
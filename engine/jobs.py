@@ -0,0 +1,261 @@
+"""
+Step Into My Shoes - Background Jobs
+A small worker pool for work that shouldn't stall the frame: story
+generation, content loading, encoding, flushing logs.
+
+Jobs run on worker threads and must not touch pygame display objects.
+Their results come back on the main thread: the engine loop calls
+`JobSystem.pump()` once per frame, right after input, and that is where
+`on_done` callbacks run. Callbacks may create surfaces or switch scenes.
+
+    job = scene_manager.jobs.submit(generate_backstory, "Doctor",
+                                    on_done=lambda job: show(job.result()))
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+# Priorities: lower runs first
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 64
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class CancelledError(Exception):
+    """Raised by Job.result() for a job that was cancelled."""
+
+
+class QueueFull(Exception):
+    """Raised by JobSystem.submit() when the queue is at capacity."""
+
+
+class Job:
+    """A unit of background work and its eventual result (a future)."""
+
+    def __init__(self, fn, args, kwargs, priority, on_done, lock):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.on_done = on_done
+        self.status = PENDING
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self._result = None
+        self._error = None
+        self._finished = threading.Event()
+        self._lock = lock  # the pool's lock; guards PENDING -> RUNNING/CANCELLED
+
+    def cancel(self):
+        """Cancel the job if it hasn't started; return True if cancelled."""
+        with self._lock:
+            return self._cancel()
+
+    def _cancel(self):
+        if self.status != PENDING:
+            return self.status == CANCELLED
+        self.status = CANCELLED
+        self._finished.set()
+        return True
+
+    def cancelled(self):
+        return self.status == CANCELLED
+
+    def done(self):
+        """True once the job has finished, failed or been cancelled."""
+        return self._finished.is_set()
+
+    def result(self, timeout=None):
+        """Return the job's result, waiting up to `timeout` seconds.
+
+        Re-raises the job's exception if it failed. Avoid waiting on the
+        main thread; use `on_done` instead.
+        """
+        if not self._finished.wait(timeout):
+            raise TimeoutError("Job did not finish in time")
+        if self.status == CANCELLED:
+            raise CancelledError()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def exception(self):
+        """The exception the job raised, or None."""
+        return self._error
+
+    def _run(self):
+        self.started_at = time.perf_counter()
+        try:
+            self._result = self.fn(*self.args, **self.kwargs)
+            self.status = DONE
+        except Exception as e:
+            self._error = e
+            self.status = FAILED
+        self.finished_at = time.perf_counter()
+        self._finished.set()
+
+    def __repr__(self):
+        name = getattr(self.fn, "__name__", repr(self.fn))
+        return f"Job({name}, {self.status})"
+
+
+class JobCounters:
+    """Running totals and latencies (milliseconds) for a JobSystem."""
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0      # submits refused because the queue was full
+        self.queue_depth = 0   # jobs waiting for a worker right now
+        self.peak_depth = 0
+        self.wait_ms = 0.0     # summed time jobs spent queued
+        self.run_ms = 0.0      # summed time jobs spent running
+        self.max_wait_ms = 0.0
+        self.max_run_ms = 0.0
+        self.handoff_ms = 0.0  # summed time from finishing to the main-thread pump
+
+    def average_wait_ms(self):
+        finished = self.completed + self.failed
+        return self.wait_ms / finished if finished else 0.0
+
+    def average_run_ms(self):
+        finished = self.completed + self.failed
+        return self.run_ms / finished if finished else 0.0
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class JobSystem:
+    """A bounded pool of worker threads with a priority queue.
+
+    Workers start on the first submit, so a JobSystem that is never used
+    costs nothing. At most `max_queue` jobs may wait at once.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.counters = JobCounters()
+        self._heap = []
+        self._order = itertools.count()  # FIFO among equal priorities
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._finished = deque()  # jobs waiting for pump(); appended by workers
+        self._threads = []
+        self._stopping = False
+
+    def submit(self, fn, *args, priority=NORMAL, on_done=None, **kwargs):
+        """Queue `fn(*args, **kwargs)` and return its Job.
+
+        `on_done(job)` is called on the main thread, from pump(), once the
+        job has finished or failed (not if it was cancelled).
+        """
+        job = Job(fn, args, kwargs, priority, on_done, self._lock)
+        counters = self.counters
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError("JobSystem has been shut down")
+            if counters.queue_depth >= self.max_queue:
+                counters.rejected += 1
+                raise QueueFull(f"{counters.queue_depth} jobs already queued")
+            heapq.heappush(self._heap, (priority, next(self._order), job))
+            counters.submitted += 1
+            counters.queue_depth += 1
+            counters.peak_depth = max(counters.peak_depth, counters.queue_depth)
+            self._wakeup.notify()
+        if len(self._threads) < self.workers:
+            self._start_worker()
+        return job
+
+    def _start_worker(self):
+        thread = threading.Thread(target=self._work, daemon=True,
+                                  name=f"engine-job-{len(self._threads)}")
+        self._threads.append(thread)
+        thread.start()
+
+    def _work(self):
+        counters = self.counters
+        while True:
+            with self._lock:
+                while not self._heap and not self._stopping:
+                    self._wakeup.wait()
+                if self._stopping:
+                    return
+                job = heapq.heappop(self._heap)[2]
+                counters.queue_depth -= 1
+                if job.status == CANCELLED:
+                    counters.cancelled += 1
+                    continue
+                job.status = RUNNING
+
+            job._run()
+
+            with self._lock:
+                wait_ms = (job.started_at - job.submitted_at) * 1000.0
+                run_ms = (job.finished_at - job.started_at) * 1000.0
+                counters.wait_ms += wait_ms
+                counters.run_ms += run_ms
+                counters.max_wait_ms = max(counters.max_wait_ms, wait_ms)
+                counters.max_run_ms = max(counters.max_run_ms, run_ms)
+                if job.status == FAILED:
+                    counters.failed += 1
+                else:
+                    counters.completed += 1
+            self._finished.append(job)
+
+    def pump(self, budget_ms=None):
+        """Run `on_done` callbacks for finished jobs (main thread only).
+
+        With `budget_ms`, stops once that much time has been spent and
+        leaves the rest for the next frame. Returns the number handed off.
+        """
+        finished = self._finished
+        if not finished:
+            return 0
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000.0 if budget_ms is not None else None
+        handed = 0
+        while finished:
+            job = finished.popleft()
+            now = time.perf_counter()
+            self.counters.handoff_ms += (now - job.finished_at) * 1000.0
+            handed += 1
+            if job.on_done is not None:
+                try:
+                    job.on_done(job)
+                except Exception as e:
+                    print(f"Job callback for {job!r} failed: {e}")
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return handed
+
+    def pending(self):
+        """Number of jobs queued or finished but not yet handed off."""
+        return self.counters.queue_depth + len(self._finished)
+
+    def shutdown(self):
+        """Cancel queued jobs and stop the workers after their current job."""
+        with self._lock:
+            self._stopping = True
+            for _, _, job in self._heap:
+                job._cancel()
+                self.counters.cancelled += 1
+            self._heap.clear()
+            self.counters.queue_depth = 0
+            self._wakeup.notify_all()
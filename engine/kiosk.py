@@ -0,0 +1,177 @@
+"""
+Step Into My Shoes - Kiosk Mode
+Memory watchdog for unattended all-day runs (career fairs, open days).
+
+Every `sample_seconds` the watchdog samples the process's resident memory
+(RSS) and the number of blocks the Python allocator holds, and appends
+them to a log together with the current scene. Both are cheap to read, so
+sampling never stalls a frame. The log is a growth curve, where a leak
+shows as a steady climb across repeated play sessions.
+
+Once RSS has grown more than `max_growth_mb` past its baseline, a soft
+reset is due: every scene is closed, the render caches are emptied and a
+fresh home scene is shown, all without restarting the process. It waits
+until nobody is mid-session, that is until the stack is back at the home
+scene or there has been no input for `idle_seconds`.
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from engine import cache
+
+DEFAULT_MAX_GROWTH_MB = 256
+DEFAULT_LOG = "kiosk_memory.log"
+# Seconds between memory samples
+DEFAULT_SAMPLE_SECONDS = 30
+# Seconds without input after which a due reset may interrupt a session
+DEFAULT_IDLE_SECONDS = 120
+
+# Samples kept in memory for inspection (the log file has all of them)
+HISTORY = 512
+
+
+def rss_bytes():
+    """Resident memory of this process in bytes, or None if unknown."""
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        return psutil.Process().memory_info().rss
+
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return None
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t),
+                        ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t),
+                        ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters),
+                                                    counters.cb):
+            return counters.WorkingSetSize
+    return None
+
+
+class MemorySample:
+    """Memory use at one point in the run."""
+
+    __slots__ = ("seconds", "scene", "rss", "blocks")
+
+    def __init__(self, seconds, scene, rss, blocks):
+        self.seconds = seconds  # since the watchdog started
+        self.scene = scene
+        self.rss = rss          # bytes, or None where it can't be measured
+        self.blocks = blocks    # blocks held by the Python allocator
+
+
+class MemoryWatchdog:
+    """Samples memory on a timer and soft-resets on growth.
+
+    `home` is a callable returning a fresh scene to reset to. Where RSS
+    can't be measured, growth in allocated blocks is logged but no reset
+    is ever made.
+    """
+
+    def __init__(self, home, max_growth_mb=DEFAULT_MAX_GROWTH_MB, log_path=DEFAULT_LOG,
+                 sample_seconds=DEFAULT_SAMPLE_SECONDS, idle_seconds=DEFAULT_IDLE_SECONDS):
+        self.home = home
+        self.max_growth = max_growth_mb * 1024 * 1024
+        self.log_path = log_path
+        self.sample_seconds = sample_seconds
+        self.idle_seconds = idle_seconds
+        self.samples = deque(maxlen=HISTORY)
+        self.baseline = None
+        self.resets = 0
+        self.reset_due = False
+        self._start = time.perf_counter()
+        self._next_sample = self._start
+        self._last_input = self._start
+        self._dispatched = 0
+        self._log("seconds\tscene\trss_mb\tblocks\tgrowth_mb")
+
+    def attach(self, scene_manager):
+        scene_manager.frame_hooks.append(self.on_frame)
+
+    def sample(self, scene_manager):
+        """Record memory use now."""
+        scene = scene_manager.current_scene
+        sample = MemorySample(time.perf_counter() - self._start,
+                              type(scene).__name__ if scene is not None else "-",
+                              rss_bytes(), sys.getallocatedblocks())
+        self.samples.append(sample)
+        return sample
+
+    def growth(self, sample):
+        """Bytes of RSS gained since the baseline (0 if unknown)."""
+        if self.baseline is None or sample.rss is None or self.baseline.rss is None:
+            return 0
+        return sample.rss - self.baseline.rss
+
+    def check(self, scene_manager):
+        """Take a sample, log it and note whether a reset is due."""
+        sample = self.sample(scene_manager)
+        if self.baseline is None:
+            self.baseline = sample
+        growth = self.growth(sample)
+        rss_mb = f"{sample.rss / 1048576:.1f}" if sample.rss is not None else "?"
+        self._log(f"{sample.seconds:.1f}\t{sample.scene}\t{rss_mb}\t{sample.blocks}"
+                  f"\t{growth / 1048576:.1f}")
+        if growth > self.max_growth:
+            self.reset_due = True
+
+    def on_frame(self, scene_manager, stats):
+        now = time.perf_counter()
+        dispatched = scene_manager.input.counters.dispatched
+        if dispatched != self._dispatched:
+            self._dispatched = dispatched
+            self._last_input = now
+
+        if now >= self._next_sample:
+            self._next_sample = now + self.sample_seconds
+            self.check(scene_manager)
+
+        # Never pull a student out of a session they are playing
+        if self.reset_due and (len(scene_manager.stack) <= 1
+                               or now - self._last_input >= self.idle_seconds):
+            self.reset(scene_manager)
+
+    def reset(self, scene_manager):
+        """Close every scene, drop the caches and start again from home."""
+        self.reset_due = False
+        self.resets += 1
+        self._log(f"# soft reset {self.resets}")
+        cache.manager.clear()
+        # Memory the allocator keeps rarely goes back to the OS, so measure
+        # further growth from the first sample after the reset
+        self.baseline = None
+        self._next_sample = time.perf_counter()
+        scene_manager.reset(self.home())
+
+    def _log(self, line):
+        if self.log_path is None:
+            return
+        try:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
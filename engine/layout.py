@@ -0,0 +1,93 @@
+"""
+Step Into My Shoes - Responsive Layout
+Anchored, relative rects that are resolved once per window size and cached.
+"""
+
+import pygame
+
+# ============================================================================
+# DESIGN RESOLUTION
+# ============================================================================
+
+# Single source of truth for the size every screen was designed at
+DESIGN_WIDTH = 900
+DESIGN_HEIGHT = 600
+DESIGN_SIZE = (DESIGN_WIDTH, DESIGN_HEIGHT)
+
+# ============================================================================
+# ANCHORS
+# ============================================================================
+
+# Anchor points as (x, y) fractions of the window
+TOP_LEFT = (0.0, 0.0)
+TOP = (0.5, 0.0)
+TOP_RIGHT = (1.0, 0.0)
+LEFT = (0.0, 0.5)
+CENTER = (0.5, 0.5)
+RIGHT = (1.0, 0.5)
+BOTTOM_LEFT = (0.0, 1.0)
+BOTTOM = (0.5, 1.0)
+BOTTOM_RIGHT = (1.0, 1.0)
+
+
+class RelRect:
+    """A rect positioned relative to an anchor point of the window.
+
+    Sizes are pixels when given as ints, fractions of the window when given
+    as floats, and "window size minus N pixels" when given as negative ints.
+    The rect's own `pivot` point (defaults to the anchor) is placed at the
+    anchor plus `offset`. A zero-size RelRect works as an anchored point.
+    """
+
+    def __init__(self, anchor=TOP_LEFT, offset=(0, 0), size=(0, 0), pivot=None):
+        self.anchor = anchor
+        self.offset = offset
+        self.size = size
+        self.pivot = pivot if pivot is not None else anchor
+
+    @staticmethod
+    def _length(value, total):
+        if isinstance(value, float):
+            return int(total * value)
+        if value < 0:
+            return total + value
+        return value
+
+    def resolve(self, window_size):
+        """Return the absolute pygame.Rect for `window_size`."""
+        window_w, window_h = window_size
+        width = self._length(self.size[0], window_w)
+        height = self._length(self.size[1], window_h)
+        anchor_x = window_w * self.anchor[0] + self.offset[0]
+        anchor_y = window_h * self.anchor[1] + self.offset[1]
+        return pygame.Rect(int(anchor_x - width * self.pivot[0]),
+                           int(anchor_y - height * self.pivot[1]),
+                           width, height)
+
+
+class Layout:
+    """A named set of RelRects resolved together.
+
+    Resolution happens only when `resolve` is called with a new window size
+    (i.e. on VIDEORESIZE); results are cached per size, so toggling between
+    windowed and fullscreen never recomputes anything.
+    """
+
+    def __init__(self, **specs):
+        self.specs = specs
+        self.size = None
+        self.rects = {}
+        self._cache = {}
+
+    def resolve(self, window_size):
+        size = tuple(window_size)
+        rects = self._cache.get(size)
+        if rects is None:
+            rects = {name: spec.resolve(size) for name, spec in self.specs.items()}
+            self._cache[size] = rects
+        self.size = size
+        self.rects = rects
+        return rects
+
+    def __getitem__(self, name):
+        return self.rects[name]
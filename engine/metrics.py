@@ -0,0 +1,226 @@
+"""
+Step Into My Shoes - Metrics
+Counters, gauges and timers cheap enough to leave on in production.
+
+    frames = metrics.counter("frames")
+    frame_ms = metrics.timer("frame_ms")
+
+    if metrics.enabled:
+        frames.add()
+        frame_ms.record(stats.frame_ms())
+
+Instrumented code checks the module's `enabled` flag first, so a disabled
+build pays one attribute test per instrumented spot. Timers keep their
+latest TIMER_WINDOW samples in a preallocated ring buffer, so recording
+never allocates. Figures that other parts of the engine already count
+(cache hits, input events, queued jobs, live particles) are not
+re-counted on the hot path: collectors read them when a snapshot is
+taken; every cache registered through engine.cache gets its gauges as
+it is registered.
+
+snapshot() returns every metric as a plain dict; report() formats it and
+F10 prints it in game.
+"""
+
+import time
+import weakref
+from array import array
+
+# Samples a timer keeps for its percentiles
+TIMER_WINDOW = 600
+
+enabled = False
+
+
+class Counter:
+    """A running total."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+
+    def add(self, amount=1):
+        self.value += amount
+
+    def read(self):
+        return self.value
+
+    def reset(self):
+        self.value = 0
+
+
+class Gauge:
+    """A current value, either set directly or read from `fn` on snapshot."""
+
+    __slots__ = ("name", "value", "fn")
+
+    def __init__(self, name, fn=None):
+        self.name = name
+        self.value = 0
+        self.fn = fn
+
+    def set(self, value):
+        self.value = value
+
+    def read(self):
+        return self.fn() if self.fn is not None else self.value
+
+    def reset(self):
+        self.value = 0
+
+
+class Timer:
+    """Durations in milliseconds, the latest `window` kept in a ring buffer."""
+
+    __slots__ = ("name", "samples", "window", "index", "count", "total")
+
+    def __init__(self, name, window=TIMER_WINDOW):
+        self.name = name
+        self.samples = array("d", bytes(8 * window))
+        self.window = window
+        self.index = 0
+        self.count = 0    # samples ever recorded
+        self.total = 0.0  # their sum
+
+    def record(self, ms):
+        self.samples[self.index] = ms
+        self.index += 1
+        if self.index == self.window:
+            self.index = 0
+        self.count += 1
+        self.total += ms
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def time(self):
+        """Context manager recording how long its block took."""
+        return _Timing(self)
+
+    def read(self):
+        """Count and mean overall; percentiles and max over the window."""
+        n = min(self.count, self.window)
+        if not n:
+            return {"count": 0}
+        window = sorted(self.samples[:n])
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "p50": window[n // 2],
+            "p95": window[min(n - 1, n * 95 // 100)],
+            "max": window[-1],
+        }
+
+
+class _Timing:
+    __slots__ = ("timer", "start")
+
+    def __init__(self, timer):
+        self.timer = timer
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.record((time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+_metrics = {}
+
+
+def _get(kind, name, *args):
+    metric = _metrics.get(name)
+    if metric is None:
+        metric = _metrics[name] = kind(name, *args)
+    elif not isinstance(metric, kind):
+        raise ValueError(f"Metric {name!r} is a {type(metric).__name__}")
+    return metric
+
+
+def counter(name):
+    """The counter called `name`, created on first use."""
+    return _get(Counter, name)
+
+
+def gauge(name, fn=None):
+    """The gauge called `name`; with `fn`, its value is read from fn()."""
+    metric = _get(Gauge, name)
+    if fn is not None:
+        metric.fn = fn
+    return metric
+
+
+def timer(name, window=TIMER_WINDOW):
+    return _get(Timer, name, window)
+
+
+def snapshot():
+    """Every metric's current value by name (timers as dicts)."""
+    return {name: metric.read() for name, metric in sorted(_metrics.items())}
+
+
+def report():
+    """Human-readable snapshot."""
+    lines = ["Metrics:"]
+    for name, value in snapshot().items():
+        if isinstance(value, dict):
+            if value["count"]:
+                value = (f"n={value['count']} mean={value['mean']:.2f} p50={value['p50']:.2f} "
+                         f"p95={value['p95']:.2f} max={value['max']:.2f} ms")
+            else:
+                value = "n=0"
+        elif isinstance(value, float):
+            value = f"{value:.2f}"
+        lines.append(f"  {name:<28} {value}")
+    return "\n".join(lines)
+
+
+def reset():
+    """Zero every metric (mainly for tests and benchmarks).
+
+    Metrics are zeroed in place, not forgotten, since instrumented modules
+    keep the handles they looked up at import.
+    """
+    for metric in _metrics.values():
+        metric.reset()
+
+
+# ============================================================================
+# ENGINE INSTRUMENTATION
+# ============================================================================
+
+def enable(scene_manager=None):
+    """Turn metrics on and register the engine's collectors."""
+    global enabled
+    from engine import states, ui
+
+    enabled = True
+    if _record_state_time not in states.transition_hooks:
+        states.transition_hooks.append(_record_state_time)
+
+    gauge("particles.alive", ui.ParticleSystem.alive)
+
+    if scene_manager is not None:
+        ref = weakref.ref(scene_manager)
+        gauge("input.events", lambda: ref().input.counters.received if ref() else 0)
+        gauge("input.dispatched", lambda: ref().input.counters.dispatched if ref() else 0)
+        gauge("jobs.pending", lambda: ref().jobs.pending() if ref() else 0)
+        gauge("idle.tasks", lambda: len(ref().idle) if ref() else 0)
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def _record_state_time(machine, previous, name):
+    """Time spent in the state a world just left."""
+    if enabled:
+        timer(f"state.{type(machine.owner).__name__}.{previous}").record(
+            machine.last_duration * 1000.0)
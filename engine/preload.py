@@ -0,0 +1,84 @@
+"""
+Step Into My Shoes - Scene Preloading
+Builds the next scene in small slices of idle frame time.
+
+Loading is done on the main thread, a few milliseconds per frame, because
+pygame fonts and surfaces are not safe to create from worker threads.
+"""
+
+import time
+import inspect
+import pygame
+from engine.layout import DESIGN_SIZE
+
+# Default time per frame handed to a preloader, in milliseconds
+PRELOAD_BUDGET_MS = 4.0
+
+
+class Preloader:
+    """Incrementally build a scene while the current one keeps animating.
+
+    `factory` returns either the finished scene or a generator that yields
+    between units of work and returns the scene at the end. Call `step()`
+    once per frame; `get()` finishes any remaining work immediately.
+    """
+
+    def __init__(self, factory, budget_ms=PRELOAD_BUDGET_MS):
+        self.factory = factory
+        self.budget = budget_ms / 1000.0
+        self.result = None
+        self.done = False
+        self.elapsed = 0.0  # seconds spent loading, summed over all slices
+        self._steps = None
+
+    def step(self, budget=None):
+        """Advance loading for up to `budget` seconds; return True when done."""
+        if self.done:
+            return True
+
+        start = time.perf_counter()
+        deadline = start + (self.budget if budget is None else budget)
+        try:
+            if self._steps is None:
+                made = self.factory()
+                if not inspect.isgenerator(made):
+                    self._finish(made)
+                    return True
+                self._steps = made
+            while time.perf_counter() < deadline:
+                next(self._steps)
+        except StopIteration as stop:
+            self._finish(stop.value)
+        finally:
+            self.elapsed += time.perf_counter() - start
+        return self.done
+
+    def get(self):
+        """Return the loaded scene, finishing the work synchronously if needed."""
+        while not self.step(budget=float("inf")):
+            pass
+        return self.result
+
+    def _finish(self, result):
+        self.result = result
+        self.done = True
+        self._steps = None
+
+
+def build_world(world_class, *args, **kwargs):
+    """Preload generator for a career world.
+
+    Constructs the world, then draws its intro and first gameplay frame to
+    an offscreen surface so fonts, text surfaces and pre-rendered layers are
+    already cached when the world is shown.
+    """
+    world = world_class(*args, **kwargs)
+    yield
+
+    surface = pygame.Surface(DESIGN_SIZE)
+    world.draw(surface)
+    yield
+
+    # Draw the gameplay state directly, without running its enter/exit hooks
+    world.states.draw(surface, "gameplay")
+    return world
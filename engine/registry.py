@@ -0,0 +1,117 @@
+"""
+Step Into My Shoes - Career Registry
+Career metadata known up front; world modules imported only when chosen.
+
+Built-in careers are registered below. Third-party packages can add
+careers through the "stepintomyshoes.careers" entry point group. Each
+entry point should resolve to a Career (or a callable returning one)
+defined in a lightweight module, with its world given as a
+"module:Class" path so the world itself stays unimported until selected:
+
+    [project.entry-points."stepintomyshoes.careers"]
+    chef = "chef_career.meta:CAREER"
+"""
+
+import importlib
+import sys
+from engine.colors import (
+    DOCTOR_PRIMARY, LAWYER_PRIMARY, INFLUENCER_PRIMARY,
+    POLITICIAN_PRIMARY, ENGINEER_PRIMARY
+)
+
+ENTRY_POINT_GROUP = "stepintomyshoes.careers"
+
+
+def _import_path(path):
+    """Import and return the object at a "package.module:Name" path."""
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class Career:
+    """Metadata for one career plus lazy references to its worlds."""
+
+    def __init__(self, name, icon, tagline, color, world, world_3d=None, available=True):
+        self.name = name
+        self.icon = icon
+        self.tagline = tagline
+        self.color = color
+        self.world = world        # "module:Class" of the 2D world
+        self.world_3d = world_3d  # "module:Class" of the 3D world, if any
+        self.available = available
+        self._world_class = None
+
+    def load(self):
+        """Import the world module (first call only) and return the class."""
+        if self._world_class is None:
+            self._world_class = _import_path(self.world)
+        return self._world_class
+
+    def load_3d(self):
+        """Import and return the 3D world class, or None if there is none."""
+        return _import_path(self.world_3d) if self.world_3d else None
+
+    def __repr__(self):
+        return f"Career({self.name!r}, world={self.world!r})"
+
+
+# Registered careers in menu order
+_CAREERS = {}
+_plugins_loaded = False
+
+
+def register(career):
+    """Add (or replace) a career in the registry."""
+    _CAREERS[career.name] = career
+    return career
+
+
+def get(name):
+    """Return the career called `name`."""
+    _load_plugins()
+    return _CAREERS[name]
+
+
+def careers():
+    """All registered careers, built-ins first, in registration order."""
+    _load_plugins()
+    return list(_CAREERS.values())
+
+
+def _load_plugins():
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    from importlib import metadata  # slow to import; only needed here
+    if sys.version_info >= (3, 10):
+        entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+    else:
+        # 3.8 and 3.9 return a dict of every group
+        entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+    for entry_point in entry_points:
+        try:
+            career = entry_point.load()
+            if callable(career) and not isinstance(career, Career):
+                career = career()
+            register(career)
+        except Exception as e:
+            print(f"Skipping career plugin {entry_point.name!r}: {e}")
+
+
+# ============================================================================
+# BUILT-IN CAREERS
+# ============================================================================
+
+register(Career("Doctor", "⚕", "Save lives under pressure", DOCTOR_PRIMARY,
+                "worlds.doctor:DoctorWorld", "worlds.doctor_ursina_3d:Doctor3DWorld"))
+register(Career("Lawyer", "⚖", "Find truth in testimony", LAWYER_PRIMARY,
+                "worlds.lawyer:LawyerWorld", "worlds.lawyer_ursina_3d:Lawyer3DWorld"))
+register(Career("Influencer", "★", "Create viral content", INFLUENCER_PRIMARY,
+                "worlds.influencer:InfluencerWorld",
+                "worlds.influencer_ursina_3d:Influencer3DWorld"))
+register(Career("Politician", "⬢", "Lead with wisdom", POLITICIAN_PRIMARY,
+                "worlds.politician:PoliticianWorld",
+                "worlds.politician_ursina_3d:Politician3DWorld"))
+register(Career("Engineer", "⚙", "Build the future", ENGINEER_PRIMARY,
+                "worlds.engineer:EngineerWorld", "worlds.engineer_ursina_3d:Engineer3DWorld"))
@@ -0,0 +1,104 @@
+"""
+Step Into My Shoes - World State Machine
+Table-driven dispatch for a world's screens (intro, gameplay, results, ...).
+
+A world lists its state names in STATES. For each state the machine looks
+up optional methods on the world by name:
+
+    enter_<state>()        when the state becomes current
+    exit_<state>()         when it stops being current
+    update_<state>(dt)     every simulation step
+    draw_<state>(screen)   every rendered frame
+    click_<state>(event)   mouse button presses
+    key_<state>(event)     key presses
+
+The table is built once, so dispatching costs a dict lookup instead of an
+if-chain of string comparisons. enter_<state> is the place for work that
+should happen once per visit: layouts, results, overlays.
+"""
+
+import time
+
+HOOKS = ("enter", "exit", "update", "draw", "click", "key")
+
+# Callables run after any machine changes state, as hook(machine, previous, name);
+# for development tools and metrics
+transition_hooks = []
+
+
+class State:
+    """One state's bound handlers (None where the owner defines none)."""
+
+    __slots__ = ("name",) + HOOKS
+
+    def __init__(self, owner, name):
+        self.name = name
+        for hook in HOOKS:
+            setattr(self, hook, getattr(owner, f"{hook}_{name}", None))
+
+    def __repr__(self):
+        return f"State({self.name!r})"
+
+
+class StateMachine:
+    """Current state of `owner` plus dispatch to its per-state handlers.
+
+    The initial state is current from the start; its enter hook is not
+    called, since the owner is usually still being constructed.
+    """
+
+    def __init__(self, owner, names, initial):
+        self.owner = owner
+        self.table = {name: State(owner, name) for name in names}
+        if initial not in self.table:
+            raise ValueError(f"Unknown state {initial!r}")
+        self.current = self.table[initial]
+        self.name = initial
+        self.entered_at = time.perf_counter()  # when the current state became current
+        self.last_duration = 0.0  # seconds the previous state was current
+
+    def transition(self, name):
+        """Make `name` current, running exit and enter hooks.
+
+        Switching to the state that is already current does nothing.
+        """
+        if name == self.name:
+            return
+        state = self.table.get(name)
+        if state is None:
+            raise ValueError(f"Unknown state {name!r}")
+
+        previous = self.current
+        if previous.exit is not None:
+            previous.exit()
+        # The new state's time starts before its enter hook runs
+        now = time.perf_counter()
+        self.last_duration = now - self.entered_at
+        self.entered_at = now
+        self.current = state
+        self.name = name
+        if state.enter is not None:
+            state.enter()
+        for hook in transition_hooks:
+            hook(self, previous.name, name)
+
+    def update(self, dt):
+        handler = self.current.update
+        if handler is not None:
+            handler(dt)
+
+    def draw(self, screen, name=None):
+        """Draw the current state, or the state called `name`."""
+        handler = (self.current if name is None else self.table[name]).draw
+        if handler is not None:
+            handler(screen)
+
+    def click(self, event):
+        handler = self.current.click
+        if handler is not None:
+            handler(event)
+
+    def key(self, event):
+        handler = self.current.key
+        if handler is not None:
+            handler(event)
@@ -5,13 +5,159 @@ Modern, polished UI components for the career simulation game.
 
 import pygame
 import math
+import time
+import weakref
 from engine.colors import (
     WHITE, BLACK, GREY, PRIMARY, PRIMARY_LIGHT, SECONDARY,
     ACCENT, DANGER, BACKGROUND, CARD_BG, CARD_BG_HOVER,
     TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, SUCCESS
 )
+from engine.display import get_mouse_pos
+from engine.core import get_render_alpha
+from engine import bootstrap
+from engine import cache
+from engine import diskcache
+from engine import metrics
+
+# ============================================================================
+# RENDER CACHES
+# ============================================================================
+
+# Number of quantized scale frames pre-rendered per widget state
+SCALE_FRAME_STEPS = 5
+
+# Entry caps for the text caches; their memory counts against the
+# engine-wide cache budget (engine/cache.py)
+TEXT_CACHE_SIZE = 1024
+WRAP_CACHE_SIZE = 128
+
+# Rough memory per loaded font (FreeType face plus its glyph cache)
+FONT_BYTES = 128 * 1024
+
+_FONT_CACHE = cache.register("font", sizeof=lambda font: FONT_BYTES)
+_TEXT_CACHE = cache.register("text", sizeof=cache.surface_bytes, max_entries=TEXT_CACHE_SIZE)
+_WRAP_CACHE = cache.register("wrap", max_entries=WRAP_CACHE_SIZE)
+# Scale animation frames of buttons and cards (see ScaleFrames)
+_FRAME_CACHE = cache.register("frames", sizeof=cache.surface_bytes)
+
+# Pre-rendered text from a baked atlas (engine/atlas.py), by render_text key
+_ATLAS = {}
+# Set of keys newly rendered text is added to while an atlas bake records
+_text_recorder = None
+
+# Time to produce text missing from the memory cache (atlas, disk or font)
+_TEXT_MISS_MS = metrics.timer("ui.text_miss_ms")
+
+
+def get_font(font_name="arial", size=22, bold=False):
+    """Return a shared SysFont instance, creating it on first use."""
+    key = (font_name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        bootstrap.require("font")
+        font = _FONT_CACHE.put(key, pygame.font.SysFont(font_name, size, bold=bold))
+    return font
+
+
+def _static_text(text):
+    """Whether text is worth keeping on disk; digits nearly always mean a
+    live value (score, timer, count) that will never be drawn again."""
+    return not any(c.isdigit() for c in text)
+
+
+def render_text(text, size, color, font_name="arial", bold=False):
+    """Return a rendered text surface, reusing it while it stays in the LRU cache."""
+    key = (text, size, tuple(color), font_name, bold)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        started = time.perf_counter() if metrics.enabled else None
+        if _text_recorder is not None:
+            _text_recorder.add(key)
+        surf = _ATLAS.get(key)
+        if surf is None:
+            surf = diskcache.surface(
+                ("text",) + key,
+                lambda: get_font(font_name, size, bold).render(text, True, color),
+                ((font_name, bold),), store=_static_text(text))
+        _TEXT_CACHE.put(key, surf)
+        if started is not None:
+            _TEXT_MISS_MS.record((time.perf_counter() - started) * 1000.0)
+    return surf
+
+
+def wrap_text(text, size, max_width, font_name="arial"):
+    """Split `text` into lines no wider than `max_width` (cached)."""
+    key = (text, size, max_width, font_name)
+    lines = _WRAP_CACHE.get(key)
+    if lines is not None:
+        return lines
+    
+    font = get_font(font_name, size)
+    lines = []
+    current_line = []
+    
+    for word in text.split():
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+    
+    if current_line:
+        lines.append(' '.join(current_line))
+    
+    return _WRAP_CACHE.put(key, tuple(lines))
+
+
+class ScaleFrames:
+    """Pre-rendered frames for a hover scale animation.
+
+    `render(scale)` is called once per quantized step between `min_scale`
+    and `max_scale`; `nearest(scale)` then picks the closest frame so the
+    animation costs a single blit instead of a full re-raster. With a
+    `key` describing the look (and the `fonts` it uses), frames can come
+    from the disk cache instead, and widgets that look alike share them.
+
+    Frames live in the shared "frames" cache, so they count against the
+    cache budget; one that was evicted is rendered again when next needed.
+    """
+
+    def __init__(self, render, min_scale=1.0, max_scale=1.05, steps=SCALE_FRAME_STEPS,
+                 key=None, fonts=()):
+        self.render = render
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.steps = max(2, steps)
+        self.key = key
+        self.fonts = fonts
+        span = max_scale - min_scale
+        self.scales = [min_scale + span * i / (self.steps - 1) for i in range(self.steps)]
+        # Cache key prefix: the look plus the scales, or unique to this widget
+        self._id = ((key, min_scale, max_scale, self.steps) if key is not None
+                    else (object(),))
+        for index in range(self.steps):
+            self.frame(index)
+
+    def frame(self, index):
+        surf = _FRAME_CACHE.get(self._id + (index,))
+        if surf is None:
+            scale = self.scales[index]
+            if self.key is None:
+                surf = self.render(scale)
+            else:
+                surf = diskcache.surface(("frame",) + self.key + (scale,),
+                                         lambda: self.render(scale), self.fonts)
+            _FRAME_CACHE.put(self._id + (index,), surf)
+        return surf
+
+    def nearest(self, scale):
+        span = self.max_scale - self.min_scale
+        t = (scale - self.min_scale) / span if span else 0.0
+        index = int(round(t * (self.steps - 1)))
+        return self.frame(max(0, min(self.steps - 1, index)))
 
-pygame.font.init()
 
 # ============================================================================
 # CORE BUTTON CLASSES
@@ -28,7 +174,7 @@ class Button:
         self.width = width
         self.height = height
         self.text = text
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         self.text_color = text_color
         self.bg_color = bg_color
 
@@ -40,7 +186,7 @@ class Button:
         screen.blit(text_surf, text_rect)
 
     def is_hover(self):
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = get_mouse_pos()
         return self.rect.collidepoint(mouse_pos)
 
 
@@ -54,7 +200,8 @@ class ModernButton:
                  font_size=22,
                  disabled=False,
                  border_radius=12,
-                 selected_color=None):
+                 selected_color=None,
+                 prerender_frames=False):
         self.x = x
         self.y = y
         self.width = width
@@ -75,6 +222,66 @@ class ModernButton:
         # Selection state (set externally without mutating colors)
         self.selected = False
         self.selected_color = selected_color or hover_color
+
+        # Cached label surface, re-rendered only when text or color changes
+        self._label_key = None
+        self._label_surf = None
+
+        # Optional pre-rendered scale frames, one set per visual state
+        self.prerender_frames = prerender_frames
+        self._frames = None
+        if prerender_frames:
+            self._build_frames()
+
+    def rebind(self, text=None, x=None, y=None, width=None, height=None):
+        """Reuse this button for a new label and/or position.
+
+        Animation state is kept; only the label surface is re-rendered, and
+        pre-rendered frames are rebuilt only if the text or size changed.
+        """
+        restyled = False
+        if text is not None and text != self.text:
+            self.text = text
+            restyled = True
+        if x is not None:
+            self.x = x
+        if y is not None:
+            self.y = y
+        if width is not None and width != self.width:
+            self.width = width
+            restyled = True
+        if height is not None and height != self.height:
+            self.height = height
+            restyled = True
+        self.rect.update(self.x, self.y, self.width, self.height)
+        self.selected = False
+        if restyled and self.prerender_frames:
+            self._build_frames()
+
+    def restyle(self, primary_color=None, hover_color=None, text_color=None,
+                selected_color=None, font_size=None):
+        """Change colors or font size, re-rendering cached frames if enabled."""
+        if primary_color is not None:
+            self.primary_color = primary_color
+        if hover_color is not None:
+            self.hover_color = hover_color
+        if text_color is not None:
+            self.text_color = text_color
+        if selected_color is not None:
+            self.selected_color = selected_color
+        if font_size is not None:
+            self.font_size = font_size
+        if self.prerender_frames:
+            self._build_frames()
+
+    def get_label(self):
+        """Return the rendered label, re-rendering only when it changed."""
+        text_color = TEXT_MUTED if self.disabled else self.text_color
+        key = (self.text, text_color, self.font_size)
+        if key != self._label_key:
+            self._label_surf = render_text(self.text, self.font_size, text_color, bold=True)
+            self._label_key = key
+        return self._label_surf
     
     def update(self):
         """Smooth animation updates."""
@@ -82,7 +289,7 @@ class ModernButton:
 
         # Avoid calling `is_hover()` here to prevent recursion with `update()`.
         if not self.disabled:
-            mx, my = pygame.mouse.get_pos()
+            mx, my = get_mouse_pos()
             hovering = self.rect.collidepoint(mx, my)
             self.target_scale = 1.03 if hovering else 1.0
         else:
@@ -99,51 +306,85 @@ class ModernButton:
         scaled_y = self.y + (self.height - scaled_h) // 2
         return pygame.Rect(scaled_x, scaled_y, scaled_w, scaled_h)
     
-    def draw(self, surface):
-        """Draw the button with effects."""
-        self.update()
-        
-        # Calculate scaled dimensions
-        scaled_w = int(self.width * self.scale)
-        scaled_h = int(self.height * self.scale)
-        scaled_x = self.x + (self.width - scaled_w) // 2
-        scaled_y = self.y + (self.height - scaled_h) // 2
-        
+    def _visual_state(self):
+        """Return which of the four visual states the button is in."""
+        if self.disabled:
+            return "disabled"
+        if self.is_hover():
+            return "hover"
+        if getattr(self, "selected", False):
+            return "selected"
+        return "normal"
+
+    def _paint(self, surface, rect, state, label):
+        """Draw shadow, body, border and label for `state` at `rect`."""
         # Shadow
-        shadow_rect = pygame.Rect(scaled_x + 3, scaled_y + 3, scaled_w, scaled_h)
+        shadow_rect = rect.move(3, 3)
         pygame.draw.rect(surface, (0, 0, 0), shadow_rect, border_radius=self.border_radius)
         
         # Main button
-        rect = pygame.Rect(scaled_x, scaled_y, scaled_w, scaled_h)
-        
-        if self.disabled:
-            color = GREY
-        elif self.is_hover():
-            color = self.hover_color
-        elif getattr(self, "selected", False):
-            color = self.selected_color
-        else:
-            color = self.primary_color
-        
+        color = {
+            "disabled": GREY,
+            "hover": self.hover_color,
+            "selected": self.selected_color,
+        }.get(state, self.primary_color)
         pygame.draw.rect(surface, color, rect, border_radius=self.border_radius)
         
         # Border for depth
-        if not self.disabled and self.is_hover():
+        if state == "hover":
             pygame.draw.rect(surface, WHITE, rect, 2, border_radius=self.border_radius)
         
         # Text
-        font = pygame.font.SysFont("arial", self.font_size, bold=True)
-        text_color = TEXT_MUTED if self.disabled else self.text_color
-        text_surf = font.render(self.text, True, text_color)
-        text_rect = text_surf.get_rect(center=rect.center)
-        surface.blit(text_surf, text_rect)
+        text_rect = label.get_rect(center=rect.center)
+        surface.blit(label, text_rect)
+
+    def _build_frames(self):
+        """Pre-render quantized scale frames for every visual state."""
+        labels = {
+            "enabled": render_text(self.text, self.font_size, self.text_color, bold=True),
+            "disabled": render_text(self.text, self.font_size, TEXT_MUTED, bold=True),
+        }
+
+        def renderer(state):
+            label = labels["disabled" if state == "disabled" else "enabled"]
+
+            def render(scale):
+                w, h = int(self.width * scale), int(self.height * scale)
+                frame = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+                self._paint(frame, pygame.Rect(0, 0, w, h), state, label)
+                return frame
+            return render
+
+        look = ("button", self.text, self.width, self.height, self.font_size,
+                self.border_radius, tuple(self.primary_color), tuple(self.hover_color),
+                tuple(self.selected_color), tuple(self.text_color))
+        self._frames = {
+            state: ScaleFrames(renderer(state), 1.0, 1.03, key=look + (state,),
+                               fonts=(("arial", True),))
+            for state in ("normal", "hover", "selected", "disabled")
+        }
+    
+    def draw(self, surface):
+        """Draw the button with effects."""
+        self.update()
+        state = self._visual_state()
+
+        if self._frames is not None:
+            # Pick the nearest pre-rendered frame (size includes the shadow)
+            frame = self._frames[state].nearest(self.scale)
+            frame_w, frame_h = frame.get_width() - 3, frame.get_height() - 3
+            surface.blit(frame, (self.x + (self.width - frame_w) // 2,
+                                 self.y + (self.height - frame_h) // 2))
+            return
+        
+        self._paint(surface, self.get_scaled_rect(), state, self.get_label())
     
     def is_hover(self):
         # Use the drawn (possibly scaled) rect for hover detection
         if self.disabled:
             return False
         self.update()
-        mx, my = pygame.mouse.get_pos()
+        mx, my = get_mouse_pos()
         return self.get_scaled_rect().collidepoint(mx, my)
     
     def is_clicked(self, event):
@@ -153,7 +394,7 @@ class ModernButton:
             try:
                 ex, ey = event.pos
             except Exception:
-                ex, ey = pygame.mouse.get_pos()
+                ex, ey = get_mouse_pos()
             return self.get_scaled_rect().collidepoint(ex, ey) and not self.disabled
         return False
 
@@ -173,20 +414,50 @@ class IconButton(ModernButton):
         
         pygame.draw.rect(surface, color, rect, border_radius=self.border_radius)
         
-        font = pygame.font.SysFont("arial", self.font_size, bold=True)
+        font = get_font("arial", self.font_size, bold=True)
         icon_surf = font.render(self.icon, True, self.text_color)
         icon_rect = icon_surf.get_rect(center=rect.center)
         surface.blit(icon_surf, icon_rect)
 
 
+class WidgetPool:
+    """Recycles widgets instead of constructing new ones for every question.
+
+    `factory` builds a fresh widget when the pool needs to grow; existing
+    widgets are reused through their `rebind(**kwargs)` method.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.widgets = []
+
+    def bind(self, bindings):
+        """Rebind pooled widgets to `bindings` and return the active ones.
+
+        Each binding is a dict of keyword arguments for `rebind`.
+        """
+        count = 0
+        for binding in bindings:
+            if count == len(self.widgets):
+                self.widgets.append(self.factory())
+            self.widgets[count].rebind(**binding)
+            count += 1
+        return self.widgets[:count]
+
+
 # ============================================================================
 # CARD COMPONENTS
 # ============================================================================
 
+# Fonts a CareerCard draws with, as (name, bold)
+CARD_FONTS = (("segoeuisymbol", False), ("arial", True), ("arial", False))
+
+
 class CareerCard:
     """Visual card for career selection."""
     
-    def __init__(self, x, y, width, height, name, icon, color, available=True):
+    def __init__(self, x, y, width, height, name, icon, color, available=True,
+                 prerender_frames=False):
         self.rect = pygame.Rect(x, y, width, height)
         self.name = name
         self.icon = icon
@@ -197,28 +468,69 @@ class CareerCard:
         self.scale = 1.0
         self.target_scale = 1.0
         self.hover = False
+
+        # Static text is rendered once; scale frames optionally pre-rendered
+        self._render_labels()
+        self.prerender_frames = prerender_frames
+        self._frames = None
+        if prerender_frames:
+            self._build_frames()
+
+    def rebind(self, x=None, y=None):
+        """Move the card; cached renders are position-independent."""
+        self.rect.topleft = (self.rect.x if x is None else x,
+                             self.rect.y if y is None else y)
+
+    def restyle(self, color=None, available=None):
+        """Change the card color or availability and refresh cached renders."""
+        if color is not None:
+            self.color = color
+        if available is not None:
+            self.available = available
+        self._render_labels()
+        if self.prerender_frames:
+            self._build_frames()
+
+    def _render_labels(self):
+        # Fonts here must match CARD_FONTS
+        self._icon_surf = render_text(self.icon, 40, WHITE, "segoeuisymbol")
+        self._name_surf = render_text(self.name, 20, WHITE, bold=True)
+        self._status_surf = render_text("Coming Soon", 12, TEXT_MUTED)
+
+    def _build_frames(self):
+        """Pre-render quantized scale frames for the idle and hover looks."""
+        def renderer(hover):
+            def render(scale):
+                w, h = int(self.rect.width * scale), int(self.rect.height * scale)
+                frame = pygame.Surface((w + 4, h + 4), pygame.SRCALPHA)
+                self._paint(frame, pygame.Rect(0, 0, w, h), hover)
+                return frame
+            return render
+
+        look = ("card", self.name, self.icon, tuple(self.color), self.available,
+                self.rect.width, self.rect.height)
+        self._frames = {
+            hover: ScaleFrames(renderer(hover), 1.0, 1.05, key=look + (hover,),
+                               fonts=CARD_FONTS)
+            for hover in (False, True)
+        }
     
     def update(self):
         self.scale += (self.target_scale - self.scale) * 0.15
         self.target_scale = 1.05 if self.is_hover() and self.available else 1.0
     
     def is_hover(self):
-        mx, my = pygame.mouse.get_pos()
+        mx, my = get_mouse_pos()
         self.hover = self.rect.collidepoint(mx, my)
         return self.hover
     
-    def draw(self, surface):
-        self.update()
-        
-        # Scaled dimensions
-        scaled_w = int(self.rect.width * self.scale)
-        scaled_h = int(self.rect.height * self.scale)
-        scaled_x = self.rect.x + (self.rect.width - scaled_w) // 2
-        scaled_y = self.rect.y + (self.rect.height - scaled_h) // 2
-        scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_w, scaled_h)
-        
+    def _paint(self, surface, scaled_rect, hover):
+        """Draw the full card into `scaled_rect`."""
+        scaled_x, scaled_y = scaled_rect.topleft
+        scaled_w, scaled_h = scaled_rect.size
+
         # Shadow
-        shadow = pygame.Rect(scaled_x + 4, scaled_y + 4, scaled_w, scaled_h)
+        shadow = scaled_rect.move(4, 4)
         pygame.draw.rect(surface, (0, 0, 0), shadow, border_radius=16)
         
         # Card background
@@ -226,7 +538,7 @@ class CareerCard:
         pygame.draw.rect(surface, bg_color, scaled_rect, border_radius=16)
         
         # Hover border
-        if self.hover and self.available:
+        if hover and self.available:
             pygame.draw.rect(surface, self.color, scaled_rect, 3, border_radius=16)
         
         # Color bar at top
@@ -234,23 +546,37 @@ class CareerCard:
         pygame.draw.rect(surface, self.color, bar_rect, border_radius=10)
         
         # Icon
-        icon_font = pygame.font.SysFont("segoeuisymbol", 40)
-        icon_surf = icon_font.render(self.icon, True, WHITE)
-        icon_rect = icon_surf.get_rect(center=bar_rect.center)
-        surface.blit(icon_surf, icon_rect)
+        icon_rect = self._icon_surf.get_rect(center=bar_rect.center)
+        surface.blit(self._icon_surf, icon_rect)
         
         # Career name
-        name_font = pygame.font.SysFont("arial", 20, bold=True)
-        name_surf = name_font.render(self.name, True, WHITE)
-        name_rect = name_surf.get_rect(centerx=scaled_rect.centerx, top=scaled_y + 90)
-        surface.blit(name_surf, name_rect)
+        name_rect = self._name_surf.get_rect(centerx=scaled_rect.centerx, top=scaled_y + 90)
+        surface.blit(self._name_surf, name_rect)
         
         # Status
         if not self.available:
-            status_font = pygame.font.SysFont("arial", 12)
-            status_surf = status_font.render("Coming Soon", True, TEXT_MUTED)
-            status_rect = status_surf.get_rect(centerx=scaled_rect.centerx, bottom=scaled_y + scaled_h - 10)
-            surface.blit(status_surf, status_rect)
+            status_rect = self._status_surf.get_rect(centerx=scaled_rect.centerx,
+                                                     bottom=scaled_y + scaled_h - 10)
+            surface.blit(self._status_surf, status_rect)
+
+    def draw(self, surface):
+        self.update()
+        hover = self.hover and self.available
+
+        if self._frames is not None:
+            # Pick the nearest pre-rendered frame (size includes the shadow)
+            frame = self._frames[hover].nearest(self.scale)
+            frame_w, frame_h = frame.get_width() - 4, frame.get_height() - 4
+            surface.blit(frame, (self.rect.x + (self.rect.width - frame_w) // 2,
+                                 self.rect.y + (self.rect.height - frame_h) // 2))
+            return
+        
+        # Scaled dimensions
+        scaled_w = int(self.rect.width * self.scale)
+        scaled_h = int(self.rect.height * self.scale)
+        scaled_x = self.rect.x + (self.rect.width - scaled_w) // 2
+        scaled_y = self.rect.y + (self.rect.height - scaled_h) // 2
+        self._paint(surface, pygame.Rect(scaled_x, scaled_y, scaled_w, scaled_h), hover)
 
 
 # ============================================================================
@@ -293,7 +619,7 @@ class ProgressBar:
         
         # Label
         if label:
-            font = pygame.font.SysFont("arial", self.height - 4, bold=True)
+            font = get_font("arial", self.height - 4, bold=True)
             text_surf = font.render(label, True, WHITE)
             text_rect = text_surf.get_rect(center=bg_rect.center)
             surface.blit(text_surf, text_rect)
@@ -360,61 +686,353 @@ class Timer:
         
         # Time text
         seconds = max(0, int(self.remaining))
-        font = pygame.font.SysFont("arial", self.radius // 2, bold=True)
+        font = get_font("arial", self.radius // 2, bold=True)
         time_surf = font.render(str(seconds), True, WHITE)
         time_rect = time_surf.get_rect(center=(self.x, self.y))
         surface.blit(time_surf, time_rect)
 
 
+# ============================================================================
+# CHART COMPONENTS
+# ============================================================================
+
+# Buckets a chart series folds its samples into (see ChartSeries)
+CHART_BUCKETS = 512
+
+
+def lttb(xs, ys, threshold):
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Returns at most `threshold` (x, y) points that preserve the visual shape
+    of the series. Short series are returned unchanged.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(zip(xs, ys))
+
+    sampled = [(xs[0], ys[0])]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average point of the next bucket
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_len = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_len
+        avg_y = sum(ys[avg_start:avg_end]) / avg_len
+
+        # Pick the point in this bucket forming the largest triangle
+        ax, ay = xs[a], ys[a]
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled.append((xs[next_a], ys[next_a]))
+        a = next_a
+
+    sampled.append((xs[-1], ys[-1]))
+    return sampled
+
+
+def _extremes(points):
+    """The lowest and highest of `points`, in x order (one point if they coincide)."""
+    lo = min(points, key=lambda p: p[1])
+    hi = max(points, key=lambda p: p[1])
+    if lo is hi:
+        return (lo,)
+    return (lo, hi) if lo[0] <= hi[0] else (hi, lo)
+
+
+class ChartSeries:
+    """One line or area series in a TimeSeriesChart.
+
+    Samples are not kept individually. They are folded into at most
+    `max_buckets` buckets of `bucket_size` consecutive samples, each
+    remembered by its lowest and highest point; when the buckets run out,
+    neighbouring pairs merge and the bucket size doubles. Appending is
+    O(1) amortized and points() is bounded by max_buckets, so rendering
+    costs the same for a hundred samples or a million.
+    """
+
+    def __init__(self, color=ACCENT, style="line", y_range=None, max_buckets=CHART_BUCKETS):
+        self.color = color
+        self.style = style  # "line" or "area"
+        self.y_range = y_range
+        self.max_buckets = max_buckets + max_buckets % 2  # merged in pairs
+        self.clear()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value, x=None):
+        point = (self.count if x is None else x, value)
+        if not self.count:
+            self.first_x = point[0]
+        self.last_x = point[0]
+        self.count += 1
+        self.min_y = min(self.min_y, value)
+        self.max_y = max(self.max_y, value)
+
+        # Running extremes of the bucket being filled
+        if not self._filled:
+            self._lo = self._hi = point
+        elif value < self._lo[1]:
+            self._lo = point
+        elif value > self._hi[1]:
+            self._hi = point
+        self._filled += 1
+        if self._filled == self.bucket_size:
+            self._buckets.append(_extremes((self._lo, self._hi)))
+            self._filled = 0
+            if len(self._buckets) == self.max_buckets:
+                buckets = self._buckets
+                self._buckets = [_extremes(buckets[i] + buckets[i + 1])
+                                 for i in range(0, len(buckets), 2)]
+                self.bucket_size *= 2
+
+    def clear(self):
+        self.count = 0
+        self.first_x = self.last_x = 0
+        self.min_y = math.inf
+        self.max_y = -math.inf
+        self.bucket_size = 1
+        self._buckets = []
+        self._filled = 0  # samples in the bucket being filled
+        self._lo = self._hi = None
+
+    def points(self):
+        """The bucket extremes in x order: the series' shape in bounded size."""
+        points = [point for bucket in self._buckets for point in bucket]
+        if self._filled:
+            points.extend(_extremes((self._lo, self._hi)))
+        return points
+
+    def bounds(self):
+        if self.y_range:
+            return self.y_range
+        if self.max_y <= self.min_y:
+            return (self.min_y - 1, self.max_y + 1)
+        return (self.min_y, self.max_y)
+
+
+class TimeSeriesChart:
+    """Line/area chart with LTTB downsampling and a cached plot surface.
+
+    The plot is only re-rendered when data changed, and at most once every
+    `refresh_ms`, so drawing is a single blit regardless of series length.
+    A re-render downsamples each series' bucket extremes, never the raw
+    samples, so its cost depends on the plot width only.
+    """
+
+    def __init__(self, x, y, width, height, title=None, bg_color=CARD_BG,
+                 refresh_ms=250):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.title = title
+        self.bg_color = bg_color
+        self.refresh_ms = refresh_ms
+        self.series = {}
+
+        self._surface = None
+        self._dirty = True
+        self._last_render = -refresh_ms
+
+    def add_series(self, name, color=ACCENT, style="line", y_range=None):
+        self.series[name] = ChartSeries(color, style, y_range)
+        self._dirty = True
+        return self.series[name]
+
+    def append(self, name, value, x=None):
+        """Append one sample to a series."""
+        self.series[name].append(value, x)
+        self._dirty = True
+
+    def extend(self, name, values):
+        series = self.series[name]
+        for value in values:
+            series.append(value)
+        self._dirty = True
+
+    def clear(self):
+        for series in self.series.values():
+            series.clear()
+        self._dirty = True
+
+    def _plot_rect(self):
+        top = 20 if self.title else 6
+        return pygame.Rect(6, top, self.rect.width - 12, self.rect.height - top - 6)
+
+    def render(self):
+        """Re-render the cached plot surface from the current data."""
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, self.bg_color, surf.get_rect(), border_radius=8)
+        if self.title:
+            label = get_font("arial", 12, bold=True).render(self.title, True, TEXT_SECONDARY)
+            surf.blit(label, (8, 4))
+
+        plot = self._plot_rect()
+        for series in self.series.values():
+            if len(series) < 2:
+                continue
+
+            # One point per pixel column is all the plot can show
+            points = series.points()
+            points = lttb([p[0] for p in points], [p[1] for p in points], plot.width)
+            x0, x1 = series.first_x, series.last_x
+            y0, y1 = series.bounds()
+            x_span = (x1 - x0) or 1
+            y_span = (y1 - y0) or 1
+            pixels = [
+                (plot.x + (px - x0) / x_span * plot.width,
+                 plot.bottom - (min(max(py, y0), y1) - y0) / y_span * plot.height)
+                for px, py in points
+            ]
+
+            if series.style == "area":
+                fill = (*series.color[:3], 90)
+                polygon = [(pixels[0][0], plot.bottom)] + pixels + [(pixels[-1][0], plot.bottom)]
+                pygame.draw.polygon(surf, fill, polygon)
+            pygame.draw.lines(surf, series.color, False, pixels, 2)
+
+        self._surface = surf
+        self._dirty = False
+        self._last_render = pygame.time.get_ticks()
+        return surf
+
+    def draw(self, surface):
+        now = pygame.time.get_ticks()
+        if self._surface is None or (self._dirty and now - self._last_render >= self.refresh_ms):
+            self.render()
+        surface.blit(self._surface, self.rect)
+
+
+class ECGMonitor:
+    """Scrolling heart-rate trace using blit-shift rendering.
+
+    The trace lives on a persistent surface that is scrolled in place by the
+    elapsed pixels each frame; only the newly exposed strip is drawn, using a
+    waveform table precomputed for the current heart rate.
+    """
+
+    # (center, width, amplitude) of the P, Q, R, S and T waves as fractions
+    # of one beat
+    WAVES = [(0.20, 0.025, 0.12), (0.37, 0.010, -0.12), (0.40, 0.012, 1.0),
+             (0.43, 0.012, -0.25), (0.65, 0.040, 0.30)]
+
+    def __init__(self, x, y, width, height, color=SUCCESS, speed=80,
+                 bg_color=(16, 22, 30)):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = color
+        self.speed = speed  # pixels per second
+        self.bg_color = bg_color
+        self.grid_color = tuple(min(255, c + 14) for c in bg_color)
+        self.bpm = 0
+
+        self.trace_rect = pygame.Rect(x + 8, y + 28, width - 16, height - 36)
+        self.trace = pygame.Surface(self.trace_rect.size)
+        self.trace.fill(bg_color)
+
+        self._table = [self.trace_rect.height // 2]
+        self._phase = 0
+        self._column = 0
+        self._pending = 0.0
+        self._last_y = self._table[0]
+        self._label = None
+
+    def set_waveform(self, bpm, amplitude=1.0, color=None):
+        """Precompute one beat of trace heights for `bpm`."""
+        if color is not None:
+            self.color = color
+        self.bpm = bpm
+        period = max(8, int(self.speed * 60 / bpm))
+        mid = self.trace_rect.height // 2
+        scale = (self.trace_rect.height * 0.42) * amplitude
+        table = []
+        for i in range(period):
+            t = i / period
+            v = sum(a * math.exp(-((t - c) / w) ** 2) for c, w, a in self.WAVES)
+            table.append(int(mid - v * scale))
+        self._table = table
+        self._phase %= period
+        self._label = get_font("arial", 16, bold=True).render(f"HR {bpm} bpm", True, self.color)
+
+    def update(self, dt):
+        self._pending += dt * self.speed
+        columns = int(self._pending)
+        if columns <= 0:
+            return
+        self._pending -= columns
+        width, height = self.trace_rect.size
+        columns = min(columns, width)
+
+        # Shift existing trace left and clear the exposed strip
+        self.trace.scroll(-columns, 0)
+        strip_x = width - columns
+        self.trace.fill(self.bg_color, (strip_x, 0, columns, height))
+
+        for i in range(columns):
+            x = strip_x + i
+            self._column += 1
+            if self._column % 20 == 0:
+                pygame.draw.line(self.trace, self.grid_color, (x, 0), (x, height - 1))
+            y = self._table[self._phase]
+            pygame.draw.line(self.trace, self.color, (x - 1, self._last_y), (x, y), 2)
+            self._last_y = y
+            self._phase = (self._phase + 1) % len(self._table)
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=12)
+        if self._label:
+            surface.blit(self._label, (self.rect.x + 12, self.rect.y + 6))
+        surface.blit(self.trace, self.trace_rect)
+
+
 # ============================================================================
 # TEXT UTILITIES
 # ============================================================================
 
+def prerender_text(text, size, color, bold=False, max_width=None, font_name="arial"):
+    """Render `text` into the text caches ahead of time (wrapped if `max_width`)."""
+    if max_width is None:
+        render_text(text, size, color, font_name, bold)
+    else:
+        for line in wrap_text(text, size, max_width, font_name):
+            render_text(line, size, color, font_name)
+
+
 def draw_text(screen, text, size, x, y, color=BLACK, font_name="arial", bold=False):
     """Draw centered text."""
-    font = pygame.font.SysFont(font_name, size, bold=bold)
-    text_surf = font.render(text, True, color)
+    text_surf = render_text(text, size, color, font_name, bold)
     text_rect = text_surf.get_rect(center=(x, y))
     screen.blit(text_surf, text_rect)
 
 
 def draw_text_left(screen, text, size, x, y, color=BLACK, font_name="arial", bold=False):
     """Draw left-aligned text."""
-    font = pygame.font.SysFont(font_name, size, bold=bold)
-    text_surf = font.render(text, True, color)
+    text_surf = render_text(text, size, color, font_name, bold)
     screen.blit(text_surf, (x, y))
 
 
 def draw_multiline_text(text, screen, x, y, size, color=BLACK, font_name="arial", line_spacing=5):
     """Draw multiple lines of text."""
-    font = pygame.font.SysFont(font_name, size)
     lines = text.split("\n")
     for i, line in enumerate(lines):
-        line_surf = font.render(line, True, color)
+        line_surf = render_text(line, size, color, font_name)
         screen.blit(line_surf, (x, y + i * (size + line_spacing)))
 
 
 def draw_wrapped_text(text, screen, x, y, size, color, max_width, font_name="arial", line_spacing=8):
     """Draw text with word wrapping."""
-    font = pygame.font.SysFont(font_name, size)
-    words = text.split()
-    lines = []
-    current_line = []
-    
-    for word in words:
-        test_line = ' '.join(current_line + [word])
-        if font.size(test_line)[0] <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
-    
-    if current_line:
-        lines.append(' '.join(current_line))
+    lines = wrap_text(text, size, max_width, font_name)
     
     for i, line in enumerate(lines):
-        line_surf = font.render(line, True, color)
+        line_surf = render_text(line, size, color, font_name)
         screen.blit(line_surf, (x, y + i * (size + line_spacing)))
     
     return len(lines) * (size + line_spacing)
@@ -427,9 +1045,9 @@ def draw_lives(screen, lives, max_lives, x, y, heart_size=20, spacing=8, full_co
     - Uses a bold font heart character for portability.
     """
     try:
-        heart_font = pygame.font.SysFont("segoeuisymbol", heart_size, bold=True)
+        heart_font = get_font("segoeuisymbol", heart_size, bold=True)
     except Exception:
-        heart_font = pygame.font.SysFont("arial", heart_size, bold=True)
+        heart_font = get_font("arial", heart_size, bold=True)
 
     for i in range(max_lives):
         color = full_color if i < lives else empty_color
@@ -441,12 +1059,18 @@ def draw_lives(screen, lives, max_lives, x, y, heart_size=20, spacing=8, full_co
 # VISUAL EFFECTS
 # ============================================================================
 
+# Particle velocities and gravity are tuned in pixels per 60 Hz tick
+PARTICLE_TICK_RATE = 60
+
+
 class Particle:
     """Simple particle for visual effects."""
     
     def __init__(self, x, y, color, velocity=None, life=1.0, size=4):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.color = color
         self.vx = velocity[0] if velocity else (pygame.time.get_ticks() % 100 - 50) / 15
         self.vy = velocity[1] if velocity else -2 - (pygame.time.get_ticks() % 50) / 25
@@ -455,17 +1079,22 @@ class Particle:
         self.size = size
     
     def update(self, dt):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.15  # Gravity
+        ticks = dt * PARTICLE_TICK_RATE
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.vx * ticks
+        self.y += self.vy * ticks
+        self.vy += 0.15 * ticks  # Gravity
         self.life -= dt * 2
     
-    def draw(self, surface):
+    def draw(self, surface, t=1.0):
+        """Draw at `t` of the way from the previous to the current step."""
         if self.life > 0:
             alpha = self.life / self.max_life
             size = int(self.size * alpha)
             if size > 0:
-                pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), size)
+                x = self.prev_x + (self.x - self.prev_x) * t
+                y = self.prev_y + (self.y - self.prev_y) * t
+                pygame.draw.circle(surface, self.color, (int(x), int(y)), size)
     
     def is_alive(self):
         return self.life > 0
@@ -473,9 +1102,17 @@ class Particle:
 
 class ParticleSystem:
     """Manages multiple particles."""
+
+    _systems = weakref.WeakSet()  # every live system, for metrics
     
     def __init__(self):
         self.particles = []
+        ParticleSystem._systems.add(self)
+
+    @classmethod
+    def alive(cls):
+        """Particles alive across every system."""
+        return sum(len(system.particles) for system in list(cls._systems))
     
     def emit(self, x, y, color, count=10):
         for _ in range(count):
@@ -488,8 +1125,9 @@ class ParticleSystem:
                 self.particles.remove(p)
     
     def draw(self, surface):
+        t = get_render_alpha()
         for p in self.particles:
-            p.draw(surface)
+            p.draw(surface, t)
 
 
 class ScreenFlash:
@@ -498,10 +1136,13 @@ class ScreenFlash:
     def __init__(self):
         self.alpha = 0
         self.color = WHITE
+        self._overlay = None  # reused while the target size stays the same
     
     def flash(self, color=WHITE, intensity=100):
         self.color = color
         self.alpha = intensity
+        if self._overlay is not None:
+            self._overlay.fill(color)
     
     def update(self):
         if self.alpha > 0:
@@ -509,8 +1150,10 @@ class ScreenFlash:
     
     def draw(self, surface):
         if self.alpha > 0:
-            overlay = pygame.Surface(surface.get_size())
-            overlay.fill(self.color)
+            overlay = self._overlay
+            if overlay is None or overlay.get_size() != surface.get_size():
+                overlay = self._overlay = pygame.Surface(surface.get_size())
+                overlay.fill(self.color)
             overlay.set_alpha(self.alpha)
             surface.blit(overlay, (0, 0))
 
@@ -538,7 +1181,7 @@ class Toast:
         if self.remaining > 0:
             alpha = min(1.0, self.remaining / 0.5)  # Fade out
             
-            font = pygame.font.SysFont("arial", 20, bold=True)
+            font = get_font("arial", 20, bold=True)
             text_surf = font.render(self.text, True, WHITE)
             
             padding = 20
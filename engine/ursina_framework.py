@@ -8,7 +8,7 @@ This file is intentionally dependency-friendly: it will raise a helpful
 message if `ursina` is not installed.
 """
 try:
-    from ursina import Ursina, Entity, color, Vec3, Text, Button, window, invoke, camera, time
+    from ursina import Ursina, Entity, color, Vec3, Text, Button, window, invoke, camera, time, destroy
 except Exception:
     raise ImportError("Ursina is required for the 3D framework. Install with `pip install ursina`.")
 
@@ -42,17 +42,15 @@ class GameWorld:
         pass
 
     def on_end(self):
-        # disable entities and UI created by the world
-        for e in self.entities:
+        # destroy (not just disable) entities and UI created by the world,
+        # so switching worlds all day doesn't pile up hidden entities
+        for e in self.entities + self.ui:
             try:
-                e.disable()
-            except Exception:
-                pass
-        for u in self.ui:
-            try:
-                u.disable()
+                destroy(e)
             except Exception:
                 pass
+        self.entities.clear()
+        self.ui.clear()
 
 
 class GameRunner:
@@ -5,23 +5,55 @@ Template for all career mini-worlds.
 
 import pygame
 from engine.colors import BACKGROUND, WHITE, TEXT_SECONDARY
-from engine.ui import draw_text, ModernButton
+from engine.ui import draw_text, render_text, ModernButton, prerender_text
+from engine.layout import DESIGN_WIDTH, DESIGN_HEIGHT
+from engine.core import Scene
+from engine.states import StateMachine
+from engine import cache
 
+# Pre-rendered results screens by ResultsSnapshot, counted against the
+# shared cache budget and rendered again if evicted
+_RESULTS_CACHE = cache.register("results", sizeof=cache.surface_bytes)
 
-class BaseWorld:
+
+class ResultsSnapshot:
+    """
+    A finished session's results, computed once when the world enters
+    "results": stats, grade, feedback and lesson text. The pre-rendered
+    results screen is kept in the "results" cache (see
+    BaseWorld.results_layer).
+    """
+    
+    def __init__(self, stats, grade, grade_color=WHITE, feedback="", lesson=""):
+        self.stats = stats
+        self.grade = grade
+        self.grade_color = grade_color
+        self.feedback = feedback
+        self.lesson = lesson
+
+
+class BaseWorld(Scene):
     """
     Base class for all career worlds.
     Provides common structure and utilities.
     """
     
-    # Screen dimensions (should match main config)
-    WIDTH = 900
-    HEIGHT = 600
+    # Worlds are authored at the design resolution and drawn on the stage
+    WIDTH = DESIGN_WIDTH
+    HEIGHT = DESIGN_HEIGHT
+    staged = True
+    
+    # Screens of the world, dispatched by engine.states (see there for the
+    # enter_/exit_/update_/draw_/click_/key_<state> handler names)
+    STATES = ("intro", "gameplay", "results")
+    # States whose draw covers the whole screen, so no background fill
+    OPAQUE_STATES = ("results",)
     
     def __init__(self, story_package=None):
         self.story = story_package or {"intro": "Your career adventure begins!"}
-        self.state = "intro"  # intro -> gameplay -> results
+        self.states = StateMachine(self, self.STATES, "intro")
         self.result = None
+        self.results = None  # ResultsSnapshot, built on entering results
         self.score = 0
         self.max_score = 0
         
@@ -30,46 +62,42 @@ class BaseWorld:
         self.career_color = (100, 100, 100)
         self.career_icon = "?"
         
-        # Common UI elements
-        self.clock = pygame.time.Clock()
-        
-    def run(self, scene_manager):
-        """Main loop for the world. Override in child classes."""
-        screen = pygame.display.get_surface()
-        running = True
-        
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                
-                self.handle_event(event, scene_manager)
-            
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+        self.scene_manager = None
+    
+    @property
+    def state(self):
+        """Name of the current state; assigning runs the exit/enter hooks."""
+        return self.states.name
+    
+    @state.setter
+    def state(self, name):
+        self.states.transition(name)
     
     def handle_event(self, event, scene_manager):
-        """Handle input events. Override in child classes."""
-        pass
+        """Route input to handle_click / handle_key."""
+        self.scene_manager = scene_manager
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.handle_click(event)
+        elif event.type == pygame.KEYDOWN:
+            self.handle_key(event)
+    
+    def handle_click(self, event):
+        """Handle a mouse click with the current state's click_ handler."""
+        self.states.click(event)
+    
+    def handle_key(self, event):
+        """Handle a key press with the current state's key_ handler."""
+        self.states.key(event)
     
     def update(self, dt):
-        """Update game logic. Override in child classes."""
-        pass
+        """Update game logic with the current state's update_ handler."""
+        self.states.update(dt)
     
     def draw(self, screen):
-        """Draw current state. Override in child classes."""
-        screen.fill(BACKGROUND)
-        
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
+        """Draw current state."""
+        if self.state not in self.OPAQUE_STATES:
+            screen.fill(BACKGROUND)
+        self.states.draw(screen)
     
     def draw_intro(self, screen):
         """Draw intro state. Override in child classes."""
@@ -80,9 +108,65 @@ class BaseWorld:
         """Draw gameplay state. Override in child classes."""
         draw_text(screen, "Gameplay", 36, self.WIDTH // 2, self.HEIGHT // 2, WHITE)
     
+    def on_exit(self):
+        if self.results is not None:
+            _RESULTS_CACHE.discard(self.results)
+    
+    def enter_results(self):
+        """Collect the final results once, as the world enters the state."""
+        if self.results is not None:
+            _RESULTS_CACHE.discard(self.results)
+        self.results = self.compute_results()
+    
     def draw_results(self, screen):
-        """Draw results state. Override in child classes."""
-        draw_text(screen, "Results", 36, self.WIDTH // 2, self.HEIGHT // 2, WHITE)
+        """Draw results state: the pre-rendered results layer."""
+        screen.blit(self.results_layer(), (0, 0))
+    
+    def get_results(self):
+        """Return the results snapshot, computing it if needed."""
+        if self.results is None:
+            self.results = self.compute_results()
+        return self.results
+    
+    def results_layer(self):
+        """The results screen, rendered on first use (or after eviction)."""
+        results = self.get_results()
+        layer = _RESULTS_CACHE.get(results)
+        if layer is None:
+            # Opaque and in the display's pixel format, so drawing it is a plain copy
+            layer = pygame.Surface((self.WIDTH, self.HEIGHT))
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            layer.fill(BACKGROUND)
+            self.render_results(layer, results)
+            _RESULTS_CACHE.put(results, layer)
+        return layer
+    
+    def compute_results(self):
+        """Collect final stats into a ResultsSnapshot. Override in child classes."""
+        return ResultsSnapshot({"score": self.score}, self.get_performance_grade())
+    
+    def render_results(self, layer, results):
+        """Draw the static parts of the results screen. Override in child classes."""
+        draw_text(layer, "Results", 36, self.WIDTH // 2, self.HEIGHT // 2, WHITE)
+    
+    def upcoming_text(self):
+        """Text the next question will draw, as prerender_text() argument
+        tuples. Override in child classes."""
+        return []
+    
+    def prerender_upcoming(self):
+        """Render the next question's text during idle frame time."""
+        texts = self.upcoming_text()
+        if texts and self.scene_manager is not None:
+            self.scene_manager.idle.post(lambda deadline: self._prerender(texts, deadline))
+    
+    @staticmethod
+    def _prerender(texts, deadline):
+        for entry in texts:
+            prerender_text(*entry)
+            if deadline.time_remaining() < 1.0:
+                yield
     
     def draw_header(self, screen, title, subtitle=None):
         """Draw a standard header bar."""
@@ -99,9 +183,7 @@ class BaseWorld:
     
     def draw_score_display(self, screen, x, y):
         """Draw current score."""
-        font = pygame.font.SysFont("arial", 24, bold=True)
-        score_text = f"Score: {self.score}"
-        score_surf = font.render(score_text, True, WHITE)
+        score_surf = render_text(f"Score: {self.score}", 24, WHITE, bold=True)
         screen.blit(score_surf, (x, y))
     
     def transition_to_results(self):
@@ -12,30 +12,35 @@ Features:
 - Educational content about real-world careers
 """
 
+from engine import bootstrap  # starts the startup clock; keep first
+
 import pygame
 import sys
 import math
+import importlib
 from typing import Optional, Dict, List
 
-from engine.core import SceneManager
+from engine.core import Scene, SceneManager
 from engine.ui import (
-    Button, ModernButton, CareerCard, draw_text, draw_wrapped_text,
+    Button, ModernButton, CareerCard, draw_text, draw_wrapped_text, render_text,
     ParticleSystem, ScreenFlash
 )
 from engine.colors import (
     WHITE, BLACK, GREY, BACKGROUND, CARD_BG, TEXT_SECONDARY, TEXT_MUTED,
-    PRIMARY, ACCENT, DANGER, SUCCESS, WARNING,
-    DOCTOR_PRIMARY, LAWYER_PRIMARY, INFLUENCER_PRIMARY,
-    POLITICIAN_PRIMARY, ENGINEER_PRIMARY
+    PRIMARY, ACCENT, DANGER, SUCCESS, WARNING
 )
-from engine.backstory_ai import generate_backstory
-
-# Import all worlds
-from worlds.doctor import DoctorWorld
-from worlds.lawyer import LawyerWorld
-from worlds.influencer import InfluencerWorld
-from worlds.politician import PoliticianWorld
-from worlds.engineer import EngineerWorld
+from engine.preload import Preloader, build_world
+from engine.layout import (
+    DESIGN_WIDTH, DESIGN_HEIGHT, Layout, RelRect,
+    TOP, TOP_LEFT, CENTER, BOTTOM
+)
+from engine import display
+from engine import registry
+from engine import jobs
+from engine import atlas
+from engine import diskcache
+from engine import kiosk
+from engine import metrics
 
 
 # ============================================================================
@@ -44,69 +49,24 @@ from worlds.engineer import EngineerWorld
 
 class Config:
     """Centralized game configuration."""
-    WIDTH = 900
-    HEIGHT = 600
+    WIDTH = DESIGN_WIDTH
+    HEIGHT = DESIGN_HEIGHT
+    FULLSCREEN = False
     FPS = 60
+    RENDER_FPS = None  # cap drawing separately from simulation (None = every frame)
+    AUDIO = False  # the game has no sound yet, so the mixer isn't started
+    TRACE_STARTUP = False  # print per-subsystem startup timings (--trace-startup)
+    ASYNC_LOOP = False  # drive the engine from an asyncio event loop (--async)
+    DISK_CACHE = False  # keep rendered surfaces on disk between runs (--disk-cache)
+    KIOSK = False  # unattended mode with a memory watchdog (--kiosk)
+    KIOSK_MAX_GROWTH_MB = 256  # memory growth that triggers a soft reset to the menu
+    PROFILE_ALLOCATIONS = False  # print allocation reports on transitions (--profile-allocations)
+    METRICS = True  # engine counters and timers, F10 prints them (off with --no-metrics)
     TITLE = "Step Into My Shoes"
     SUBTITLE = "Career Exploration Game"
     VERSION = "1.0.0"
 
 
-# ============================================================================
-# CAREER DATA
-# ============================================================================
-
-CAREERS = {
-    "Doctor": {
-        "name": "Doctor",
-        "icon": "⚕",
-        "tagline": "Save lives under pressure",
-        "color": DOCTOR_PRIMARY,
-        "world_class": DoctorWorld,
-        "available": True
-    },
-    "Lawyer": {
-        "name": "Lawyer",
-        "icon": "⚖",
-        "tagline": "Find truth in testimony",
-        "color": LAWYER_PRIMARY,
-        "world_class": LawyerWorld,
-        "available": True
-    },
-    "Influencer": {
-        "name": "Influencer",
-        "icon": "★",
-        "tagline": "Create viral content",
-        "color": INFLUENCER_PRIMARY,
-        "world_class": InfluencerWorld,
-        "available": True
-    },
-    "Politician": {
-        "name": "Politician",
-        "icon": "⬢",
-        "tagline": "Lead with wisdom",
-        "color": POLITICIAN_PRIMARY,
-        "world_class": PoliticianWorld,
-        "available": True
-    },
-    "Engineer": {
-        "name": "Engineer",
-        "icon": "⚙",
-        "tagline": "Build the future",
-        "color": ENGINEER_PRIMARY,
-        "world_class": EngineerWorld,
-        "available": True
-    }
-}
-
-
-# ============================================================================
-# SCREEN REFERENCE (set during initialization)
-# ============================================================================
-
-SCREEN: pygame.Surface = None  # type: ignore
-
-
 # ============================================================================
 # VISUAL EFFECTS
 # ============================================================================
@@ -117,6 +77,7 @@ class BackgroundEffect:
     def __init__(self):
         self.particles = []
         self.time = 0
+        self.width, self.height = Config.WIDTH, Config.HEIGHT
         
         # Create initial particles
         for _ in range(15):
@@ -125,13 +86,21 @@ class BackgroundEffect:
     def add_particle(self):
         import random
         self.particles.append({
-            "x": random.randint(0, Config.WIDTH),
-            "y": random.randint(0, Config.HEIGHT),
+            "x": random.randint(0, self.width),
+            "y": random.randint(0, self.height),
             "size": random.randint(2, 5),
             "speed": random.uniform(0.2, 0.8),
             "alpha": random.randint(30, 80)
         })
     
+    def resize(self, size):
+        """Spread the particles over a new window size."""
+        old_w, old_h = self.width, self.height
+        self.width, self.height = size
+        for p in self.particles:
+            p["x"] = p["x"] * self.width / old_w
+            p["y"] = p["y"] * self.height / old_h
+    
     def update(self, dt):
         self.time += dt
         
@@ -140,8 +109,8 @@ class BackgroundEffect:
             p["x"] += math.sin(self.time + p["y"] * 0.01) * 0.3
             
             if p["y"] < -10:
-                p["y"] = Config.HEIGHT + 10
-                p["x"] = pygame.time.get_ticks() % Config.WIDTH
+                p["y"] = self.height + 10
+                p["x"] = pygame.time.get_ticks() % self.width
     
     def draw(self, surface):
         for p in self.particles:
@@ -153,129 +122,145 @@ class BackgroundEffect:
 # MAIN MENU SCENE
 # ============================================================================
 
-def main_menu(scene_manager: SceneManager):
+MENU_LAYOUT = Layout(
+    header=RelRect(TOP, size=(1.0, 200)),
+    title=RelRect(TOP, (0, 80)),
+    subtitle=RelRect(TOP, (0, 140)),
+    tagline=RelRect(TOP, (0, 230)),
+    start=RelRect(CENTER, (0, 0), (300, 60), pivot=TOP),
+    about=RelRect(CENTER, (0, 80), (300, 60), pivot=TOP),
+    exit=RelRect(CENTER, (0, 160), (300, 60), pivot=TOP),
+    version=RelRect(BOTTOM, (0, -20)),
+)
+
+
+class MainMenuScene(Scene):
     """Main menu with animated title and modern buttons."""
-    clock = pygame.time.Clock()
-    particles = ParticleSystem()
-    background = BackgroundEffect()
-    
-    # Buttons
-    start_btn = ModernButton(
-        Config.WIDTH // 2 - 150, 300, 300, 60,
-        "Start Your Journey",
-        ACCENT, SUCCESS, font_size=24
-    )
-    about_btn = ModernButton(
-        Config.WIDTH // 2 - 150, 380, 300, 60,
-        "About This Game",
-        PRIMARY, (100, 160, 230), font_size=22
-    )
-    exit_btn = ModernButton(
-        Config.WIDTH // 2 - 150, 460, 300, 60,
-        "Exit",
-        DANGER, (220, 90, 80), font_size=22
-    )
     
-    # Animation state
-    title_offset = 0
-    time_elapsed = 0
+    def __init__(self):
+        self.particles = ParticleSystem()
+        self.background = BackgroundEffect()
+        
+        # Buttons
+        self.start_btn = ModernButton(
+            Config.WIDTH // 2 - 150, 300, 300, 60,
+            "Start Your Journey",
+            ACCENT, SUCCESS, font_size=24, prerender_frames=True
+        )
+        self.about_btn = ModernButton(
+            Config.WIDTH // 2 - 150, 380, 300, 60,
+            "About This Game",
+            PRIMARY, (100, 160, 230), font_size=22, prerender_frames=True
+        )
+        self.exit_btn = ModernButton(
+            Config.WIDTH // 2 - 150, 460, 300, 60,
+            "Exit",
+            DANGER, (220, 90, 80), font_size=22, prerender_frames=True
+        )
+        
+        # Child scenes, built on first visit and kept for later ones
+        self.career_select = None
+        self.about = None
+        
+        # Animation state
+        self.title_offset = 0
+        self.time_elapsed = 0
+        
+        self.place()
     
-    running = True
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        time_elapsed += dt
-        
-        # Background
-        SCREEN.fill(BACKGROUND)
-        background.update(dt)
-        background.draw(SCREEN)
+    def place(self):
+        """Resolve the layout for the current window and move widgets."""
+        MENU_LAYOUT.resolve(display.screen().get_size())
+        for btn, name in ((self.start_btn, "start"), (self.about_btn, "about"),
+                          (self.exit_btn, "exit")):
+            btn.rebind(x=MENU_LAYOUT[name].x, y=MENU_LAYOUT[name].y)
+        self.background.resize(MENU_LAYOUT.size)
+    
+    on_resume = on_resize = place
+    
+    def handle_event(self, event, scene_manager):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            mx, my = event.pos
+            
+            if self.start_btn.is_hover():
+                self.particles.emit(mx, my, ACCENT, 20)
+                if self.career_select is None:
+                    self.career_select = CareerSelectScene()
+                scene_manager.push(self.career_select)
+            
+            elif self.about_btn.is_hover():
+                self.particles.emit(mx, my, PRIMARY, 15)
+                if self.about is None:
+                    self.about = AboutScene()
+                scene_manager.push(self.about)
+            
+            elif self.exit_btn.is_hover():
+                self.particles.emit(mx, my, DANGER, 15)
+                pygame.time.wait(200)
+                scene_manager.quit()
+    
+    def update(self, dt):
+        self.time_elapsed += dt
+        self.background.update(dt)
+        self.particles.update(dt)
         
         # Animated title
-        title_offset = math.sin(time_elapsed * 2) * 5
+        self.title_offset = math.sin(self.time_elapsed * 2) * 5
+    
+    def draw(self, screen):
+        # Background
+        screen.fill(BACKGROUND)
+        self.background.draw(screen)
         
         # Draw decorative header bar
-        header_rect = pygame.Rect(0, 0, Config.WIDTH, 200)
-        pygame.draw.rect(SCREEN, (35, 45, 65), header_rect)
+        pygame.draw.rect(screen, (35, 45, 65), MENU_LAYOUT["header"])
         
         # Title with subtle animation
-        title_y = 80 + title_offset
+        title_x = MENU_LAYOUT["title"].x
+        title_y = MENU_LAYOUT["title"].y + self.title_offset
         
         # Glow effect
-        glow_font = pygame.font.SysFont("arial", 52, bold=True)
-        glow_surf = glow_font.render(Config.TITLE, True, ACCENT)
-        glow_rect = glow_surf.get_rect(center=(Config.WIDTH // 2 + 2, title_y + 2))
-        SCREEN.blit(glow_surf, glow_rect)
+        glow_surf = render_text(Config.TITLE, 52, ACCENT, bold=True)
+        glow_rect = glow_surf.get_rect(center=(title_x + 2, title_y + 2))
+        screen.blit(glow_surf, glow_rect)
         
         # Main title
-        title_font = pygame.font.SysFont("arial", 52, bold=True)
-        title_surf = title_font.render(Config.TITLE, True, WHITE)
-        title_rect = title_surf.get_rect(center=(Config.WIDTH // 2, title_y))
-        SCREEN.blit(title_surf, title_rect)
+        title_surf = render_text(Config.TITLE, 52, WHITE, bold=True)
+        title_rect = title_surf.get_rect(center=(title_x, title_y))
+        screen.blit(title_surf, title_rect)
         
         # Subtitle
-        draw_text(SCREEN, Config.SUBTITLE, 22, Config.WIDTH // 2, 140, TEXT_SECONDARY)
+        draw_text(screen, Config.SUBTITLE, 22, *MENU_LAYOUT["subtitle"].topleft, TEXT_SECONDARY)
         
         # Tagline
-        draw_text(SCREEN, "Discover Your Future Through Interactive Career Worlds", 
-                 18, Config.WIDTH // 2, 230, TEXT_MUTED)
+        draw_text(screen, "Discover Your Future Through Interactive Career Worlds", 
+                 18, *MENU_LAYOUT["tagline"].topleft, TEXT_MUTED)
         
-        # Update and draw particles
-        particles.update(dt)
-        particles.draw(SCREEN)
+        # Particles
+        self.particles.draw(screen)
         
         # Draw buttons
-        start_btn.draw(SCREEN)
-        about_btn.draw(SCREEN)
-        exit_btn.draw(SCREEN)
+        self.start_btn.draw(screen)
+        self.about_btn.draw(screen)
+        self.exit_btn.draw(screen)
         
         # Version info
-        draw_text(SCREEN, f"v{Config.VERSION} | FBLA Computer Game & Simulation", 
-                 12, Config.WIDTH // 2, Config.HEIGHT - 20, TEXT_MUTED)
-        
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
-                
-                if start_btn.is_hover():
-                    particles.emit(mx, my, ACCENT, 20)
-                    scene_manager.change_scene(enhanced_career_selection)
-                    return
-                
-                if about_btn.is_hover():
-                    particles.emit(mx, my, PRIMARY, 15)
-                    scene_manager.change_scene(about_screen)
-                    return
-                
-                if exit_btn.is_hover():
-                    particles.emit(mx, my, DANGER, 15)
-                    pygame.time.wait(200)
-                    pygame.quit()
-                    sys.exit()
-        
-        pygame.display.update()
+        draw_text(screen, f"v{Config.VERSION} | FBLA Computer Game & Simulation", 
+                 12, *MENU_LAYOUT["version"].topleft, TEXT_MUTED)
 
 
 # ============================================================================
 # ABOUT SCREEN
 # ============================================================================
 
-def about_screen(scene_manager: SceneManager):
-    """About screen with game information."""
-    clock = pygame.time.Clock()
-    particles = ParticleSystem()
-    
-    back_btn = ModernButton(
-        Config.WIDTH // 2 - 100, 520, 200, 50,
-        "← Back to Menu",
-        CARD_BG, PRIMARY, font_size=20
-    )
-    
-    about_text = """Step Into My Shoes is an educational career exploration game 
+ABOUT_LAYOUT = Layout(
+    header=RelRect(TOP, size=(1.0, 80)),
+    title=RelRect(TOP, (0, 40)),
+    card=RelRect(TOP, (0, 100), (-100, -200)),
+    back=RelRect(BOTTOM, (0, -80), (200, 50), pivot=TOP),
+)
+
+ABOUT_TEXT = """Step Into My Shoes is an educational career exploration game 
 designed to help students discover different career paths through 
 interactive simulations.
 
@@ -294,306 +279,442 @@ Careers Available:
 
 Created for the FBLA Computer Game & Simulation Competition."""
 
-    running = True
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        
-        SCREEN.fill(BACKGROUND)
+
+class AboutScene(Scene):
+    """About screen with game information."""
+    
+    def __init__(self):
+        self.particles = ParticleSystem()
+        
+        self.back_btn = ModernButton(
+            Config.WIDTH // 2 - 100, 520, 200, 50,
+            "← Back to Menu",
+            CARD_BG, PRIMARY, font_size=20
+        )
+        self.place()
+    
+    def place(self):
+        """Resolve the layout for the current window and move widgets."""
+        ABOUT_LAYOUT.resolve(display.screen().get_size())
+        self.back_btn.rebind(x=ABOUT_LAYOUT["back"].x, y=ABOUT_LAYOUT["back"].y)
+    
+    on_enter = on_resize = place
+    
+    def handle_event(self, event, scene_manager):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_btn.is_hover():
+                scene_manager.pop()
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                scene_manager.pop()
+    
+    def update(self, dt):
+        self.particles.update(dt)
+    
+    def draw(self, screen):
+        screen.fill(BACKGROUND)
         
         # Header
-        header_rect = pygame.Rect(0, 0, Config.WIDTH, 80)
-        pygame.draw.rect(SCREEN, PRIMARY, header_rect)
-        draw_text(SCREEN, "About Step Into My Shoes", 32, Config.WIDTH // 2, 40, WHITE, bold=True)
+        pygame.draw.rect(screen, PRIMARY, ABOUT_LAYOUT["header"])
+        draw_text(screen, "About Step Into My Shoes", 32, *ABOUT_LAYOUT["title"].topleft, WHITE, bold=True)
         
         # Content card
-        card_rect = pygame.Rect(50, 100, Config.WIDTH - 100, 400)
-        pygame.draw.rect(SCREEN, CARD_BG, card_rect, border_radius=16)
+        card_rect = ABOUT_LAYOUT["card"]
+        pygame.draw.rect(screen, CARD_BG, card_rect, border_radius=16)
         
         # Draw about text
-        draw_wrapped_text(about_text, SCREEN, 80, 120, 16, WHITE, Config.WIDTH - 160)
-        
-        particles.update(dt)
-        particles.draw(SCREEN)
+        draw_wrapped_text(ABOUT_TEXT, screen, card_rect.x + 30, card_rect.y + 20, 16, WHITE,
+                          card_rect.width - 60)
         
-        back_btn.draw(SCREEN)
+        self.particles.draw(screen)
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if back_btn.is_hover():
-                    scene_manager.change_scene(main_menu)
-                    return
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    scene_manager.change_scene(main_menu)
-                    return
-        
-        pygame.display.update()
+        self.back_btn.draw(screen)
 
 
 # ============================================================================
 # CAREER SELECTION SCREEN
 # ============================================================================
 
-def enhanced_career_selection(scene_manager: SceneManager):
+CARD_WIDTH, CARD_HEIGHT = 150, 170
+CARD_SPACING = 25
+
+
+def _career_grid_layout(career_names):
+    """Card grid (rows of 3, last row centered) anchored to the window center."""
+    specs = {}
+    rows = [(career_names[i:i + 3], -150 + (i // 3) * (CARD_HEIGHT + CARD_SPACING + 20))
+            for i in range(0, len(career_names), 3)]
+    for names, dy in rows:
+        row_width = len(names) * CARD_WIDTH + (len(names) - 1) * CARD_SPACING
+        dx = (Config.WIDTH - row_width) // 2 - Config.WIDTH // 2
+        for i, name in enumerate(names):
+            specs[name] = RelRect(CENTER, (dx + i * (CARD_WIDTH + CARD_SPACING), dy),
+                                  (CARD_WIDTH, CARD_HEIGHT), pivot=TOP_LEFT)
+    return specs
+
+
+def career_layout(careers):
+    """Layout for the career screen. Built per scene, since it depends on
+    which careers (including plugins) are registered."""
+    return Layout(
+        title=RelRect(TOP, (0, 50)),
+        subtitle=RelRect(TOP, (0, 90)),
+        back=RelRect(TOP_LEFT, (30, 25), (100, 40)),
+        info=RelRect(CENTER, (0, 180)),
+        hint=RelRect(CENTER, (0, 190)),
+        **_career_grid_layout([career.name for career in careers])
+    )
+
+
+class CareerSelectScene(Scene):
     """Modern career selection with card-based UI."""
-    clock = pygame.time.Clock()
-    particles = ParticleSystem()
-    background = BackgroundEffect()
-    
-    # Create career cards
-    cards = []
-    card_width, card_height = 150, 170
-    spacing = 25
-    
-    # Calculate grid positions (3 top, 2 bottom centered)
-    career_list = list(CAREERS.values())
-    
-    # Top row (3 cards)
-    top_row_width = 3 * card_width + 2 * spacing
-    top_start_x = (Config.WIDTH - top_row_width) // 2
-    top_y = 150
-    
-    for i in range(3):
-        career = career_list[i]
-        x = top_start_x + i * (card_width + spacing)
-        card = CareerCard(x, top_y, card_width, card_height,
-                         career["name"], career["icon"], career["color"], career["available"])
-        cards.append((card, career))
-    
-    # Bottom row (2 cards centered)
-    bottom_row_width = 2 * card_width + spacing
-    bottom_start_x = (Config.WIDTH - bottom_row_width) // 2
-    bottom_y = top_y + card_height + spacing + 20
-    
-    for i in range(2):
-        career = career_list[3 + i]
-        x = bottom_start_x + i * (card_width + spacing)
-        card = CareerCard(x, bottom_y, card_width, card_height,
-                         career["name"], career["icon"], career["color"], career["available"])
-        cards.append((card, career))
-    
-    # Back button
-    back_btn = ModernButton(30, 25, 100, 40, "← Back", CARD_BG, PRIMARY, font_size=18)
-    
-    # Selected career info
-    hovered_career = None
-    
-    running = True
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        
-        SCREEN.fill(BACKGROUND)
-        background.update(dt)
-        background.draw(SCREEN)
+    
+    def __init__(self):
+        self.particles = ParticleSystem()
+        self.background = BackgroundEffect()
+        
+        # Career metadata comes from the registry; world modules are imported
+        # only when a career is actually chosen
+        careers = registry.careers()
+        self.layout = career_layout(careers)
+        
+        # Create career cards; positions come from the layout in place()
+        self.cards = []
+        for career in careers:
+            card = CareerCard(0, 0, CARD_WIDTH, CARD_HEIGHT,
+                             career.name, career.icon, career.color, career.available,
+                             prerender_frames=True)
+            self.cards.append((card, career))
+        
+        # Back button
+        self.back_btn = ModernButton(30, 25, 100, 40, "← Back", CARD_BG, PRIMARY, font_size=18)
+        
+        # Selected career info
+        self.hovered_career = None
+        
+        # Backstory job in flight, if any
+        self.pending = None
+        
+        self.place()
+    
+    def place(self):
+        """Resolve the layout for the current window and move widgets."""
+        self.layout.resolve(display.screen().get_size())
+        for card, career in self.cards:
+            card.rebind(*self.layout[career.name].topleft)
+        self.back_btn.rebind(x=self.layout["back"].x, y=self.layout["back"].y)
+        self.background.resize(self.layout.size)
+    
+    on_enter = on_resume = on_resize = place
+    
+    def handle_event(self, event, scene_manager):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            mx, my = event.pos
+            
+            if self.back_btn.is_hover():
+                self.particles.emit(mx, my, PRIMARY, 10)
+                scene_manager.pop()
+                return
+            
+            for card, career in self.cards:
+                if card.is_hover() and career.available and self.pending is None:
+                    self.particles.emit(mx, my, career.color, 25)
+                    
+                    # Generate the backstory on a worker; the backstory
+                    # screen opens when the result is handed back
+                    from engine.backstory_ai import generate_backstory
+                    self.pending = scene_manager.jobs.submit(
+                        generate_backstory, career.name, priority=jobs.HIGH,
+                        on_done=lambda job, career=career: self.open_backstory(
+                            scene_manager, career, job))
+                    return
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                scene_manager.pop()
+    
+    def open_backstory(self, scene_manager, career, job):
+        """Show the generated backstory (called on the main thread)."""
+        self.pending = None
+        if scene_manager.current_scene is not self or job.cancelled():
+            return
+        
+        error = job.exception()
+        if error is None:
+            backstory = job.result()
+        else:
+            # Still open the career, with the plain story every career has
+            print(f"Backstory generation failed for {career.name}: {error}")
+            from engine.backstory_ai import generate_generic_backstory
+            backstory = generate_generic_backstory(career.name)
+        scene_manager.push(BackstoryScene(career, backstory, scene_manager.idle))
+    
+    def update(self, dt):
+        self.background.update(dt)
+        self.particles.update(dt)
+        
+        self.hovered_career = None
+        for card, career in self.cards:
+            if card.is_hover() and career.available:
+                self.hovered_career = career
+    
+    def draw(self, screen):
+        screen.fill(BACKGROUND)
+        self.background.draw(screen)
         
         # Header
-        draw_text(SCREEN, "Choose Your Career Path", 36, Config.WIDTH // 2, 50, WHITE, bold=True)
-        draw_text(SCREEN, "Select a career to begin your journey", 16, Config.WIDTH // 2, 90, TEXT_SECONDARY)
+        draw_text(screen, "Choose Your Career Path", 36, *self.layout["title"].topleft, WHITE, bold=True)
+        draw_text(screen, "Select a career to begin your journey", 16, *self.layout["subtitle"].topleft,
+                  TEXT_SECONDARY)
         
-        # Update and draw cards
-        hovered_career = None
-        for card, career in cards:
-            card.draw(SCREEN)
-            if card.is_hover() and career["available"]:
-                hovered_career = career
+        # Draw cards
+        for card, career in self.cards:
+            card.draw(screen)
         
         # Show hovered career info
+        hovered_career = self.hovered_career
         if hovered_career:
-            info_y = 480
-            draw_text(SCREEN, hovered_career["tagline"], 18, Config.WIDTH // 2, info_y, 
-                     hovered_career["color"], bold=True)
-            draw_text(SCREEN, "Click to start!", 14, Config.WIDTH // 2, info_y + 25, TEXT_MUTED)
+            info_x, info_y = self.layout["info"].topleft
+            draw_text(screen, hovered_career.tagline, 18, info_x, info_y, 
+                     hovered_career.color, bold=True)
+            draw_text(screen, "Click to start!", 14, info_x, info_y + 25, TEXT_MUTED)
         else:
-            draw_text(SCREEN, "Hover over a career to learn more", 16, 
-                     Config.WIDTH // 2, 490, TEXT_MUTED)
+            draw_text(screen, "Hover over a career to learn more", 16, 
+                     *self.layout["hint"].topleft, TEXT_MUTED)
         
         # Draw particles and back button
-        particles.update(dt)
-        particles.draw(SCREEN)
-        back_btn.draw(SCREEN)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
-                
-                if back_btn.is_hover():
-                    particles.emit(mx, my, PRIMARY, 10)
-                    scene_manager.change_scene(main_menu)
-                    return
-                
-                for card, career in cards:
-                    if card.is_hover() and career["available"]:
-                        particles.emit(mx, my, career["color"], 25)
-                        
-                        # Generate backstory and go to backstory screen
-                        backstory = generate_backstory(career["name"])
-                        
-                        scene_manager.change_scene(
-                            lambda sm, c=career, b=backstory: backstory_screen(sm, c, b)
-                        )
-                        return
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    scene_manager.change_scene(main_menu)
-                    return
-        
-        pygame.display.update()
+        self.particles.draw(screen)
+        self.back_btn.draw(screen)
 
 
 # ============================================================================
 # BACKSTORY SCREEN
 # ============================================================================
 
-def backstory_screen(scene_manager: SceneManager, career: dict, backstory: str):
+BACKSTORY_LAYOUT = Layout(
+    header=RelRect(TOP, size=(1.0, 90)),
+    title=RelRect(TOP, (0, 35)),
+    tagline=RelRect(TOP, (0, 70)),
+    card=RelRect(TOP, (0, 110), (-100, -220)),
+    start=RelRect(BOTTOM, (-180, -90), (160, 50), pivot=TOP_LEFT),
+    skip=RelRect(BOTTOM, (20, -90), (160, 50), pivot=TOP_LEFT),
+)
+
+
+class BackstoryScene(Scene):
     """Display AI-generated backstory with typewriter effect."""
-    clock = pygame.time.Clock()
-    particles = ParticleSystem()
-    flash = ScreenFlash()
-    
-    # Typewriter effect state
-    full_text = backstory
-    displayed_text = ""
-    char_index = 0
-    char_timer = 0
-    char_delay = 0.025  # seconds per character
-    text_complete = False
-    
-    # Buttons
-    start_btn = ModernButton(
-        Config.WIDTH // 2 - 180, 510, 160, 50,
-        "Begin Career",
-        career["color"], career["color"], font_size=20
-    )
-    start_btn.disabled = True
     
-    skip_btn = ModernButton(
-        Config.WIDTH // 2 + 20, 510, 160, 50,
-        "Skip Intro",
-        CARD_BG, PRIMARY, font_size=20
-    )
+    def __init__(self, career: registry.Career, backstory: str, idle=None):
+        self.career = career
+        self.particles = ParticleSystem()
+        self.flash = ScreenFlash()
+        
+        # Typewriter effect state
+        self.full_text = backstory
+        self.displayed_text = ""
+        self.char_index = 0
+        self.char_timer = 0
+        self.char_delay = 0.025  # seconds per character
+        self.text_complete = False
+        
+        # Buttons
+        self.start_btn = ModernButton(
+            Config.WIDTH // 2 - 180, 510, 160, 50,
+            "Begin Career",
+            career.color, career.color, font_size=20
+        )
+        self.start_btn.disabled = True
+        
+        self.skip_btn = ModernButton(
+            Config.WIDTH // 2 + 20, 510, 160, 50,
+            "Skip Intro",
+            CARD_BG, PRIMARY, font_size=20
+        )
+        
+        # Import and build the career world in idle frame time while the
+        # story plays; the task gets a slice every frame even without idle
+        # time, but never one per simulation step
+        self.preloader = Preloader(lambda: build_world(career.load()))
+        self.preload_task = None
+        if idle is not None:
+            self.preload_task = idle.post(self.preload, timeout_ms=0)
+        
+        self.place()
     
-    running = True
-    while running:
-        dt = clock.tick(Config.FPS) / 1000.0
-        
-        SCREEN.fill(BACKGROUND)
-        
-        # Header with career color
-        header_rect = pygame.Rect(0, 0, Config.WIDTH, 90)
-        pygame.draw.rect(SCREEN, career["color"], header_rect)
+    def place(self):
+        """Resolve the layout for the current window and move widgets."""
+        BACKSTORY_LAYOUT.resolve(display.screen().get_size())
+        self.start_btn.rebind(x=BACKSTORY_LAYOUT["start"].x, y=BACKSTORY_LAYOUT["start"].y)
+        self.skip_btn.rebind(x=BACKSTORY_LAYOUT["skip"].x, y=BACKSTORY_LAYOUT["skip"].y)
+    
+    on_resize = place
+    
+    def finish_text(self):
+        """Show the whole backstory at once and enable the start button."""
+        self.displayed_text = self.full_text
+        self.char_index = len(self.full_text)
+        self.text_complete = True
+        self.start_btn.disabled = False
+    
+    def preload(self, deadline):
+        """Idle task: build the world one preloader slice at a time."""
+        while not self.preloader.step():
+            yield
+    
+    def on_exit(self):
+        if self.preload_task is not None:
+            self.preload_task.cancel()
+    
+    def begin_career(self, scene_manager: SceneManager):
+        """Swap this screen for the (preloaded) career world."""
+        scene_manager.replace(self.preloader.get())
+    
+    def handle_event(self, event, scene_manager):
+        career = self.career
         
-        draw_text(SCREEN, f"{career['icon']} {career['name']} Path", 
-                 36, Config.WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(SCREEN, career["tagline"], 16, Config.WIDTH // 2, 70, TEXT_SECONDARY)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            mx, my = event.pos
+            
+            if self.skip_btn.is_hover():
+                self.finish_text()
+            
+            if self.start_btn.is_hover() and not self.start_btn.disabled:
+                self.particles.emit(mx, my, career.color, 30)
+                self.flash.flash(career.color, 50)
+                pygame.time.wait(200)
+                
+                # Launch the career world
+                self.begin_career(scene_manager)
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                if not self.text_complete:
+                    self.finish_text()
+                elif not self.start_btn.disabled:
+                    self.begin_career(scene_manager)
+            
+            elif event.key == pygame.K_ESCAPE:
+                scene_manager.pop()
+    
+    def update(self, dt):
+        full_text = self.full_text
         
         # Typewriter effect
-        if not text_complete:
-            char_timer += dt
-            if char_timer >= char_delay and char_index < len(full_text):
-                displayed_text += full_text[char_index]
-                char_index += 1
-                char_timer = 0
+        if not self.text_complete:
+            self.char_timer += dt
+            if self.char_timer >= self.char_delay and self.char_index < len(full_text):
+                self.displayed_text += full_text[self.char_index]
+                self.char_index += 1
+                self.char_timer = 0
             
-            if char_index >= len(full_text):
-                text_complete = True
-                start_btn.disabled = False
+            if self.char_index >= len(full_text):
+                self.text_complete = True
+                self.start_btn.disabled = False
+        
+        # Update effects
+        self.particles.update(dt)
+        self.flash.update()
+    
+    def draw(self, screen):
+        career = self.career
+        screen.fill(BACKGROUND)
+        
+        # Header with career color
+        pygame.draw.rect(screen, career.color, BACKSTORY_LAYOUT["header"])
+        
+        draw_text(screen, f"{career.icon} {career.name} Path", 
+                 36, *BACKSTORY_LAYOUT["title"].topleft, WHITE, bold=True)
+        draw_text(screen, career.tagline, 16, *BACKSTORY_LAYOUT["tagline"].topleft, TEXT_SECONDARY)
         
         # Story card
-        card_rect = pygame.Rect(50, 110, Config.WIDTH - 100, 380)
-        pygame.draw.rect(SCREEN, CARD_BG, card_rect, border_radius=16)
+        card_rect = BACKSTORY_LAYOUT["card"]
+        pygame.draw.rect(screen, CARD_BG, card_rect, border_radius=16)
         
         # Story text
-        draw_wrapped_text(displayed_text, SCREEN, 80, 130, 20, WHITE, Config.WIDTH - 160)
+        draw_wrapped_text(self.displayed_text, screen, card_rect.x + 30, card_rect.y + 20, 20, WHITE,
+                          card_rect.width - 60)
         
         # Progress bar for text
-        if not text_complete:
-            progress = char_index / len(full_text)
+        if not self.text_complete:
+            progress = self.char_index / len(self.full_text)
             bar_width = 400
-            bar_x = (Config.WIDTH - bar_width) // 2
-            bar_y = 485
+            bar_x = card_rect.centerx - bar_width // 2
+            bar_y = card_rect.bottom - 5
             
-            pygame.draw.rect(SCREEN, CARD_BG, (bar_x, bar_y, bar_width, 6), border_radius=3)
-            pygame.draw.rect(SCREEN, career["color"], 
+            pygame.draw.rect(screen, CARD_BG, (bar_x, bar_y, bar_width, 6), border_radius=3)
+            pygame.draw.rect(screen, career.color, 
                            (bar_x, bar_y, int(bar_width * progress), 6), border_radius=3)
         
-        # Update effects
-        particles.update(dt)
-        flash.update()
-        particles.draw(SCREEN)
-        flash.draw(SCREEN)
+        self.particles.draw(screen)
+        self.flash.draw(screen)
         
         # Draw buttons
-        start_btn.draw(SCREEN)
-        skip_btn.draw(SCREEN)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mx, my = pygame.mouse.get_pos()
-                
-                if skip_btn.is_hover():
-                    displayed_text = full_text
-                    text_complete = True
-                    start_btn.disabled = False
-                
-                if start_btn.is_hover() and not start_btn.disabled:
-                    particles.emit(mx, my, career["color"], 30)
-                    flash.flash(career["color"], 50)
-                    pygame.time.wait(200)
-                    
-                    # Launch the career world
-                    world_class = career.get("world_class")
-                    if world_class:
-                        world = world_class()
-                        scene_manager.change_scene(world.run)
-                    return
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    if not text_complete:
-                        displayed_text = full_text
-                        text_complete = True
-                        start_btn.disabled = False
-                    elif not start_btn.disabled:
-                        world_class = career.get("world_class")
-                        if world_class:
-                            world = world_class()
-                            scene_manager.change_scene(world.run)
-                        return
-                
-                if event.key == pygame.K_ESCAPE:
-                    scene_manager.change_scene(enhanced_career_selection)
-                    return
-        
-        pygame.display.update()
+        self.start_btn.draw(screen)
+        self.skip_btn.draw(screen)
 
 
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
+def warm_up(menu, deadline):
+    """Startup work that can wait until the menu is on screen.
+
+    Runs as an idle task, in the time frames leave over, so the first
+    frame isn't held up by plugin discovery, story templates or
+    off-screen rendering.
+    """
+    with bootstrap.timed("scan career plugins"):
+        registry.careers()
+    yield
+    with bootstrap.timed("load story templates"):
+        importlib.import_module("engine.backstory_ai")
+    yield
+    with bootstrap.timed("build career screen"):
+        if menu.career_select is None:
+            menu.career_select = CareerSelectScene()
+
+
+def _startup_hook(menu):
+    """Frame hook that marks the first frame, then waits for the warm-up.
+
+    "first interactive frame" is the first one presented after warm-up, when
+    every menu action responds without a loading hitch.
+    """
+    warmer = None
+    
+    def hook(scene_manager, stats):
+        nonlocal warmer
+        if not stats.rendered:
+            return
+        if warmer is None:
+            bootstrap.mark("first frame")
+            # Runs even on busy frames once it has waited half a second
+            warmer = scene_manager.idle.post(lambda deadline: warm_up(menu, deadline),
+                                             timeout_ms=500)
+        elif warmer.done:
+            bootstrap.mark("first interactive frame")
+            scene_manager.frame_hooks.remove(hook)
+            if Config.TRACE_STARTUP:
+                print(bootstrap.report())
+    
+    return hook
+
+
 def run_game():
     """Initialize and run the game."""
-    global SCREEN
+    bootstrap.mark("run_game")
+    bootstrap.init(mixer=Config.AUDIO)
     
-    pygame.init()
-    pygame.font.init()
+    with bootstrap.timed("create window"):
+        display.create_window(Config.TITLE, (Config.WIDTH, Config.HEIGHT), Config.FULLSCREEN)
     
-    SCREEN = pygame.display.set_mode((Config.WIDTH, Config.HEIGHT))
-    pygame.display.set_caption(Config.TITLE)
+    with bootstrap.timed("load UI atlas"):
+        atlas.load()
+    if Config.DISK_CACHE:
+        with bootstrap.timed("open disk cache"):
+            diskcache.enable()
     
     # Set window icon (optional)
     try:
@@ -603,10 +724,56 @@ def run_game():
     except:
         pass
     
-    scene_manager = SceneManager()
-    scene_manager.change_scene(main_menu)
-    scene_manager.run()
+    scene_manager = SceneManager(Config.FPS, render_fps=Config.RENDER_FPS)
+    if Config.DISK_CACHE:
+        diskcache.attach(scene_manager)
+    if Config.METRICS:
+        metrics.enable(scene_manager)
+    if Config.KIOSK:
+        kiosk.MemoryWatchdog(MainMenuScene, Config.KIOSK_MAX_GROWTH_MB).attach(scene_manager)
+    if Config.PROFILE_ALLOCATIONS:
+        from engine.allocations import AllocationProfiler
+        AllocationProfiler().attach(scene_manager)
+    with bootstrap.timed("build main menu"):
+        menu = MainMenuScene()
+        scene_manager.push(menu)
+    bootstrap.mark("main loop start")
+    scene_manager.frame_hooks.append(_startup_hook(menu))
+    
+    if Config.ASYNC_LOOP:
+        import asyncio
+        from engine import aio
+        asyncio.run(aio.run(scene_manager))
+    else:
+        scene_manager.run()
+    diskcache.flush()
+    pygame.quit()
+
+
+def bake_atlas():
+    """Bake the static text of every screen into the UI atlas bundle."""
+    bootstrap.init()
+    display.create_window(Config.TITLE, (Config.WIDTH, Config.HEIGHT), False)
+    
+    careers = [career for career in registry.careers() if career.available]
+    screens = [MainMenuScene, AboutScene, CareerSelectScene]
+    screens += [lambda career=career: BackstoryScene(career, " ") for career in careers]
+    # Intros only, with an empty story: the generated story differs every run
+    screens += [lambda career=career: career.load()({"intro": ""}) for career in careers]
+    
+    count = atlas.bake(screens)
+    print(f"Baked {count} strings into {atlas.ATLAS_DIR}")
+    pygame.quit()
 
 
 if __name__ == "__main__":
-    run_game()
+    Config.TRACE_STARTUP = "--trace-startup" in sys.argv
+    Config.ASYNC_LOOP = "--async" in sys.argv
+    Config.DISK_CACHE = "--disk-cache" in sys.argv
+    Config.KIOSK = "--kiosk" in sys.argv
+    Config.PROFILE_ALLOCATIONS = "--profile-allocations" in sys.argv
+    Config.METRICS = "--no-metrics" not in sys.argv
+    if "--bake-atlas" in sys.argv:
+        bake_atlas()
+    else:
+        run_game()
@@ -0,0 +1,67 @@
+import pygame
+import pytest
+
+from engine.cache import CacheManager, surface_bytes
+
+
+def sized(value):
+    return value[1]
+
+
+def make_manager(budget):
+    manager = CacheManager(budget)
+    return manager, manager.register("text", sizeof=sized), manager.register("layers", sizeof=sized)
+
+
+def test_over_budget_evicts_lru_across_caches():
+    manager, text, layers = make_manager(100)
+    text.put("a", ("a", 30))
+    layers.put("b", ("b", 30))
+    text.put("c", ("c", 30))
+    assert text.get("a") is not None  # "b" is now the oldest
+
+    layers.put("d", ("d", 30))
+    assert "b" not in layers
+    assert "a" in text and "c" in text and "d" in layers
+    assert manager.bytes == text.bytes + layers.bytes == 90
+    assert layers.evictions == 1 and text.evictions == 0
+
+    text.put("e", ("e", 50))
+    assert "c" not in text and "a" not in text
+    assert manager.bytes <= manager.budget
+
+
+def test_reserved_bytes_count_against_budget():
+    manager, text, layers = make_manager(100)
+    text.put("a", ("a", 40))
+    layers.put("b", ("b", 40))
+
+    manager.reserve("atlas", 50)
+    assert "a" not in text and "b" in layers
+    assert manager.bytes == 90
+
+    manager.reserve("atlas", 10)
+    assert manager.bytes == 50
+    text.put("c", ("c", 40))
+    assert "b" in layers and "c" in text
+
+    manager.reserve("atlas", 0)
+    assert "atlas" not in manager.reserved
+    assert manager.bytes == 80
+
+
+def test_set_budget_trims_and_register_rejects_duplicates():
+    manager, text, layers = make_manager(1000)
+    for i in range(10):
+        (text if i % 2 else layers).put(i, (i, 50))
+    manager.set_budget(200)
+    assert manager.bytes == 200
+    assert [i for i in range(10) if i in text or i in layers] == [6, 7, 8, 9]
+    with pytest.raises(ValueError):
+        manager.register("text")
+
+
+def test_subsurface_bytes():
+    surf = pygame.Surface((10, 4), pygame.SRCALPHA)
+    assert surface_bytes(surf) == 160
+    assert surface_bytes(surf.subsurface((0, 0, 2, 2))) == 0
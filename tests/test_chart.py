@@ -0,0 +1,53 @@
+import math
+import random
+
+from engine.ui import ChartSeries, lttb
+
+
+def wave(n):
+    xs = list(range(n))
+    ys = [math.sin(x / 7.0) * 10 + (x % 13) for x in xs]
+    return xs, ys
+
+
+def test_lttb_short_series_unchanged():
+    xs, ys = wave(20)
+    assert lttb(xs, ys, 20) == list(zip(xs, ys))
+    assert lttb(xs, ys, 50) == list(zip(xs, ys))
+
+
+def test_lttb_keeps_ends_and_threshold():
+    xs, ys = wave(1000)
+    for threshold in (3, 10, 97, 500):
+        sampled = lttb(xs, ys, threshold)
+        assert len(sampled) == threshold
+        assert sampled[0] == (xs[0], ys[0])
+        assert sampled[-1] == (xs[-1], ys[-1])
+        assert [x for x, _ in sampled] == sorted(x for x, _ in sampled)
+
+
+def test_series_keeps_extremes_when_folding():
+    random.seed(3)
+    values = [random.uniform(-1, 1) for _ in range(10000)]
+    values[4321] = 50.0
+    values[8765] = -50.0
+    series = ChartSeries(max_buckets=16)
+    for value in values:
+        series.append(value)
+
+    points = series.points()
+    assert len(series) == len(values)
+    assert series.bucket_size > 1
+    assert len(points) <= 2 * 16 + 2
+    assert (4321, 50.0) in points
+    assert (8765, -50.0) in points
+    assert series.min_y == -50.0 and series.max_y == 50.0
+    assert series.first_x == 0 and series.last_x == len(values) - 1
+    assert [x for x, _ in points] == sorted(x for x, _ in points)
+
+
+def test_series_short_keeps_every_sample():
+    series = ChartSeries(max_buckets=16)
+    for value in (3, 1, 4, 1, 5):
+        series.append(value)
+    assert series.points() == [(0, 3), (1, 1), (2, 4), (3, 1), (4, 5)]
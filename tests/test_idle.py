@@ -0,0 +1,122 @@
+import types
+
+import pytest
+
+from engine import idle
+from engine.idle import IdleScheduler
+
+
+class FakeClock:
+    """perf_counter stand-in that only moves when a test advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(idle, "time", types.SimpleNamespace(perf_counter=clock))
+    return clock
+
+
+def frame_end(clock, idle_ms):
+    """A frame end leaving `idle_ms` of idle time after the margin."""
+    return clock() + (idle_ms + idle.IDLE_MARGIN_MS) / 1000.0
+
+
+def test_tasks_run_until_deadline(clock):
+    scheduler = IdleScheduler()
+    ran = []
+
+    def task(name):
+        def run(deadline):
+            ran.append((name, deadline.time_remaining()))
+            clock.advance(4)
+        return run
+
+    for name in "abc":
+        scheduler.post(task(name))
+
+    assert scheduler.run(frame_end(clock, 6)) == 2
+    assert [name for name, _ in ran] == ["a", "b"]
+    assert [left for _, left in ran] == pytest.approx([6.0, 2.0])
+    assert len(scheduler) == 1
+
+    assert scheduler.run(frame_end(clock, 0)) == 0
+    assert scheduler.run(frame_end(clock, 10)) == 1
+    assert [name for name, _ in ran] == ["a", "b", "c"]
+    assert len(scheduler) == 0 and scheduler.slices == 3
+
+
+def test_generator_task_resumes_next_frame(clock):
+    scheduler = IdleScheduler()
+    done = []
+
+    def warm(deadline):
+        for i in range(5):
+            clock.advance(3)
+            done.append(i)
+            if deadline.time_remaining() < 3:
+                yield
+
+    task = scheduler.post(warm)
+    scheduler.run(frame_end(clock, 7))
+    assert done == [0, 1, 2] and not task.done
+    scheduler.run(frame_end(clock, 100))
+    assert done == [0, 1, 2, 3, 4] and task.done
+    assert len(scheduler) == 0
+
+
+def test_cancelled_task_is_skipped(clock):
+    scheduler = IdleScheduler()
+    ran = []
+    scheduler.post(lambda deadline: ran.append("a")).cancel()
+    scheduler.post(lambda deadline: ran.append("b"))
+    scheduler.run(frame_end(clock, 5))
+    assert ran == ["b"]
+
+
+@pytest.mark.parametrize("timeout_ms", [0, 50])
+def test_overdue_task_gets_one_forced_slice_per_frame(clock, timeout_ms):
+    scheduler = IdleScheduler()
+    timeouts = []
+
+    def steps(deadline):
+        for _ in range(3):
+            timeouts.append(deadline.did_timeout)
+            clock.advance(2)
+            yield
+
+    task = scheduler.post(steps, timeout_ms=timeout_ms)
+
+    # No idle time and not yet overdue: nothing runs
+    if timeout_ms:
+        assert scheduler.run(frame_end(clock, -1)) == 0
+        clock.advance(timeout_ms)
+
+    for frame in range(3):
+        assert scheduler.run(frame_end(clock, -1)) == 1
+        assert len(timeouts) == frame + 1
+    assert scheduler.forced == 3
+    assert timeouts == [True, True, True]
+    assert not task.done
+
+    scheduler.run(frame_end(clock, -1))
+    assert task.done
+
+
+def test_failing_task_is_dropped(clock, capsys):
+    scheduler = IdleScheduler()
+    ran = []
+    scheduler.post(lambda deadline: 1 / 0)
+    scheduler.post(lambda deadline: ran.append(True))
+    assert scheduler.run(frame_end(clock, 5)) == 2
+    assert ran == [True]
+    assert "failed" in capsys.readouterr().out
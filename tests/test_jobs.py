@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from engine.jobs import CancelledError, JobSystem
+
+
+def pump_until(jobs, condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "jobs did not finish in time"
+        jobs.pump()
+        time.sleep(0.001)
+
+
+def fail():
+    raise ValueError("no story")
+
+
+def test_on_done_runs_on_pumping_thread():
+    jobs = JobSystem()
+    done = {}
+
+    def on_done(job):
+        done[job.fn.__name__] = (threading.get_ident(), job)
+
+    try:
+        jobs.submit(lambda: threading.get_ident(), on_done=on_done)
+        jobs.submit(fail, on_done=on_done)
+        pump_until(jobs, lambda: len(done) == 2)
+    finally:
+        jobs.shutdown()
+
+    main = threading.get_ident()
+    thread, ok = done["<lambda>"]
+    assert thread == main
+    assert ok.exception() is None
+    assert ok.result() != main  # the work itself ran on a worker
+
+    thread, failed = done["fail"]
+    assert thread == main
+    assert isinstance(failed.exception(), ValueError)
+    with pytest.raises(ValueError):
+        failed.result()
+
+    assert jobs.counters.completed == 1 and jobs.counters.failed == 1
+    assert jobs.pending() == 0
+
+
+def test_cancelled_job_never_calls_back():
+    jobs = JobSystem(workers=1)
+    release = threading.Event()
+    calls = []
+    try:
+        blocker = jobs.submit(release.wait)
+        job = jobs.submit(lambda: None, on_done=calls.append)
+        assert job.cancel()
+        release.set()
+        pump_until(jobs, blocker.done)
+        jobs.pump()
+    finally:
+        jobs.shutdown()
+    assert calls == []
+    assert job.cancelled()
+    with pytest.raises(CancelledError):
+        job.result()
@@ -1,18 +1,28 @@
 """
 Step Into My Shoes - Career Worlds
 Interactive mini-game worlds for each career path.
+
+World classes are imported on first attribute access, so importing the
+package (or one world) doesn't pull in every other world module.
 """
 
-from worlds.doctor import DoctorWorld
-from worlds.lawyer import LawyerWorld
-from worlds.influencer import InfluencerWorld
-from worlds.politician import PoliticianWorld
-from worlds.engineer import EngineerWorld
+import importlib
+
+_WORLD_MODULES = {
+    'DoctorWorld': 'worlds.doctor',
+    'LawyerWorld': 'worlds.lawyer',
+    'InfluencerWorld': 'worlds.influencer',
+    'PoliticianWorld': 'worlds.politician',
+    'EngineerWorld': 'worlds.engineer',
+}
+
+__all__ = list(_WORLD_MODULES)
+
 
-__all__ = [
-    'DoctorWorld',
-    'LawyerWorld', 
-    'InfluencerWorld',
-    'PoliticianWorld',
-    'EngineerWorld'
-]
+def __getattr__(name):
+    module_name = _WORLD_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    world_class = getattr(importlib.import_module(module_name), name)
+    globals()[name] = world_class
+    return world_class
@@ -7,19 +7,20 @@ Teaches: Speed, decision-making, attention under pressure.
 import pygame
 import random
 from engine.colors import (
-    BACKGROUND, WHITE, BLACK, GREY, DOCTOR_PRIMARY, DOCTOR_SECONDARY,
+    WHITE, BLACK, GREY, DOCTOR_PRIMARY, DOCTOR_SECONDARY,
     DOCTOR_ACCENT, SUCCESS, DANGER, WARNING, TEXT_SECONDARY, CARD_BG,
     ACCENT, TEXT_MUTED
 )
 from engine.ui import (
     draw_text, draw_text_left, draw_wrapped_text, ModernButton,
-    ParticleSystem, ScreenFlash, draw_lives
+    ParticleSystem, ScreenFlash, draw_lives, WidgetPool, TimeSeriesChart,
+    ECGMonitor
 )
 from engine.backstory_ai import get_performance_feedback, get_career_lesson
+from engine.layout import DESIGN_SIZE
+from engine.world import BaseWorld, ResultsSnapshot
 
-pygame.init()
-
-WIDTH, HEIGHT = 900, 600
+WIDTH, HEIGHT = DESIGN_SIZE
 
 # Patient data with symptoms and correct diagnoses
 PATIENT_CASES = [
@@ -87,6 +88,14 @@ PATIENT_CASES = [
 
 ALL_DIAGNOSES = [case["diagnosis"] for case in PATIENT_CASES]
 
+# Heart rate (bpm) and trace amplitude shown on the vitals monitor
+SEVERITY_VITALS = {
+    "mild": (72, 0.8),
+    "moderate": (96, 0.9),
+    "urgent": (118, 1.0),
+    "critical": (142, 1.15),
+}
+
 
 class Patient:
     """Represents a patient case."""
@@ -99,6 +108,10 @@ class Patient:
         self.treated = False
         self.result = None
     
+    def get_vitals(self):
+        """Return (heart rate, trace amplitude) for this patient's severity."""
+        return SEVERITY_VITALS.get(self.severity, SEVERITY_VITALS["moderate"])
+    
     def get_severity_color(self):
         if self.severity == "critical":
             return DANGER
@@ -109,17 +122,19 @@ class Patient:
         return ACCENT
 
 
-class DoctorWorld:
+class DoctorWorld(BaseWorld):
     """
     Doctor Career Mini-Game
     Players diagnose patients by matching symptoms to conditions.
     """
     
+    STATES = ("intro", "gameplay", "feedback", "results")
+    
     def __init__(self, story_package=None):
+        super().__init__(story_package)
         self.story = story_package or {
             "intro": "Welcome to the Emergency Room!\n\nPatients are arriving with various symptoms.\nYour job is to correctly diagnose each one.\n\nRead the symptoms carefully and select the right diagnosis.\nSpeed and accuracy both matter!"
         }
-        self.state = "intro"
         self.score = 0
         self.total_patients = 5
         self.current_patient_index = 0
@@ -144,6 +159,14 @@ class DoctorWorld:
         self.feedback_timer = 0
         self.feedback_color = WHITE
         
+        # Seconds taken per patient, charted on the results screen
+        self.reaction_chart = TimeSeriesChart(650, 15, 230, 70, title="Response Time")
+        self.reaction_chart.add_series("reaction", DOCTOR_ACCENT, "line",
+                                       y_range=(0, self.time_per_patient))
+        
+        # Live vitals monitor next to the symptom card
+        self.monitor = ECGMonitor(575, 110, 225, 140)
+        
         # UI elements
         self.start_btn = ModernButton(350, 480, 200, 55, "Start Shift",
                                        DOCTOR_PRIMARY, DOCTOR_SECONDARY)
@@ -155,9 +178,11 @@ class DoctorWorld:
                                       CARD_BG, DOCTOR_PRIMARY)
         
         self.option_buttons = []
+        self.option_pool = WidgetPool(
+            lambda: ModernButton(150, 280, 600, 55, "", CARD_BG, DOCTOR_ACCENT)
+        )
         self.generate_patients()
         
-        self.clock = pygame.time.Clock()
         self.scene_manager = None
     
     def generate_patients(self):
@@ -174,6 +199,8 @@ class DoctorWorld:
             self.current_patient_index = index
             self.time_remaining = self.time_per_patient
             self.selected_option = None
+            bpm, amplitude = self.current_patient.get_vitals()
+            self.monitor.set_waveform(bpm, amplitude, self.current_patient.get_severity_color())
             
             # Generate answer options (1 correct + 3 wrong)
             correct = self.current_patient.correct_diagnosis
@@ -183,100 +210,61 @@ class DoctorWorld:
             self.options = [correct] + wrong_options[:3]
             random.shuffle(self.options)
             
-            # Create option buttons
-            self.option_buttons = []
-            for i, option in enumerate(self.options):
-                btn = ModernButton(
-                    150, 280 + i * 65, 600, 55, option,
-                    CARD_BG, DOCTOR_ACCENT
-                )
-                self.option_buttons.append(btn)
+            # Rebind pooled option buttons to the new answers
+            self.option_buttons = self.option_pool.bind(
+                {"text": option, "x": 150, "y": 280 + i * 65}
+                for i, option in enumerate(self.options)
+            )
     
-    def run(self, scene_manager):
-        """Main game loop."""
-        self.scene_manager = scene_manager
-        screen = pygame.display.get_surface()
-        running = True
-
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_click(event)
-
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key(event)
-
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+    def click_intro(self, event):
+        if self.start_btn.is_clicked(event):
+            self.state = "gameplay"
+    
+    def click_gameplay(self, event):
+        # Use the event position for robust click detection
+        for i, btn in enumerate(self.option_buttons):
+            if btn.is_clicked(event):
+                self.submit_answer(i)
+                break
     
-    def handle_click(self, event):
-        """Handle mouse clicks."""
-        if self.state == "intro":
-            if self.start_btn.is_clicked(event):
+    def click_feedback(self, event):
+        if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
+            if self.current_patient_index < len(self.patients) - 1:
+                self.load_patient(self.current_patient_index + 1)
                 self.state = "gameplay"
-
-        elif self.state == "gameplay":
-            # Use the event position for robust click detection
-            for i, btn in enumerate(self.option_buttons):
-                if btn.is_clicked(event):
-                    self.submit_answer(i)
-                    break
-
-        elif self.state == "feedback":
-            if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
-                if self.current_patient_index < len(self.patients) - 1:
-                    self.load_patient(self.current_patient_index + 1)
-                    self.state = "gameplay"
-                else:
-                    self.state = "results"
-
-        elif self.state == "results":
-            if self.back_btn.is_clicked(event):
-                # Try robust scene change back to hub/menu
-                try:
-                    from main import enhanced_career_selection
-                    if self.scene_manager is not None:
-                        self.scene_manager.change_scene(enhanced_career_selection)
-                except Exception:
-                    if self.scene_manager is not None:
-                        try:
-                            self.scene_manager.change_scene("hub")
-                        except Exception:
-                            pass
-                return
+            else:
+                self.state = "results"
     
-    def handle_key(self, event):
-        """Handle keyboard input."""
-        if self.state == "gameplay":
-            # Ensure options exist to avoid ZeroDivision / IndexErrors
-            if not self.options:
-                return
-            n = len(self.options)
-            if event.key == pygame.K_UP:
-                if self.selected_option is None:
-                    self.selected_option = n - 1
-                else:
-                    self.selected_option = (self.selected_option - 1) % n
-            elif event.key == pygame.K_DOWN:
-                if self.selected_option is None:
-                    self.selected_option = 0
-                else:
-                    self.selected_option = (self.selected_option + 1) % n
-            elif event.key == pygame.K_RETURN:
-                # Validate index before submitting
-                if self.selected_option is not None and 0 <= self.selected_option < n:
-                    self.submit_answer(self.selected_option)
-            elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
-                idx = event.key - pygame.K_1
-                if 0 <= idx < n:
-                    self.submit_answer(idx)
+    def click_results(self, event):
+        if self.back_btn.is_clicked(event):
+            # Back to the (suspended) career selection screen
+            if self.scene_manager is not None:
+                self.scene_manager.pop()
+    
+    def key_gameplay(self, event):
+        """Arrow keys / Enter / 1-4 pick a diagnosis."""
+        # Ensure options exist to avoid ZeroDivision / IndexErrors
+        if not self.options:
+            return
+        n = len(self.options)
+        if event.key == pygame.K_UP:
+            if self.selected_option is None:
+                self.selected_option = n - 1
+            else:
+                self.selected_option = (self.selected_option - 1) % n
+        elif event.key == pygame.K_DOWN:
+            if self.selected_option is None:
+                self.selected_option = 0
+            else:
+                self.selected_option = (self.selected_option + 1) % n
+        elif event.key == pygame.K_RETURN:
+            # Validate index before submitting
+            if self.selected_option is not None and 0 <= self.selected_option < n:
+                self.submit_answer(self.selected_option)
+        elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
+            idx = event.key - pygame.K_1
+            if 0 <= idx < n:
+                self.submit_answer(idx)
     
     def submit_answer(self, selected_index):
         """Check the selected answer."""
@@ -288,6 +276,7 @@ class DoctorWorld:
 
         selected = self.options[selected_index]
         correct = self.current_patient.correct_diagnosis
+        self.reaction_chart.append("reaction", self.time_per_patient - self.time_remaining)
         
         if selected == correct:
             # Correct answer
@@ -351,31 +340,42 @@ class DoctorWorld:
         if self.feedback_timer > 0:
             self.feedback_timer -= dt
         
-        if self.state == "gameplay":
-            self.time_remaining -= dt
-            if self.time_remaining <= 0:
-                # Time's up - auto submit wrong
-                self.combo = 0
-                if self.current_patient is not None:
-                    self.current_patient.result = "timeout"
-                self.feedback_text = "Time's Up!"
-                self.feedback_color = DANGER
-                self.feedback_timer = 1.5
-                self.state = "feedback"
+        super().update(dt)
+    
+    def enter_feedback(self):
+        # Warm the next patient's text while this feedback is on screen
+        self.prerender_upcoming()
+    
+    def upcoming_text(self):
+        index = self.current_patient_index + 1
+        if index >= len(self.patients):
+            return []
+        patient = self.patients[index]
+        texts = [(f"Patient {index + 1}/{len(self.patients)}", 28, WHITE, True),
+                 (f"Hint: {patient.hint}", 16, TEXT_MUTED)]
+        texts += [(f"• {symptom}", 22, WHITE) for symptom in patient.symptoms]
+        return texts
+    
+    def update_gameplay(self, dt):
+        self.monitor.update(dt)
+        self.time_remaining -= dt
+        if self.time_remaining <= 0:
+            # Time's up - auto submit wrong
+            self.combo = 0
+            if self.current_patient is not None:
+                self.current_patient.result = "timeout"
+            self.reaction_chart.append("reaction", self.time_per_patient)
+            self.feedback_text = "Time's Up!"
+            self.feedback_color = DANGER
+            self.feedback_timer = 1.5
+            self.state = "feedback"
+    
+    def update_feedback(self, dt):
+        self.monitor.update(dt)
     
     def draw(self, screen):
         """Draw current state."""
-        screen.fill(BACKGROUND)
-        
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "feedback":
-            self.draw_feedback(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
-        
+        super().draw(screen)
         self.particles.draw(screen)
         self.flash.draw(screen)
     
@@ -431,7 +431,7 @@ class DoctorWorld:
         
         # Patient card
         if self.current_patient:
-            card_rect = pygame.Rect(100, 110, 700, 140)
+            card_rect = pygame.Rect(100, 110, 460, 140)
             pygame.draw.rect(screen, CARD_BG, card_rect, border_radius=12)
             
             # Severity indicator
@@ -448,6 +448,8 @@ class DoctorWorld:
             # Hint
             draw_text_left(screen, f"Hint: {self.current_patient.hint}", 
                      16, 140, 235, TEXT_MUTED)
+            
+            self.monitor.draw(screen)
         
         # Answer options
         draw_text(screen, "Select Diagnosis:", 20, WIDTH // 2, 265, TEXT_SECONDARY)
@@ -489,26 +491,10 @@ class DoctorWorld:
         else:
             self.finish_btn.draw(screen)
     
-    def draw_results(self, screen):
-        """Draw results screen."""
-        # Header
-        header_rect = pygame.Rect(0, 0, WIDTH, 100)
-        pygame.draw.rect(screen, DOCTOR_PRIMARY, header_rect)
-        draw_text(screen, "Shift Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(screen, "Emergency Room Results", 18, WIDTH // 2, 72, TEXT_SECONDARY)
-        
-        # Stats
+    def compute_results(self):
+        """Final stats, grade and feedback for the shift."""
         correct_count = sum(1 for p in self.patients if p.result == "correct")
         
-        stats_y = 140
-        draw_text(screen, f"Patients Treated: {correct_count}/{len(self.patients)}", 
-                 28, WIDTH // 2, stats_y, WHITE, bold=True)
-        draw_text(screen, f"Total Score: {self.score}", 
-                 24, WIDTH // 2, stats_y + 45, DOCTOR_ACCENT)
-        draw_text(screen, f"Best Combo: x{self.max_combo}", 
-                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
-        
-        # Grade
         percentage = (correct_count / len(self.patients)) * 100
         if percentage >= 80:
             grade = "A"
@@ -523,15 +509,45 @@ class DoctorWorld:
             grade = "D"
             grade_color = DANGER
         
-        draw_text(screen, f"Grade: {grade}", 48, WIDTH // 2, stats_y + 140, grade_color, bold=True)
+        return ResultsSnapshot(
+            {"correct": correct_count, "patients": len(self.patients),
+             "score": self.score, "max_combo": self.max_combo},
+            grade, grade_color,
+            get_performance_feedback("Doctor", correct_count, len(self.patients)),
+            get_career_lesson("Doctor"))
+    
+    def render_results(self, layer, results):
+        """Render the static results screen."""
+        stats = results.stats
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, WIDTH, 100)
+        pygame.draw.rect(layer, DOCTOR_PRIMARY, header_rect)
+        draw_text(layer, "Shift Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
+        draw_text(layer, "Emergency Room Results", 18, WIDTH // 2, 72, TEXT_SECONDARY)
+        self.reaction_chart.draw(layer)
+        
+        # Stats
+        stats_y = 140
+        draw_text(layer, f"Patients Treated: {stats['correct']}/{stats['patients']}", 
+                 28, WIDTH // 2, stats_y, WHITE, bold=True)
+        draw_text(layer, f"Total Score: {stats['score']}", 
+                 24, WIDTH // 2, stats_y + 45, DOCTOR_ACCENT)
+        draw_text(layer, f"Best Combo: x{stats['max_combo']}", 
+                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
+        
+        # Grade
+        draw_text(layer, f"Grade: {results.grade}", 48, WIDTH // 2, stats_y + 140,
+                  results.grade_color, bold=True)
         
         # Feedback message
-        feedback = get_performance_feedback("Doctor", correct_count, len(self.patients))
-        draw_wrapped_text(feedback, screen, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
+        draw_wrapped_text(results.feedback, layer, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
         
         # Real-world lesson
-        lesson = get_career_lesson("Doctor")
-        draw_text(screen, "What Real Doctors Do:", 20, WIDTH // 2, stats_y + 280, DOCTOR_ACCENT, bold=True)
-        draw_wrapped_text(lesson, screen, 100, stats_y + 310, 16, TEXT_MUTED, 700)
-        
+        draw_text(layer, "What Real Doctors Do:", 20, WIDTH // 2, stats_y + 280, DOCTOR_ACCENT, bold=True)
+        draw_wrapped_text(results.lesson, layer, 100, stats_y + 310, 16, TEXT_MUTED, 700)
+    
+    def draw_results(self, screen):
+        """Draw results screen."""
+        super().draw_results(screen)
         self.back_btn.draw(screen)
@@ -26,7 +26,7 @@ Ursina app and co-exist with other 3D worlds.
 from engine.ursina_framework import GameRunner, GameWorld
 import random
 try:
-    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio
+    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio, destroy
     from ursina.prefabs.first_person_controller import FirstPersonController
 except Exception:
     raise ImportError('Ursina is required to run 3D worlds (pip install ursina)')
@@ -63,7 +63,7 @@ class Patient3D:
 class Doctor3DWorld(GameWorld):
     def on_start(self):
         # Player controller
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         # use integer height to match controller expectations
         self.player.height = 2
 
@@ -76,7 +76,7 @@ class Doctor3DWorld(GameWorld):
 
         # UI (screen-space via camera.ui)
         # panel background
-        panel = Entity(parent=camera.ui, model='quad', scale=Vec3(0.78, 0.36, 1), color=color.rgba(10,10,10,140), position=Vec3(0, -0.3, 0))
+        panel = self.spawn(Entity(parent=camera.ui, model='quad', scale=Vec3(0.78, 0.36, 1), color=color.rgba(10,10,10,140), position=Vec3(0, -0.3, 0)))
 
         self.symptoms_text = self.spawn(Text(parent=camera.ui, text='', position=(-0.68, -0.23), origin=(0,0), scale=1.1))
         self.timer_text = self.spawn(Text(parent=camera.ui, text='', position=(0.62, -0.18), origin=(0,0), scale=1.0))
@@ -117,6 +117,8 @@ class Doctor3DWorld(GameWorld):
         positions = [Vec3(-6,0, -4), Vec3(-2,0,-5), Vec3(2,0,-5), Vec3(6,0,-4), Vec3(0,0,2)]
         cases = random.sample(PATIENT_CASES, min(5, len(PATIENT_CASES)))
         self.patients = [Patient3D(positions[i], cases[i]) for i in range(len(cases))]
+        for patient in self.patients:
+            self.spawn(patient.entity)  # its label is a child and goes with it
 
     def next_patient(self):
         self.current_index += 1
@@ -227,7 +229,7 @@ class Doctor3DWorld(GameWorld):
             except Exception:
                 pass
         # disable after delay
-        invoke(lambda: [setattr(x, 'enabled', False) for x in probes], delay=0.6)
+        invoke(lambda: [destroy(x) for x in probes], delay=0.6)
 
     def clear_message_and_next(self):
         self.message_text.text = ''
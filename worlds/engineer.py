@@ -13,13 +13,13 @@ from engine.colors import (
 )
 from engine.ui import (
     draw_text, draw_text_left, draw_wrapped_text, ModernButton, ParticleSystem, ScreenFlash,
-    ProgressBar
+    ProgressBar, get_font
 )
 from engine.backstory_ai import get_performance_feedback, get_career_lesson
+from engine.layout import DESIGN_SIZE
+from engine.world import BaseWorld, ResultsSnapshot
 
-pygame.init()
-
-WIDTH, HEIGHT = 900, 600
+WIDTH, HEIGHT = DESIGN_SIZE
 
 # Circuit component definitions
 COMPONENTS = {
@@ -129,23 +129,25 @@ class GridCell:
             symbol = comp_data.get("symbol", "?")
             color = comp_data.get("color", WHITE)
             
-            font = pygame.font.SysFont("arial", 24, bold=True)
+            font = get_font("arial", 24, bold=True)
             text = font.render(symbol, True, color)
             text_rect = text.get_rect(center=rect.center)
             screen.blit(text, text_rect)
 
 
-class EngineerWorld:
+class EngineerWorld(BaseWorld):
     """
     Engineer Career Mini-Game
     Players place components in the correct positions to complete circuits.
     """
     
+    STATES = ("intro", "gameplay", "puzzle_complete", "results")
+    
     def __init__(self, story_package=None):
+        super().__init__(story_package)
         self.story = story_package or {
             "intro": "Welcome to the Engineering Lab!\n\nYou must complete circuit designs by placing components in the correct positions.\n\nSelect components from your inventory and place them on target cells.\nWork quickly but accurately!"
         }
-        self.state = "intro"
         self.score = 0
         self.total_puzzles = 4
         self.current_puzzle_index = 0
@@ -192,7 +194,6 @@ class EngineerWorld:
         self.inventory_buttons = []
         self.generate_puzzles()
         
-        self.clock = pygame.time.Clock()
         self.scene_manager = None
     
     def generate_puzzles(self):
@@ -255,111 +256,81 @@ class EngineerWorld:
                     "used": False
                 })
     
-    def run(self, scene_manager):
-        """Main game loop."""
-        self.scene_manager = scene_manager
-        screen = pygame.display.get_surface()
-        running = True
-        
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_click(event)
-                
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key(event)
-            
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+    def click_intro(self, event):
+        if self.start_btn.is_clicked(event):
+            self.state = "gameplay"
     
-    def handle_click(self, event):
-        """Handle mouse clicks."""
+    def click_gameplay(self, event):
         mx, my = event.pos
         
-        if self.state == "intro":
-            if self.start_btn.is_clicked(event):
-                self.state = "gameplay"
+        # Check inventory clicks
+        for inv_btn in self.inventory_buttons:
+            if inv_btn["rect"].collidepoint(mx, my) and not inv_btn["used"]:
+                self.selected_component = inv_btn["component"]
+                self.selected_cell = None
+                break
         
-        elif self.state == "gameplay":
-            # Check inventory clicks
-            for inv_btn in self.inventory_buttons:
-                if inv_btn["rect"].collidepoint(mx, my) and not inv_btn["used"]:
-                    self.selected_component = inv_btn["component"]
-                    self.selected_cell = None
+        # Check grid clicks
+        for row in self.grid:
+            for cell in row:
+                if cell.get_rect().collidepoint(mx, my):
+                    if self.selected_component and cell.is_target and not cell.component:
+                        # Place component
+                        cell.component = self.selected_component
+                        self.total_placed += 1
+                        
+                        # Mark inventory as used
+                        for inv_btn in self.inventory_buttons:
+                            if inv_btn["component"] == self.selected_component and not inv_btn["used"]:
+                                inv_btn["used"] = True
+                                break
+                        
+                        self.selected_component = None
+                        
+                        # Check if correct
+                        if cell.component == cell.expected_component:
+                            cell.is_correct = True
+                            self.particles.emit(cell.x + self.cell_size // 2,
+                                               cell.y + self.cell_size // 2,
+                                               SUCCESS, 10)
+                        
+                        # Check if puzzle is complete
+                        if self.check_puzzle_complete():
+                            self.complete_puzzle()
+                    elif cell.component:
+                        # Remove component
+                        removed = cell.component
+                        cell.component = None
+                        cell.is_correct = False
+                        
+                        # Return to inventory
+                        for inv_btn in self.inventory_buttons:
+                            if inv_btn["component"] == removed and inv_btn["used"]:
+                                inv_btn["used"] = False
+                                break
                     break
-            
-            # Check grid clicks
-            for row in self.grid:
-                for cell in row:
-                    if cell.get_rect().collidepoint(mx, my):
-                        if self.selected_component and cell.is_target and not cell.component:
-                            # Place component
-                            cell.component = self.selected_component
-                            self.total_placed += 1
-                            
-                            # Mark inventory as used
-                            for inv_btn in self.inventory_buttons:
-                                if inv_btn["component"] == self.selected_component and not inv_btn["used"]:
-                                    inv_btn["used"] = True
-                                    break
-                            
-                            self.selected_component = None
-                            
-                            # Check if correct
-                            if cell.component == cell.expected_component:
-                                cell.is_correct = True
-                                self.particles.emit(cell.x + self.cell_size // 2,
-                                                   cell.y + self.cell_size // 2,
-                                                   SUCCESS, 10)
-                            
-                            # Check if puzzle is complete
-                            if self.check_puzzle_complete():
-                                self.complete_puzzle()
-                        elif cell.component:
-                            # Remove component
-                            removed = cell.component
-                            cell.component = None
-                            cell.is_correct = False
-                            
-                            # Return to inventory
-                            for inv_btn in self.inventory_buttons:
-                                if inv_btn["component"] == removed and inv_btn["used"]:
-                                    inv_btn["used"] = False
-                                    break
-                        break
-            
-            # Check submit button
-            if self.submit_btn.is_clicked(event):
-                self.complete_puzzle()
-        
-        elif self.state == "puzzle_complete":
-            if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
-                if self.current_puzzle_index < len(self.puzzles) - 1:
-                    self.load_puzzle(self.current_puzzle_index + 1)
-                    self.state = "gameplay"
-                else:
-                    self.state = "results"
-        
-        elif self.state == "results":
-            if self.back_btn.is_clicked(event):
-                from main import enhanced_career_selection
-                self.scene_manager.change_scene(enhanced_career_selection)
-                return
+        
+        # Check submit button
+        if self.submit_btn.is_clicked(event):
+            self.complete_puzzle()
     
-    def handle_key(self, event):
-        """Handle keyboard input."""
-        if self.state == "gameplay":
-            if event.key == pygame.K_ESCAPE:
-                self.selected_component = None
-            elif event.key == pygame.K_RETURN:
-                self.complete_puzzle()
+    def click_puzzle_complete(self, event):
+        if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
+            if self.current_puzzle_index < len(self.puzzles) - 1:
+                self.load_puzzle(self.current_puzzle_index + 1)
+                self.state = "gameplay"
+            else:
+                self.state = "results"
+    
+    def click_results(self, event):
+        if self.back_btn.is_clicked(event):
+            self.scene_manager.pop()
+    
+    def key_gameplay(self, event):
+        if event.key == pygame.K_ESCAPE:
+            self.selected_component = None
+        elif event.key == pygame.K_RETURN:
+            self.complete_puzzle()
     
     def check_puzzle_complete(self):
         """Check if all targets have correct components."""
@@ -414,25 +385,17 @@ class EngineerWorld:
         if self.feedback_timer > 0:
             self.feedback_timer -= dt
         
-        if self.state == "gameplay":
-            self.time_remaining -= dt
-            if self.time_remaining <= 0:
-                self.time_remaining = 0
-                self.complete_puzzle()
+        super().update(dt)
+    
+    def update_gameplay(self, dt):
+        self.time_remaining -= dt
+        if self.time_remaining <= 0:
+            self.time_remaining = 0
+            self.complete_puzzle()
     
     def draw(self, screen):
         """Draw current state."""
-        screen.fill(BACKGROUND)
-        
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "puzzle_complete":
-            self.draw_puzzle_complete(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
-        
+        super().draw(screen)
         self.particles.draw(screen)
         self.flash.draw(screen)
     
@@ -578,24 +541,8 @@ class EngineerWorld:
         else:
             self.finish_btn.draw(screen)
     
-    def draw_results(self, screen):
-        """Draw final results screen."""
-        # Header
-        header_rect = pygame.Rect(0, 0, WIDTH, 100)
-        pygame.draw.rect(screen, ENGINEER_PRIMARY, header_rect)
-        draw_text(screen, "Project Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(screen, "Engineering Performance Review", 18, WIDTH // 2, 72, TEXT_SECONDARY)
-        
-        # Stats
-        stats_y = 130
-        draw_text(screen, f"Total Score: {self.score}", 
-                 32, WIDTH // 2, stats_y, WHITE, bold=True)
-        draw_text(screen, f"Perfect Circuits: {self.perfect_solves}/{len(self.puzzles)}", 
-                 24, WIDTH // 2, stats_y + 45, ENGINEER_ACCENT)
-        draw_text(screen, f"Components Placed: {self.total_placed}", 
-                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
-        
-        # Grade
+    def compute_results(self):
+        """Final stats, rank and feedback for the project."""
         perfect_pct = (self.perfect_solves / len(self.puzzles)) * 100 if self.puzzles else 0
         
         if perfect_pct >= 75:
@@ -611,16 +558,44 @@ class EngineerWorld:
             grade = "Engineering Intern"
             grade_color = DANGER
         
-        draw_text(screen, grade, 36, WIDTH // 2, stats_y + 145, grade_color, bold=True)
+        return ResultsSnapshot(
+            {"score": self.score, "perfect": self.perfect_solves,
+             "puzzles": len(self.puzzles), "placed": self.total_placed},
+            grade, grade_color,
+            get_performance_feedback("Engineer", self.perfect_solves, len(self.puzzles)),
+            get_career_lesson("Engineer"))
+    
+    def render_results(self, layer, results):
+        """Render the static results screen."""
+        stats = results.stats
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, WIDTH, 100)
+        pygame.draw.rect(layer, ENGINEER_PRIMARY, header_rect)
+        draw_text(layer, "Project Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
+        draw_text(layer, "Engineering Performance Review", 18, WIDTH // 2, 72, TEXT_SECONDARY)
+        
+        # Stats
+        stats_y = 130
+        draw_text(layer, f"Total Score: {stats['score']}", 
+                 32, WIDTH // 2, stats_y, WHITE, bold=True)
+        draw_text(layer, f"Perfect Circuits: {stats['perfect']}/{stats['puzzles']}", 
+                 24, WIDTH // 2, stats_y + 45, ENGINEER_ACCENT)
+        draw_text(layer, f"Components Placed: {stats['placed']}", 
+                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
+        
+        # Grade
+        draw_text(layer, results.grade, 36, WIDTH // 2, stats_y + 145, results.grade_color, bold=True)
         
         # Feedback
-        feedback = get_performance_feedback("Engineer", self.perfect_solves, len(self.puzzles))
-        draw_wrapped_text(feedback, screen, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
+        draw_wrapped_text(results.feedback, layer, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
         
         # Real-world lesson
-        lesson = get_career_lesson("Engineer")
-        draw_text(screen, "What Real Engineers Do:", 20, WIDTH // 2, stats_y + 280, 
+        draw_text(layer, "What Real Engineers Do:", 20, WIDTH // 2, stats_y + 280, 
                  ENGINEER_ACCENT, bold=True)
-        draw_wrapped_text(lesson, screen, 100, stats_y + 310, 16, TEXT_MUTED, 700)
-        
+        draw_wrapped_text(results.lesson, layer, 100, stats_y + 310, 16, TEXT_MUTED, 700)
+    
+    def draw_results(self, screen):
+        """Draw final results screen."""
+        super().draw_results(screen)
         self.back_btn.draw(screen)
@@ -7,7 +7,7 @@ sequence/tool to repair a circuit. Time and correctness affect score.
 from engine.ursina_framework import GameWorld
 import random
 try:
-    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio
+    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio, destroy
     from ursina.prefabs.first_person_controller import FirstPersonController
 except Exception:
     raise ImportError('Ursina is required (pip install ursina)')
@@ -22,13 +22,13 @@ PUZZLES = [
 
 class Engineer3DWorld(GameWorld):
     def on_start(self):
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         self.player.height = 2
 
         self.spawn(Entity(model='plane', scale=Vec3(22,1,22), color=color.gray))
         self.panel_entity = self.spawn(Entity(model='cube', scale=Vec3(4,0.6,2), position=Vec3(0,0.3,4), color=color.rgba(180,180,180,255)))
 
-        panel = Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0))
+        panel = self.spawn(Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0)))
         self.desc_text = self.spawn(Text(parent=camera.ui, text='Engineer: Approach panel to inspect problem', position=(-0.68,-0.23)))
         self.timer_text = self.spawn(Text(parent=camera.ui, text='', position=(0.62,-0.18)))
         self.score_text = self.spawn(Text(parent=camera.ui, text='Score: 0', position=(0.62,-0.24)))
@@ -139,7 +139,7 @@ class Engineer3DWorld(GameWorld):
                 p.animate_scale(0.01, duration=0.5)
             except Exception:
                 pass
-        invoke(lambda: [setattr(x, 'enabled', False) for x in probes], delay=0.7)
+        invoke(lambda: [destroy(x) for x in probes], delay=0.7)
 
     def clear_and_next(self):
         self.message_text.text = ''
@@ -8,19 +8,20 @@ import pygame
 import random
 import math
 from engine.colors import (
-    BACKGROUND, WHITE, BLACK, INFLUENCER_PRIMARY, INFLUENCER_SECONDARY,
+    WHITE, BLACK, INFLUENCER_PRIMARY, INFLUENCER_SECONDARY,
     INFLUENCER_ACCENT, SUCCESS, DANGER, WARNING, TEXT_SECONDARY, CARD_BG,
     ACCENT, TEXT_MUTED, PRIMARY
 )
 from engine.ui import (
     draw_text, draw_text_left, draw_wrapped_text, ModernButton, ParticleSystem, ScreenFlash,
-    ProgressBar
+    ProgressBar, TimeSeriesChart
 )
 from engine.backstory_ai import get_performance_feedback, get_career_lesson
+from engine.layout import DESIGN_SIZE
+from engine.world import BaseWorld, ResultsSnapshot
+from engine.core import get_render_alpha
 
-pygame.init()
-
-WIDTH, HEIGHT = 900, 600
+WIDTH, HEIGHT = DESIGN_SIZE
 
 # Content types with different timing patterns
 CONTENT_TYPES = [
@@ -85,17 +86,19 @@ class TimingBeat:
         return bar_x + segment // 2 + self.lane * segment
 
 
-class InfluencerWorld:
+class InfluencerWorld(BaseWorld):
     """
     Influencer Career Mini-Game
     Players hit timing bars to create perfect content.
     """
     
+    STATES = ("intro", "gameplay", "video_complete", "results")
+    
     def __init__(self, story_package=None):
+        super().__init__(story_package)
         self.story = story_package or {
             "intro": "Welcome to the Content Studio!\n\nAs a content creator, timing is everything.\nHit the markers at exactly the right moment to create viral content.\n\nWatch the moving indicator and press SPACE when it aligns with each target!"
         }
-        self.state = "intro"
         self.score = 0
         self.total_videos = 4
         self.current_video_index = 0
@@ -111,6 +114,7 @@ class InfluencerWorld:
         
         # Visual state
         self.indicator_pos = 0
+        self.prev_indicator_pos = 0
         self.bar_x = 100
         self.bar_width = 700
         self.bar_y = 350
@@ -132,6 +136,12 @@ class InfluencerWorld:
         self.feedback_color = WHITE
         self.hit_effects = []  # [(x, y, timer, color), ...]
         
+        # Energy and combo curves across all videos, sampled every frame
+        self.session_time = 0
+        self.performance_chart = TimeSeriesChart(650, 15, 230, 70, title="Energy / Combo")
+        self.performance_chart.add_series("energy", SUCCESS, "area", y_range=(0, 100))
+        self.performance_chart.add_series("combo", WHITE, "line")
+        
         # UI elements
         self.start_btn = ModernButton(350, 480, 200, 55, "Start Recording",
                                        INFLUENCER_PRIMARY, INFLUENCER_SECONDARY)
@@ -142,7 +152,6 @@ class InfluencerWorld:
         self.back_btn = ModernButton(350, 500, 200, 55, "Return to Hub",
                                       CARD_BG, INFLUENCER_PRIMARY)
         
-        self.clock = pygame.time.Clock()
         self.scene_manager = None
         self.generate_content()
     
@@ -177,63 +186,34 @@ class InfluencerWorld:
                 self.beats.append(TimingBeat(time_offset, lane))
             
             self.indicator_pos = 0
+            self.prev_indicator_pos = 0
             self.hit_effects = []
     
-    def run(self, scene_manager):
-        """Main game loop."""
-        self.scene_manager = scene_manager
-        screen = pygame.display.get_surface()
-        running = True
-        
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_click(event)
-                
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key(event)
-            
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+    def click_intro(self, event):
+        if self.start_btn.is_clicked(event):
+            self.state = "gameplay"
     
-    def handle_click(self, event):
-        """Handle mouse clicks."""
-        if self.state == "intro":
-            if self.start_btn.is_clicked(event):
+    def click_video_complete(self, event):
+        if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
+            if self.current_video_index < len(self.content_list) - 1:
+                self.load_video(self.current_video_index + 1)
                 self.state = "gameplay"
-        
-        elif self.state == "video_complete":
-            if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
-                if self.current_video_index < len(self.content_list) - 1:
-                    self.load_video(self.current_video_index + 1)
-                    self.state = "gameplay"
-                else:
-                    self.state = "results"
-        
-        elif self.state == "results":
-            if self.back_btn.is_clicked(event):
-                from main import enhanced_career_selection
-                self.scene_manager.change_scene(enhanced_career_selection)
-                return
+            else:
+                self.state = "results"
     
-    def handle_key(self, event):
-        """Handle keyboard input."""
-        if self.state == "gameplay":
-            if event.key == pygame.K_SPACE:
-                self.try_hit()
-            elif event.key == pygame.K_LEFT:
-                self.try_hit(lane=0)
-            elif event.key == pygame.K_DOWN:
-                self.try_hit(lane=1)
-            elif event.key == pygame.K_RIGHT:
-                self.try_hit(lane=2)
+    def click_results(self, event):
+        if self.back_btn.is_clicked(event):
+            self.scene_manager.pop()
+    
+    def key_gameplay(self, event):
+        if event.key == pygame.K_SPACE:
+            self.try_hit()
+        elif event.key == pygame.K_LEFT:
+            self.try_hit(lane=0)
+        elif event.key == pygame.K_DOWN:
+            self.try_hit(lane=1)
+        elif event.key == pygame.K_RIGHT:
+            self.try_hit(lane=2)
     
     def try_hit(self, lane=None):
         """Attempt to hit the current beat."""
@@ -321,46 +301,43 @@ class InfluencerWorld:
         # Update hit effects
         self.hit_effects = [(x, y, t - dt, c) for x, y, t, c in self.hit_effects if t > 0]
         
-        if self.state == "gameplay":
-            self.game_time += dt
-            
-            # Update indicator position (oscillates)
-            speed = self.current_content["speed"] if self.current_content else 1.0
-            self.indicator_pos = (self.game_time * speed * 200) % self.bar_width
-            
-            # Check for missed beats
-            for beat in self.beats:
-                if not beat.hit and not beat.missed:
-                    if self.game_time > beat.target_time + self.ok_window:
-                        beat.missed = True
-                        self.misses += 1
-                        self.combo = 0
-                        self.energy = max(0, self.energy - 10)
-                        
-                        x = beat.get_x_position(self.bar_x, self.bar_width)
-                        self.hit_effects.append((x, self.bar_y, 0.3, DANGER))
-            
-            # Drain energy slowly
-            self.energy = max(0, self.energy - dt * 2)
-            
-            # Check if video is complete
-            all_processed = all(b.hit or b.missed for b in self.beats)
-            if all_processed or self.energy <= 0:
-                self.state = "video_complete"
+        super().update(dt)
     
-    def draw(self, screen):
-        """Draw current state."""
-        screen.fill(BACKGROUND)
+    def update_gameplay(self, dt):
+        self.game_time += dt
         
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "video_complete":
-            self.draw_video_complete(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
+        # Update indicator position (oscillates)
+        speed = self.current_content["speed"] if self.current_content else 1.0
+        self.prev_indicator_pos = self.indicator_pos
+        self.indicator_pos = (self.game_time * speed * 200) % self.bar_width
         
+        # Check for missed beats
+        for beat in self.beats:
+            if not beat.hit and not beat.missed:
+                if self.game_time > beat.target_time + self.ok_window:
+                    beat.missed = True
+                    self.misses += 1
+                    self.combo = 0
+                    self.energy = max(0, self.energy - 10)
+                    
+                    x = beat.get_x_position(self.bar_x, self.bar_width)
+                    self.hit_effects.append((x, self.bar_y, 0.3, DANGER))
+        
+        # Drain energy slowly
+        self.energy = max(0, self.energy - dt * 2)
+        
+        self.session_time += dt
+        self.performance_chart.append("energy", self.energy, self.session_time)
+        self.performance_chart.append("combo", self.combo, self.session_time)
+        
+        # Check if video is complete
+        all_processed = all(b.hit or b.missed for b in self.beats)
+        if all_processed or self.energy <= 0:
+            self.state = "video_complete"
+    
+    def draw(self, screen):
+        """Draw current state."""
+        super().draw(screen)
         self.particles.draw(screen)
         self.flash.draw(screen)
     
@@ -465,8 +442,12 @@ class InfluencerWorld:
             if radius > 0:
                 pygame.draw.circle(screen, color, (int(x), int(y)), radius, 3)
         
-        # Draw indicator (sweeping line)
-        indicator_x = self.bar_x + int(self.indicator_pos)
+        # Draw indicator (sweeping line), interpolated between sim steps
+        indicator_pos = self.indicator_pos
+        if indicator_pos >= self.prev_indicator_pos:
+            indicator_pos = (self.prev_indicator_pos
+                             + (indicator_pos - self.prev_indicator_pos) * get_render_alpha())
+        indicator_x = self.bar_x + int(indicator_pos)
         pygame.draw.line(screen, WHITE, (indicator_x, self.bar_y - 35), 
                         (indicator_x, self.bar_y + 35), 3)
         
@@ -517,29 +498,11 @@ class InfluencerWorld:
         else:
             self.finish_btn.draw(screen)
     
-    def draw_results(self, screen):
-        """Draw final results screen."""
-        # Header
-        header_rect = pygame.Rect(0, 0, WIDTH, 100)
-        pygame.draw.rect(screen, INFLUENCER_PRIMARY, header_rect)
-        draw_text(screen, "Content Analytics!", 42, WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(screen, "Channel Performance Review", 18, WIDTH // 2, 72, TEXT_SECONDARY)
-        
-        # Stats
+    def compute_results(self):
+        """Final stats, rating and feedback for the channel."""
         total_beats = sum(c["beat_count"] for c in self.content_list)
         hit_rate = ((self.perfect_hits + self.good_hits + self.ok_hits) / total_beats * 100) if total_beats else 0
         
-        stats_y = 130
-        draw_text(screen, f"Videos Created: {len(self.content_list)}", 
-                 26, WIDTH // 2, stats_y, WHITE, bold=True)
-        draw_text(screen, f"Total Score: {self.score}", 
-                 24, WIDTH // 2, stats_y + 40, INFLUENCER_ACCENT)
-        draw_text(screen, f"Hit Rate: {hit_rate:.1f}%", 
-                 22, WIDTH // 2, stats_y + 80, TEXT_SECONDARY)
-        draw_text(screen, f"Best Combo: x{self.max_combo}", 
-                 20, WIDTH // 2, stats_y + 115, TEXT_SECONDARY)
-        
-        # Grade
         if hit_rate >= 85:
             grade, grade_color = "Viral Star!", SUCCESS
         elif hit_rate >= 70:
@@ -549,16 +512,47 @@ class InfluencerWorld:
         else:
             grade, grade_color = "Keep Practicing", DANGER
         
-        draw_text(screen, grade, 36, WIDTH // 2, stats_y + 165, grade_color, bold=True)
+        return ResultsSnapshot(
+            {"videos": len(self.content_list), "score": self.score,
+             "hit_rate": hit_rate, "max_combo": self.max_combo},
+            grade, grade_color,
+            get_performance_feedback("Influencer", self.perfect_hits + self.good_hits, total_beats),
+            get_career_lesson("Influencer"))
+    
+    def render_results(self, layer, results):
+        """Render the static results screen."""
+        stats = results.stats
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, WIDTH, 100)
+        pygame.draw.rect(layer, INFLUENCER_PRIMARY, header_rect)
+        draw_text(layer, "Content Analytics!", 42, WIDTH // 2, 35, WHITE, bold=True)
+        draw_text(layer, "Channel Performance Review", 18, WIDTH // 2, 72, TEXT_SECONDARY)
+        self.performance_chart.draw(layer)
+        
+        # Stats
+        stats_y = 130
+        draw_text(layer, f"Videos Created: {stats['videos']}", 
+                 26, WIDTH // 2, stats_y, WHITE, bold=True)
+        draw_text(layer, f"Total Score: {stats['score']}", 
+                 24, WIDTH // 2, stats_y + 40, INFLUENCER_ACCENT)
+        draw_text(layer, f"Hit Rate: {stats['hit_rate']:.1f}%", 
+                 22, WIDTH // 2, stats_y + 80, TEXT_SECONDARY)
+        draw_text(layer, f"Best Combo: x{stats['max_combo']}", 
+                 20, WIDTH // 2, stats_y + 115, TEXT_SECONDARY)
+        
+        # Grade
+        draw_text(layer, results.grade, 36, WIDTH // 2, stats_y + 165, results.grade_color, bold=True)
         
         # Feedback
-        feedback = get_performance_feedback("Influencer", self.perfect_hits + self.good_hits, total_beats)
-        draw_wrapped_text(feedback, screen, 100, stats_y + 220, 18, TEXT_SECONDARY, 700)
+        draw_wrapped_text(results.feedback, layer, 100, stats_y + 220, 18, TEXT_SECONDARY, 700)
         
         # Real-world lesson
-        lesson = get_career_lesson("Influencer")
-        draw_text(screen, "What Real Creators Do:", 20, WIDTH // 2, stats_y + 300, 
+        draw_text(layer, "What Real Creators Do:", 20, WIDTH // 2, stats_y + 300, 
                  INFLUENCER_ACCENT, bold=True)
-        draw_wrapped_text(lesson, screen, 100, stats_y + 330, 16, TEXT_MUTED, 700)
-        
+        draw_wrapped_text(results.lesson, layer, 100, stats_y + 330, 16, TEXT_MUTED, 700)
+    
+    def draw_results(self, screen):
+        """Draw final results screen."""
+        super().draw_results(screen)
         self.back_btn.draw(screen)
@@ -7,7 +7,7 @@ that will maximize engagement. Timing and approach influence score.
 from engine.ursina_framework import GameWorld
 import random
 try:
-    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio
+    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio, destroy
     from ursina.prefabs.first_person_controller import FirstPersonController
 except Exception:
     raise ImportError('Ursina is required (pip install ursina)')
@@ -23,13 +23,13 @@ POST_TYPES = [
 
 class Influencer3DWorld(GameWorld):
     def on_start(self):
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         self.player.height = 2
 
         self.spawn(Entity(model='plane', scale=Vec3(22,1,22), color=color.black))
         self.stage = self.spawn(Entity(model='cube', scale=Vec3(6,0.5,3), position=Vec3(0,0.25,4), color=color.azure))
 
-        panel = Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0))
+        panel = self.spawn(Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0)))
         self.info_text = self.spawn(Text(parent=camera.ui, text='Influencer: Step onto stage and pick a post type', position=(-0.68,-0.23)))
         self.timer_text = self.spawn(Text(parent=camera.ui, text='', position=(0.62,-0.18)))
         self.score_text = self.spawn(Text(parent=camera.ui, text='Score: 0', position=(0.62,-0.24)))
@@ -93,7 +93,7 @@ class Influencer3DWorld(GameWorld):
                 p.animate_scale(0.02, duration=0.8)
             except Exception:
                 pass
-        invoke(lambda: [setattr(x, 'enabled', False) for x in probes], delay=1.0)
+        invoke(lambda: [destroy(x) for x in probes], delay=1.0)
 
     def reset_round(self):
         self.message_text.text = 'Approach the stage to post again.'
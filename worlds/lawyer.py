@@ -7,18 +7,19 @@ Teaches: Logic, critical thinking, attention to detail.
 import pygame
 import random
 from engine.colors import (
-    BACKGROUND, WHITE, BLACK, LAWYER_PRIMARY, LAWYER_SECONDARY,
+    WHITE, BLACK, LAWYER_PRIMARY, LAWYER_SECONDARY,
     LAWYER_ACCENT, SUCCESS, DANGER, WARNING, TEXT_SECONDARY, CARD_BG,
     ACCENT, TEXT_MUTED
 )
 from engine.ui import (
-    draw_text, draw_text_left, draw_wrapped_text, ModernButton, ParticleSystem, ScreenFlash
+    draw_text, draw_text_left, draw_wrapped_text, ModernButton, ParticleSystem, ScreenFlash,
+    WidgetPool
 )
 from engine.backstory_ai import get_performance_feedback, get_career_lesson
+from engine.layout import DESIGN_SIZE
+from engine.world import BaseWorld, ResultsSnapshot
 
-pygame.init()
-
-WIDTH, HEIGHT = 900, 600
+WIDTH, HEIGHT = DESIGN_SIZE
 
 # Case scenarios with statements and contradictions
 CASE_SCENARIOS = [
@@ -126,17 +127,19 @@ class LegalCase:
         self.result = None
 
 
-class LawyerWorld:
+class LawyerWorld(BaseWorld):
     """
     Lawyer Career Mini-Game
     Players analyze witness statements to find contradictions.
     """
     
+    STATES = ("intro", "gameplay", "feedback", "results")
+    
     def __init__(self, story_package=None):
+        super().__init__(story_package)
         self.story = story_package or {
             "intro": "Welcome to the Courtroom!\n\nAs a trial lawyer, you must analyze witness statements to find contradictions.\n\nRead each statement carefully and identify which witness is lying or mistaken."
         }
-        self.state = "intro"
         self.score = 0
         self.total_cases = 5
         self.current_case_index = 0
@@ -164,9 +167,11 @@ class LawyerWorld:
                                       CARD_BG, LAWYER_PRIMARY)
         
         self.statement_buttons = []
+        self.statement_pool = WidgetPool(
+            lambda: ModernButton(80, 230, 740, 85, "", CARD_BG, LAWYER_ACCENT)
+        )
         self.generate_cases()
         
-        self.clock = pygame.time.Clock()
         self.scene_manager = None
     
     def generate_cases(self):
@@ -184,86 +189,53 @@ class LawyerWorld:
             self.time_remaining = self.time_per_case
             self.selected_statement = None
             
-            # Create statement buttons
-            self.statement_buttons = []
-            for i, stmt in enumerate(self.current_case.statements):
-                btn = ModernButton(
-                    80, 230 + i * 100, 740, 85, "",
-                    CARD_BG, LAWYER_ACCENT
-                )
-                self.statement_buttons.append(btn)
+            # Rebind pooled statement buttons (statement text is drawn separately)
+            self.statement_buttons = self.statement_pool.bind(
+                {"text": "", "x": 80, "y": 230 + i * 100}
+                for i in range(len(self.current_case.statements))
+            )
     
-    def run(self, scene_manager):
-        """Main game loop."""
-        self.scene_manager = scene_manager
-        screen = pygame.display.get_surface()
-        running = True
-        
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_click(event)
-                
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key(event)
-            
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+    def click_intro(self, event):
+        if self.start_btn.is_clicked(event):
+            self.state = "gameplay"
     
-    def handle_click(self, event):
-        """Handle mouse clicks."""
-        if self.state == "intro":
-            if self.start_btn.is_clicked(event):
+    def click_gameplay(self, event):
+        for i, btn in enumerate(self.statement_buttons):
+            if btn.is_clicked(event):
+                self.submit_answer(i)
+                break
+    
+    def click_feedback(self, event):
+        if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
+            if self.current_case_index < len(self.cases) - 1:
+                self.load_case(self.current_case_index + 1)
                 self.state = "gameplay"
-        
-        elif self.state == "gameplay":
-            for i, btn in enumerate(self.statement_buttons):
-                if btn.is_clicked(event):
-                    self.submit_answer(i)
-                    break
-        
-        elif self.state == "feedback":
-            if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
-                if self.current_case_index < len(self.cases) - 1:
-                    self.load_case(self.current_case_index + 1)
-                    self.state = "gameplay"
-                else:
-                    self.state = "results"
-        
-        elif self.state == "results":
-            if self.back_btn.is_clicked(event):
-                from main import enhanced_career_selection
-                self.scene_manager.change_scene(enhanced_career_selection)
-                return
+            else:
+                self.state = "results"
+    
+    def click_results(self, event):
+        if self.back_btn.is_clicked(event):
+            self.scene_manager.pop()
     
-    def handle_key(self, event):
-        """Handle keyboard input."""
-        if self.state == "gameplay":
-            n = len(self.current_case.statements)
-            if event.key == pygame.K_UP:
-                if self.selected_statement is None:
-                    self.selected_statement = n - 1
-                else:
-                    self.selected_statement = (self.selected_statement - 1) % n
-            elif event.key == pygame.K_DOWN:
-                if self.selected_statement is None:
-                    self.selected_statement = 0
-                else:
-                    self.selected_statement = (self.selected_statement + 1) % n
-            elif event.key == pygame.K_RETURN:
-                if self.selected_statement is not None:
-                    self.submit_answer(self.selected_statement)
-            elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3]:
-                idx = event.key - pygame.K_1
-                if idx < len(self.current_case.statements):
-                    self.submit_answer(idx)
+    def key_gameplay(self, event):
+        n = len(self.current_case.statements)
+        if event.key == pygame.K_UP:
+            if self.selected_statement is None:
+                self.selected_statement = n - 1
+            else:
+                self.selected_statement = (self.selected_statement - 1) % n
+        elif event.key == pygame.K_DOWN:
+            if self.selected_statement is None:
+                self.selected_statement = 0
+            else:
+                self.selected_statement = (self.selected_statement + 1) % n
+        elif event.key == pygame.K_RETURN:
+            if self.selected_statement is not None:
+                self.submit_answer(self.selected_statement)
+        elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3]:
+            idx = event.key - pygame.K_1
+            if idx < len(self.current_case.statements):
+                self.submit_answer(idx)
     
     def submit_answer(self, selected_index):
         """Check the selected answer."""
@@ -320,28 +292,36 @@ class LawyerWorld:
         if self.feedback_timer > 0:
             self.feedback_timer -= dt
         
-        if self.state == "gameplay":
-            self.time_remaining -= dt
-            if self.time_remaining <= 0:
-                self.streak = 0
-                self.current_case.result = "timeout"
-                self.feedback_text = "Time's Up! The judge is impatient."
-                self.feedback_timer = 2.0
-                self.state = "feedback"
+        super().update(dt)
+    
+    def enter_feedback(self):
+        # Warm the next case's text while this feedback is on screen
+        self.prerender_upcoming()
+    
+    def upcoming_text(self):
+        index = self.current_case_index + 1
+        if index >= len(self.cases):
+            return []
+        case = self.cases[index]
+        texts = [(f"Case {index + 1}/{len(self.cases)}: {case.title}", 24, WHITE, True),
+                 (case.context, 16, TEXT_SECONDARY)]
+        for stmt in case.statements:
+            texts.append((f"Witness: {stmt['witness']}", 16, LAWYER_ACCENT, True))
+            texts.append((f'"{stmt["text"]}"', 16, WHITE, False, 620))
+        return texts
+    
+    def update_gameplay(self, dt):
+        self.time_remaining -= dt
+        if self.time_remaining <= 0:
+            self.streak = 0
+            self.current_case.result = "timeout"
+            self.feedback_text = "Time's Up! The judge is impatient."
+            self.feedback_timer = 2.0
+            self.state = "feedback"
     
     def draw(self, screen):
         """Draw current state."""
-        screen.fill(BACKGROUND)
-        
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "feedback":
-            self.draw_feedback(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
-        
+        super().draw(screen)
         self.particles.draw(screen)
         self.flash.draw(screen)
     
@@ -447,26 +427,10 @@ class LawyerWorld:
         else:
             self.finish_btn.draw(screen)
     
-    def draw_results(self, screen):
-        """Draw results screen."""
-        # Header
-        header_rect = pygame.Rect(0, 0, WIDTH, 100)
-        pygame.draw.rect(screen, LAWYER_PRIMARY, header_rect)
-        draw_text(screen, "Court Adjourned!", 42, WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(screen, "Trial Results", 18, WIDTH // 2, 72, TEXT_SECONDARY)
-        
-        # Stats
+    def compute_results(self):
+        """Final stats, grade and feedback for the trial."""
         solved_count = sum(1 for c in self.cases if c.result == "correct")
         
-        stats_y = 140
-        draw_text(screen, f"Cases Won: {solved_count}/{len(self.cases)}", 
-                 28, WIDTH // 2, stats_y, WHITE, bold=True)
-        draw_text(screen, f"Total Points: {self.score}", 
-                 24, WIDTH // 2, stats_y + 45, LAWYER_ACCENT)
-        draw_text(screen, f"Best Streak: {self.streak}", 
-                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
-        
-        # Grade
         percentage = (solved_count / len(self.cases)) * 100
         if percentage >= 80:
             grade, grade_color = "A", SUCCESS
@@ -477,15 +441,44 @@ class LawyerWorld:
         else:
             grade, grade_color = "D", DANGER
         
-        draw_text(screen, f"Grade: {grade}", 48, WIDTH // 2, stats_y + 140, grade_color, bold=True)
+        return ResultsSnapshot(
+            {"solved": solved_count, "cases": len(self.cases),
+             "score": self.score, "streak": self.streak},
+            grade, grade_color,
+            get_performance_feedback("Lawyer", solved_count, len(self.cases)),
+            get_career_lesson("Lawyer"))
+    
+    def render_results(self, layer, results):
+        """Render the static results screen."""
+        stats = results.stats
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, WIDTH, 100)
+        pygame.draw.rect(layer, LAWYER_PRIMARY, header_rect)
+        draw_text(layer, "Court Adjourned!", 42, WIDTH // 2, 35, WHITE, bold=True)
+        draw_text(layer, "Trial Results", 18, WIDTH // 2, 72, TEXT_SECONDARY)
+        
+        # Stats
+        stats_y = 140
+        draw_text(layer, f"Cases Won: {stats['solved']}/{stats['cases']}", 
+                 28, WIDTH // 2, stats_y, WHITE, bold=True)
+        draw_text(layer, f"Total Points: {stats['score']}", 
+                 24, WIDTH // 2, stats_y + 45, LAWYER_ACCENT)
+        draw_text(layer, f"Best Streak: {stats['streak']}", 
+                 20, WIDTH // 2, stats_y + 85, TEXT_SECONDARY)
+        
+        # Grade
+        draw_text(layer, f"Grade: {results.grade}", 48, WIDTH // 2, stats_y + 140,
+                  results.grade_color, bold=True)
         
         # Feedback
-        feedback = get_performance_feedback("Lawyer", solved_count, len(self.cases))
-        draw_wrapped_text(feedback, screen, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
+        draw_wrapped_text(results.feedback, layer, 100, stats_y + 200, 18, TEXT_SECONDARY, 700)
         
         # Real-world lesson
-        lesson = get_career_lesson("Lawyer")
-        draw_text(screen, "What Real Lawyers Do:", 20, WIDTH // 2, stats_y + 280, LAWYER_ACCENT, bold=True)
-        draw_wrapped_text(lesson, screen, 100, stats_y + 310, 16, TEXT_MUTED, 700)
-        
+        draw_text(layer, "What Real Lawyers Do:", 20, WIDTH // 2, stats_y + 280, LAWYER_ACCENT, bold=True)
+        draw_wrapped_text(results.lesson, layer, 100, stats_y + 310, 16, TEXT_MUTED, 700)
+    
+    def draw_results(self, screen):
+        """Draw results screen."""
+        super().draw_results(screen)
         self.back_btn.draw(screen)
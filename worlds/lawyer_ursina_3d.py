@@ -8,7 +8,7 @@ use time and combo scoring, and receive particle feedback and optional sounds.
 from engine.ursina_framework import GameWorld
 import random
 try:
-    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio
+    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio, destroy
     from ursina.prefabs.first_person_controller import FirstPersonController
 except Exception:
     raise ImportError('Ursina is required (pip install ursina)')
@@ -24,7 +24,7 @@ CASE_DATA = [
 
 class Lawyer3DWorld(GameWorld):
     def on_start(self):
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         self.player.height = 2
 
         # scene
@@ -35,7 +35,7 @@ class Lawyer3DWorld(GameWorld):
         self.witness = self.spawn(Entity(model='cube', scale=Vec3(0.8,1.8,0.8), position=Vec3(0,0,4), color=color.azure))
 
         # UI panel
-        panel = Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0))
+        panel = self.spawn(Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0)))
         self.prompt_text = self.spawn(Text(parent=camera.ui, text='', position=(-0.68,-0.23), origin=(0,0), scale=1.0))
         self.timer_text = self.spawn(Text(parent=camera.ui, text='', position=(0.62,-0.18), origin=(0,0)))
         self.score_text = self.spawn(Text(parent=camera.ui, text='Score: 0', position=(0.62,-0.24), origin=(0,0)))
@@ -153,7 +153,7 @@ class Lawyer3DWorld(GameWorld):
                 p.animate_position(p.position + Vec3(random.uniform(-0.6,0.6), random.uniform(0.6,1.2), random.uniform(-0.6,0.6)), duration=0.45)
             except Exception:
                 pass
-        invoke(lambda: [setattr(x, 'enabled', False) for x in probes], delay=0.6)
+        invoke(lambda: [destroy(x) for x in probes], delay=0.6)
 
     def clear_and_next(self):
         self.message_text.text = ''
@@ -12,27 +12,32 @@ try:
 except Exception:
     raise ImportError('Ursina is required (pip install ursina)')
 
-from worlds.doctor_ursina_3d import Doctor3DWorld
-from worlds.lawyer_ursina_3d import Lawyer3DWorld
-from worlds.influencer_ursina_3d import Influencer3DWorld
-from worlds.politician_ursina_3d import Politician3DWorld
-from worlds.engineer_ursina_3d import Engineer3DWorld
+from engine import registry
+
+# Door colors for the built-in careers; plugin careers get the default
+DOOR_COLORS = {
+    'Doctor': color.azure,
+    'Lawyer': color.brown,
+    'Influencer': color.azure,
+    'Politician': color.gold,
+    'Engineer': color.light_gray,
+}
 
 
 class HubWorld(GameWorld):
     def on_start(self):
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         self.player.height = 2
 
         self.spawn(Entity(model='plane', scale=Vec3(28,1,28), color=color.rgb(30,30,40)))
 
-        # doors (simple colored cubes representing each career)
+        # doors (simple colored cubes representing each career); the 3D
+        # world module is only imported when its door is entered
+        careers = [career for career in registry.careers() if career.world_3d]
         self.doors = {
-            'Doctor': (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(-8,2,6), color=color.azure)), Doctor3DWorld),
-            'Lawyer': (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(-2,2,6), color=color.brown)), Lawyer3DWorld),
-            'Influencer': (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(4,2,6), color=color.azure)), Influencer3DWorld),
-            'Politician': (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(10,2,6), color=color.gold)), Politician3DWorld),
-            'Engineer': (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(16,2,6), color=color.light_gray)), Engineer3DWorld),
+            career.name: (self.spawn(Entity(model='cube', scale=Vec3(2,4,0.3), position=Vec3(-8 + 6 * i,2,6),
+                                            color=DOOR_COLORS.get(career.name, color.white))), career)
+            for i, career in enumerate(careers)
         }
 
         self.hint = self.spawn(Text(text='Walk to a door and press E to enter a career world', position=(-0.7,0.45)))
@@ -43,18 +48,18 @@ class HubWorld(GameWorld):
         from ursina import distance
         player_pos = self.player.position
         near = None
-        for name, (door_entity, world_cls) in self.doors.items():
+        for name, (door_entity, career) in self.doors.items():
             if (door_entity.position - player_pos).length() < 3.0:
-                near = (name, world_cls)
+                near = (name, career)
                 break
 
         if near:
-            name, world_cls = near
+            name, career = near
             self.prompt.text = f'Press E to enter: {name}'
             from ursina import held_keys
             if held_keys['e']:
                 # change world via runner
-                self.runner.change_world(world_cls)
+                self.runner.change_world(career.load_3d())
         else:
             self.prompt.text = ''
 
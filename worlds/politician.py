@@ -7,19 +7,19 @@ Teaches: Strategic thinking, communication, public relations.
 import pygame
 import random
 from engine.colors import (
-    BACKGROUND, WHITE, BLACK, POLITICIAN_PRIMARY, POLITICIAN_SECONDARY,
+    WHITE, BLACK, POLITICIAN_PRIMARY, POLITICIAN_SECONDARY,
     POLITICIAN_ACCENT, SUCCESS, DANGER, WARNING, TEXT_SECONDARY, CARD_BG,
     ACCENT, TEXT_MUTED
 )
 from engine.ui import (
     draw_text, draw_text_left, draw_wrapped_text, ModernButton, ParticleSystem, ScreenFlash,
-    ProgressBar
+    ProgressBar, WidgetPool, TimeSeriesChart
 )
 from engine.backstory_ai import get_performance_feedback, get_career_lesson
+from engine.layout import DESIGN_SIZE
+from engine.world import BaseWorld, ResultsSnapshot
 
-pygame.init()
-
-WIDTH, HEIGHT = 900, 600
+WIDTH, HEIGHT = DESIGN_SIZE
 
 # Political issues with response options
 POLITICAL_ISSUES = [
@@ -138,17 +138,19 @@ class PoliticalCrisis:
         self.outcome = None
 
 
-class PoliticianWorld:
+class PoliticianWorld(BaseWorld):
     """
     Politician Career Mini-Game
     Players manage approval rating by responding to political issues.
     """
     
+    STATES = ("intro", "gameplay", "feedback", "results")
+    
     def __init__(self, story_package=None):
+        super().__init__(story_package)
         self.story = story_package or {
             "intro": "Welcome to City Hall!\n\nAs an elected official, you must respond to various issues and crises.\nEvery decision affects your approval rating.\n\nChoose wisely - the public is watching!"
         }
-        self.state = "intro"
         self.score = 0
         self.approval = 50  # Start at 50%
         self.total_issues = 6
@@ -169,6 +171,11 @@ class PoliticianWorld:
         self.feedback_timer = 0
         self.approval_change = 0
         
+        # Approval history shown on the results screen
+        self.approval_chart = TimeSeriesChart(650, 15, 230, 70, title="Approval History")
+        self.approval_chart.add_series("approval", POLITICIAN_ACCENT, "area", y_range=(0, 100))
+        self.approval_chart.append("approval", self.approval)
+        
         # UI elements
         self.start_btn = ModernButton(350, 480, 200, 55, "Take Office",
                                        POLITICIAN_PRIMARY, POLITICIAN_SECONDARY)
@@ -180,9 +187,11 @@ class PoliticianWorld:
                                       CARD_BG, POLITICIAN_PRIMARY)
         
         self.response_buttons = []
+        self.response_pool = WidgetPool(
+            lambda: ModernButton(80, 250, 740, 60, "", CARD_BG, POLITICIAN_ACCENT)
+        )
         self.generate_issues()
         
-        self.clock = pygame.time.Clock()
         self.scene_manager = None
     
     def generate_issues(self):
@@ -200,86 +209,53 @@ class PoliticianWorld:
             self.current_issue_index = index
             self.selected_response = None
             
-            # Create response buttons
-            self.response_buttons = []
-            for i, response in enumerate(self.current_issue.responses):
-                btn = ModernButton(
-                    80, 250 + i * 70, 740, 60, "",
-                    CARD_BG, POLITICIAN_ACCENT
-                )
-                self.response_buttons.append(btn)
+            # Rebind pooled response buttons (response text is drawn separately)
+            self.response_buttons = self.response_pool.bind(
+                {"text": "", "x": 80, "y": 250 + i * 70}
+                for i in range(len(self.current_issue.responses))
+            )
     
-    def run(self, scene_manager):
-        """Main game loop."""
-        self.scene_manager = scene_manager
-        screen = pygame.display.get_surface()
-        running = True
-        
-        while running:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.handle_click(event)
-                
-                if event.type == pygame.KEYDOWN:
-                    self.handle_key(event)
-            
-            self.update(dt)
-            self.draw(screen)
-            pygame.display.update()
+    def click_intro(self, event):
+        if self.start_btn.is_clicked(event):
+            self.state = "gameplay"
     
-    def handle_click(self, event):
-        """Handle mouse clicks."""
-        if self.state == "intro":
-            if self.start_btn.is_clicked(event):
+    def click_gameplay(self, event):
+        for i, btn in enumerate(self.response_buttons):
+            if btn.is_clicked(event):
+                self.submit_response(i)
+                break
+    
+    def click_feedback(self, event):
+        if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
+            if self.current_issue_index < len(self.issues) - 1:
+                self.load_issue(self.current_issue_index + 1)
                 self.state = "gameplay"
-        
-        elif self.state == "gameplay":
-            for i, btn in enumerate(self.response_buttons):
-                if btn.is_clicked(event):
-                    self.submit_response(i)
-                    break
-        
-        elif self.state == "feedback":
-            if self.next_btn.is_clicked(event) or self.finish_btn.is_clicked(event):
-                if self.current_issue_index < len(self.issues) - 1:
-                    self.load_issue(self.current_issue_index + 1)
-                    self.state = "gameplay"
-                else:
-                    self.state = "results"
-        
-        elif self.state == "results":
-            if self.back_btn.is_clicked(event):
-                from main import enhanced_career_selection
-                self.scene_manager.change_scene(enhanced_career_selection)
-                return
+            else:
+                self.state = "results"
     
-    def handle_key(self, event):
-        """Handle keyboard input."""
-        if self.state == "gameplay":
-            n = len(self.current_issue.responses)
-            if event.key == pygame.K_UP:
-                if self.selected_response is None:
-                    self.selected_response = n - 1
-                else:
-                    self.selected_response = (self.selected_response - 1) % n
-            elif event.key == pygame.K_DOWN:
-                if self.selected_response is None:
-                    self.selected_response = 0
-                else:
-                    self.selected_response = (self.selected_response + 1) % n
-            elif event.key == pygame.K_RETURN:
-                if self.selected_response is not None:
-                    self.submit_response(self.selected_response)
-            elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
-                idx = event.key - pygame.K_1
-                if idx < len(self.current_issue.responses):
-                    self.submit_response(idx)
+    def click_results(self, event):
+        if self.back_btn.is_clicked(event):
+            self.scene_manager.pop()
+    
+    def key_gameplay(self, event):
+        n = len(self.current_issue.responses)
+        if event.key == pygame.K_UP:
+            if self.selected_response is None:
+                self.selected_response = n - 1
+            else:
+                self.selected_response = (self.selected_response - 1) % n
+        elif event.key == pygame.K_DOWN:
+            if self.selected_response is None:
+                self.selected_response = 0
+            else:
+                self.selected_response = (self.selected_response + 1) % n
+        elif event.key == pygame.K_RETURN:
+            if self.selected_response is not None:
+                self.submit_response(self.selected_response)
+        elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4]:
+            idx = event.key - pygame.K_1
+            if idx < len(self.current_issue.responses):
+                self.submit_response(idx)
     
     def submit_response(self, selected_index):
         """Process the selected response."""
@@ -295,6 +271,7 @@ class PoliticianWorld:
         change = response["approval"]
         self.approval_change = change
         self.approval = max(0, min(100, self.approval + change))
+        self.approval_chart.append("approval", self.approval)
         
         # Track decision quality
         if change > 10:
@@ -329,6 +306,21 @@ class PoliticianWorld:
         self.feedback_timer = 2.0
         self.state = "feedback"
     
+    def enter_feedback(self):
+        # Warm the next issue's text while this feedback is on screen
+        self.prerender_upcoming()
+    
+    def upcoming_text(self):
+        index = self.current_issue_index + 1
+        if index >= len(self.issues):
+            return []
+        issue = self.issues[index]
+        texts = [(f"Issue {index + 1}/{len(self.issues)}", 24, WHITE, True),
+                 (issue.headline, 22, WHITE, True),
+                 (issue.context, 16, TEXT_SECONDARY, False, 720)]
+        texts += [(response["text"], 16, WHITE, False, 700) for response in issue.responses]
+        return texts
+    
     def update(self, dt):
         """Update game state."""
         self.particles.update(dt)
@@ -336,20 +328,12 @@ class PoliticianWorld:
         
         if self.feedback_timer > 0:
             self.feedback_timer -= dt
+        
+        super().update(dt)
     
     def draw(self, screen):
         """Draw current state."""
-        screen.fill(BACKGROUND)
-        
-        if self.state == "intro":
-            self.draw_intro(screen)
-        elif self.state == "gameplay":
-            self.draw_gameplay(screen)
-        elif self.state == "feedback":
-            self.draw_feedback(screen)
-        elif self.state == "results":
-            self.draw_results(screen)
-        
+        super().draw(screen)
         self.particles.draw(screen)
         self.flash.draw(screen)
     
@@ -477,28 +461,8 @@ class PoliticianWorld:
         else:
             self.finish_btn.draw(screen)
     
-    def draw_results(self, screen):
-        """Draw final results screen."""
-        # Header
-        header_rect = pygame.Rect(0, 0, WIDTH, 100)
-        pygame.draw.rect(screen, POLITICIAN_PRIMARY, header_rect)
-        draw_text(screen, "Term Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
-        draw_text(screen, "Your Political Legacy", 18, WIDTH // 2, 72, TEXT_SECONDARY)
-        
-        # Final stats
-        stats_y = 130
-        draw_text(screen, f"Final Approval: {self.approval}%", 
-                 32, WIDTH // 2, stats_y, WHITE, bold=True)
-        draw_text(screen, f"Total Points: {self.score}", 
-                 24, WIDTH // 2, stats_y + 45, POLITICIAN_ACCENT)
-        
-        # Decision breakdown
-        draw_text(screen, f"Good Decisions: {self.good_decisions}  |  "
-                         f"Neutral: {self.neutral_decisions}  |  "
-                         f"Poor: {self.bad_decisions}", 
-                 18, WIDTH // 2, stats_y + 90, TEXT_SECONDARY)
-        
-        # Legacy rating
+    def compute_results(self):
+        """Final stats and legacy rating for the term."""
         if self.approval >= 70:
             legacy = "Beloved Leader"
             legacy_color = SUCCESS
@@ -516,13 +480,46 @@ class PoliticianWorld:
             legacy_color = DANGER
             desc = "Your decisions were widely criticized. Re-election looks unlikely."
         
-        draw_text(screen, legacy, 36, WIDTH // 2, stats_y + 145, legacy_color, bold=True)
-        draw_wrapped_text(desc, screen, 150, stats_y + 190, 18, TEXT_SECONDARY, 600)
+        return ResultsSnapshot(
+            {"approval": self.approval, "score": self.score,
+             "good": self.good_decisions, "neutral": self.neutral_decisions,
+             "bad": self.bad_decisions},
+            legacy, legacy_color, desc, get_career_lesson("Politician"))
+    
+    def render_results(self, layer, results):
+        """Render the static results screen."""
+        stats = results.stats
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, WIDTH, 100)
+        pygame.draw.rect(layer, POLITICIAN_PRIMARY, header_rect)
+        draw_text(layer, "Term Complete!", 42, WIDTH // 2, 35, WHITE, bold=True)
+        draw_text(layer, "Your Political Legacy", 18, WIDTH // 2, 72, TEXT_SECONDARY)
+        self.approval_chart.draw(layer)
+        
+        # Final stats
+        stats_y = 130
+        draw_text(layer, f"Final Approval: {stats['approval']}%", 
+                 32, WIDTH // 2, stats_y, WHITE, bold=True)
+        draw_text(layer, f"Total Points: {stats['score']}", 
+                 24, WIDTH // 2, stats_y + 45, POLITICIAN_ACCENT)
+        
+        # Decision breakdown
+        draw_text(layer, f"Good Decisions: {stats['good']}  |  "
+                         f"Neutral: {stats['neutral']}  |  "
+                         f"Poor: {stats['bad']}", 
+                 18, WIDTH // 2, stats_y + 90, TEXT_SECONDARY)
+        
+        # Legacy rating
+        draw_text(layer, results.grade, 36, WIDTH // 2, stats_y + 145, results.grade_color, bold=True)
+        draw_wrapped_text(results.feedback, layer, 150, stats_y + 190, 18, TEXT_SECONDARY, 600)
         
         # Real-world lesson
-        lesson = get_career_lesson("Politician")
-        draw_text(screen, "What Real Politicians Do:", 20, WIDTH // 2, stats_y + 270, 
+        draw_text(layer, "What Real Politicians Do:", 20, WIDTH // 2, stats_y + 270, 
                  POLITICIAN_ACCENT, bold=True)
-        draw_wrapped_text(lesson, screen, 100, stats_y + 300, 16, TEXT_MUTED, 700)
-        
+        draw_wrapped_text(results.lesson, layer, 100, stats_y + 300, 16, TEXT_MUTED, 700)
+    
+    def draw_results(self, screen):
+        """Draw final results screen."""
+        super().draw_results(screen)
         self.back_btn.draw(screen)
@@ -7,7 +7,7 @@ manage approval score with combo/time bonuses and particle feedback.
 from engine.ursina_framework import GameWorld
 import random
 try:
-    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio
+    from ursina import Entity, color, Vec3, Text, Button, invoke, camera, Audio, destroy
     from ursina.prefabs.first_person_controller import FirstPersonController
 except Exception:
     raise ImportError('Ursina is required (pip install ursina)')
@@ -23,13 +23,13 @@ POLICY_CHOICES = [
 
 class Politician3DWorld(GameWorld):
     def on_start(self):
-        self.player = FirstPersonController()
+        self.player = self.spawn(FirstPersonController())
         self.player.height = 2
 
         self.spawn(Entity(model='plane', scale=Vec3(22,1,22), color=color.gray))
         self.podium = self.spawn(Entity(model='cube', scale=Vec3(2,0.6,1), position=Vec3(0,0.3,4), color=color.gold))
 
-        panel = Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0))
+        panel = self.spawn(Entity(parent=camera.ui, model='quad', scale=Vec3(0.78,0.36,1), color=color.rgba(10,10,10,140), position=Vec3(0,-0.3,0)))
         self.info_text = self.spawn(Text(parent=camera.ui, text='Politician: Approach podium and choose a policy', position=(-0.68,-0.23)))
         self.timer_text = self.spawn(Text(parent=camera.ui, text='', position=(0.62,-0.18)))
         self.approval_text = self.spawn(Text(parent=camera.ui, text='Approval: 50', position=(0.62,-0.24)))
@@ -89,7 +89,7 @@ class Politician3DWorld(GameWorld):
                 p.animate_scale(0.01, duration=0.6)
             except Exception:
                 pass
-        invoke(lambda: [setattr(x, 'enabled', False) for x in probes], delay=0.8)
+        invoke(lambda: [destroy(x) for x in probes], delay=0.8)
 
     def reset_round(self):
         self.message_text.text = 'Choose another policy at the podium.'